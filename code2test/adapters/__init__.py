@@ -4,12 +4,35 @@ Code2Test Adapters Module
 Language and test framework adapters.
 """
 
-from code2test.adapters.python.pytest_adapter import PytestAdapter
-from code2test.adapters.javascript.jest_adapter import JestAdapter
-from code2test.adapters.java.junit_adapter import JUnitAdapter
+import importlib
+
+from code2test.adapters.base_adapter import BaseAdapter
+
+# Framework adapters are imported on first access (PEP 562) so that a run
+# only pays for the adapter it actually uses
+_LAZY_ADAPTERS = {
+    "PytestAdapter": "code2test.adapters.python.pytest_adapter",
+    "JestAdapter": "code2test.adapters.javascript.jest_adapter",
+    "JUnitAdapter": "code2test.adapters.java.junit_adapter",
+}
 
 __all__ = [
+    "BaseAdapter",
     "PytestAdapter",
     "JestAdapter",
     "JUnitAdapter",
 ]
+
+
+def __getattr__(name):
+    module_path = _LAZY_ADAPTERS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    adapter = getattr(importlib.import_module(module_path), name)
+    globals()[name] = adapter
+    return adapter
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,196 @@
+"""
+Base interface for test framework adapters.
+"""
+
+import os
+import re
+import json
+import uuid
+import asyncio
+import tempfile
+import contextlib
+import subprocess
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Iterator
+
+from code2test.core.models import TestFile
+
+if TYPE_CHECKING:
+    from code2test.core.templates import TemplateManager
+
+# orjson decodes reports several times faster than the stdlib when installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# ijson lets very large reports be streamed instead of loaded whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Reports larger than this are streamed item by item when ijson is available
+STREAM_REPORT_THRESHOLD = 16 * 1024 * 1024
+
+
+# Start of every line that contains something other than whitespace
+_INDENT_RE = re.compile(r"(?m)^(?=[^\n]*\S)")
+
+
+def indent_code(code: str, spaces: int) -> str:
+    """Indent every non-blank line of code by the given number of spaces."""
+    return _INDENT_RE.sub(" " * spaces, code)
+
+
+def iter_json_report(json_path: str, prefix: str) -> Iterator[Any]:
+    """
+    Iterate over the items of a JSON test report.
+    
+    Args:
+        json_path: Path to the JSON report
+        prefix: ijson-style path to the items, e.g. "tests.item"
+        
+    Yields:
+        Each item found under the prefix
+    """
+    if ijson is not None and os.path.getsize(json_path) > STREAM_REPORT_THRESHOLD:
+        with open(json_path, "rb") as f:
+            yield from ijson.items(f, prefix, use_float=True)
+        return
+    
+    with open(json_path, "rb") as f:
+        report = _json_loads(f.read())
+    yield from _walk_prefix(report, prefix.split("."))
+
+
+def _walk_prefix(node: Any, keys: List[str]) -> Iterator[Any]:
+    """Yield the values reached by following an ijson-style prefix."""
+    if not keys:
+        yield node
+        return
+    
+    key, rest = keys[0], keys[1:]
+    if key == "item":
+        for child in node or []:
+            yield from _walk_prefix(child, rest)
+    elif isinstance(node, dict) and key in node:
+        yield from _walk_prefix(node[key], rest)
+
+
+class BaseAdapter(ABC):
+    """Abstract base class for test framework adapters."""
+
+    def __init__(self, repo_path: str):
+        self.repo_path = Path(repo_path)
+        # Scratch directory for report files, created by the first test run
+        self._tmpdir: Optional[tempfile.TemporaryDirectory] = None
+
+    def __enter__(self) -> "BaseAdapter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def template_manager(self) -> "TemplateManager":
+        """Shared TemplateManager, imported on first use to keep Jinja2 off the startup path."""
+        from code2test.core.templates import get_template_manager
+        return get_template_manager()
+
+    def _report_path(self, suffix: str = ".json") -> str:
+        """
+        Return a fresh report path inside this adapter's scratch directory.
+
+        The file is not created; the test runner writes it and the adapter
+        removes it once parsed. The directory itself is removed on close().
+        """
+        if self._tmpdir is None:
+            self._tmpdir = tempfile.TemporaryDirectory(prefix="c2t-")
+        return os.path.join(self._tmpdir.name, f"run_{uuid.uuid4().hex}{suffix}")
+
+    @staticmethod
+    def _discard_report(report_path: str) -> None:
+        """Remove a parsed report file, if the runner wrote one."""
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(report_path)
+
+    def close(self) -> None:
+        """Remove the scratch directory holding this adapter's reports."""
+        tmpdir = getattr(self, "_tmpdir", None)
+        if tmpdir is not None:
+            tmpdir.cleanup()
+            self._tmpdir = None
+
+    def __del__(self):
+        self.close()
+
+    @abstractmethod
+    def generate_test_file_content(
+        self,
+        test_file: TestFile,
+        intent_text: str = ""
+    ) -> str:
+        """Generate test file content for the framework."""
+        pass
+
+    @abstractmethod
+    def run_tests(
+        self,
+        test_path: str,
+        timeout: int = 60
+    ) -> Dict[str, Any]:
+        """Execute tests at a single path and return results."""
+        pass
+
+    async def run_tests_async(
+        self,
+        test_path: str,
+        timeout: int = 60
+    ) -> Dict[str, Any]:
+        """
+        Execute tests at a single path without blocking the event loop.
+        
+        Adapters override this with a native asyncio subprocess run; the
+        default falls back to running `run_tests` on a worker thread.
+        """
+        return await asyncio.to_thread(self.run_tests, test_path, timeout)
+
+    async def _exec_async(self, cmd: List[str], timeout: int) -> subprocess.CompletedProcess:
+        """
+        Run a command in the repository root via asyncio.
+
+        Raises:
+            subprocess.TimeoutExpired: If the command exceeds the timeout
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(self.repo_path),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        return subprocess.CompletedProcess(
+            cmd,
+            proc.returncode,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
+
+    def _error_result(self, error_msg: str) -> Dict[str, Any]:
+        """Build a results dictionary for a run that could not complete."""
+        return {
+            "success": False,
+            "exit_code": -1,
+            "error": error_msg,
+            "tests": [],
+            "summary": {"passed": 0, "failed": 0, "skipped": 0, "total": 0},
+        }
@@ -5,25 +5,77 @@ Adapter for JUnit 5 test file generation and execution.
 """
 
 import os
+import functools
 import subprocess
 import re
 from typing import Dict, List, Any, Optional
 from pathlib import Path
-import tempfile
-import xml.etree.ElementTree as ET
+
+# lxml is a faster drop-in when available; the stdlib parser is C-accelerated too
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 
 from code2test.core.models import TestFile, TestCase, TestStatus
+from code2test.adapters.base_adapter import BaseAdapter
+
+# Child elements of <testcase> that mark it as failed
+_FAILURE_TAGS = frozenset({"failure", "error"})
+
+
+@functools.lru_cache(maxsize=4096)
+def infer_package(path_str: str) -> str:
+    """Infer java package from path."""
+    # Look for src/main/java or similar
+    parts = Path(path_str).parts
+    try:
+        if "java" in parts:
+            idx = parts.index("java")
+            return ".".join(parts[idx+1:-1])
+    except ValueError:
+        pass
+    return "com.example.generated" # Fallback
+
+
+@functools.lru_cache(maxsize=4096)
+def path_to_classname(path_str: str) -> str:
+    """Map a test file path to its fully qualified class name."""
+    # Simplistic mapping
+    path = Path(path_str)
+    name = path.stem
+    # Try to find package parts
+    # This implementation assumes the standard maven layout structure
+    parts = list(path.parent.parts)
+    if "java" in parts:
+        idx = parts.index("java")
+        package_parts = parts[idx+1:]
+        return ".".join(package_parts + [name])
+    return name
 
 
-class JUnitAdapter:
+class JUnitAdapter(BaseAdapter):
     """
     Adapter for JUnit test generation and execution.
     """
     
     def __init__(self, repo_path: str):
-        self.repo_path = Path(repo_path)
-        from code2test.core.templates import TemplateManager
-        self.template_manager = TemplateManager()
+        super().__init__(repo_path)
+        
+        # Probe the build system once rather than on every run
+        if (self.repo_path / "pom.xml").exists():
+            self._build_system = "maven"
+        elif (self.repo_path / "build.gradle").exists():
+            self._build_system = "gradle"
+        else:
+            self._build_system = None
+        
+        # Maven: target/surefire-reports/TEST-<class>.xml
+        # Gradle: build/test-results/test/TEST-<class>.xml
+        self._report_bases = [
+            self.repo_path / "target/surefire-reports",
+            self.repo_path / "build/test-results/test",
+        ]
     
     def generate_test_file_content(
         self,
@@ -40,17 +92,20 @@ class JUnitAdapter:
         component_name = Path(test_file.component_path).stem
         test_class_name = f"{component_name}Test"
         
-        tests_data = []
-        for tc in test_file.test_cases:
-            tests_data.append({
-                "name": tc.name,
-                "intent": tc.intent_text,
+        tests_data = [
+            {
+                "name": name,
+                "intent": intent,
                 "setup": "",
-                "action": tc.test_code,
+                "action": code,
                 "assertions": ""
-            })
+            }
+            for name, intent, code in (
+                (tc.name, tc.intent_text, tc.test_code) for tc in test_file.test_cases
+            )
+        ]
 
-        return self.template_manager.render(
+        return self.template_manager.render_cached(
             "java/junit/test_file.j2",
             {
                 "package_name": package_name,
@@ -62,15 +117,7 @@ class JUnitAdapter:
 
     def _infer_package(self, path_str: str) -> str:
         """Infer java package from path."""
-        # Look for src/main/java or similar
-        parts = Path(path_str).parts
-        try:
-            if "java" in parts:
-                idx = parts.index("java")
-                return ".".join(parts[idx+1:-1])
-        except ValueError:
-            pass
-        return "com.example.generated" # Fallback
+        return infer_package(path_str)
 
     def run_tests(
         self,
@@ -86,12 +133,8 @@ class JUnitAdapter:
         
         test_class = self._path_to_classname(test_path)
         
-        cmd = []
-        if (self.repo_path / "pom.xml").exists():
-            cmd = ["mvn", "test", f"-Dtest={test_class}"]
-        elif (self.repo_path / "build.gradle").exists():
-            cmd = ["./gradlew", "test", "--tests", test_class]
-        else:
+        cmd = self._build_command(test_class)
+        if not cmd:
             return self._error_result("No build system detected (pom.xml or build.gradle needed)")
 
         try:
@@ -112,58 +155,95 @@ class JUnitAdapter:
         except Exception as e:
             return self._error_result(str(e))
 
+    async def run_tests_async(
+        self,
+        test_path: str,
+        timeout: int = 60
+    ) -> Dict[str, Any]:
+        """
+        Execute JUnit tests without blocking the event loop.
+        """
+        test_class = self._path_to_classname(test_path)
+        
+        cmd = self._build_command(test_class)
+        if not cmd:
+            return self._error_result("No build system detected (pom.xml or build.gradle needed)")
+
+        try:
+            result = await self._exec_async(cmd, timeout)
+            return self._parse_results(test_class, result)
+            
+        except subprocess.TimeoutExpired:
+            return self._error_result("Timeout")
+        except Exception as e:
+            return self._error_result(str(e))
+
+    def _build_command(self, test_class: str) -> List[str]:
+        """Build the Maven/Gradle command for a test class, or [] if neither is present."""
+        if self._build_system == "maven":
+            return ["mvn", "test", f"-Dtest={test_class}"]
+        elif self._build_system == "gradle":
+            return ["./gradlew", "test", "--tests", test_class]
+        return []
+
     def _path_to_classname(self, path_str: str) -> str:
-        # Simplistic mapping
-        path = Path(path_str)
-        name = path.stem
-        # Try to find package parts
-        # This implementation assumes the standard maven layout structure
-        parts = list(path.parent.parts)
-        if "java" in parts:
-            idx = parts.index("java")
-            package_parts = parts[idx+1:]
-            return ".".join(package_parts + [name])
-        return name
+        return path_to_classname(path_str)
 
     def _parse_results(self, test_class: str, result: subprocess.CompletedProcess) -> Dict[str, Any]:
         # Try to find XML report
-        # Maven: target/surefire-reports/TEST-<class>.xml
-        # Gradle: build/test-results/test/TEST-<class>.xml
-        
         xml_path = None
-        for base in ["target/surefire-reports", "build/test-results/test"]:
-            p = self.repo_path / base / f"TEST-{test_class}.xml"
+        for base in self._report_bases:
+            p = base / f"TEST-{test_class}.xml"
             if p.exists():
                 xml_path = p
                 break
         
-        if xml_path and xml_path.exists():
+        if xml_path:
             try:
-                tree = ET.parse(xml_path)
-                root = tree.getroot()
-                
-                # <testsuite tests="X" failures="Y" skipped="Z" ...>
-                summary = {
-                    "total": int(root.attrib.get("tests", 0)),
-                    "failed": int(root.attrib.get("failures", 0)) + int(root.attrib.get("errors", 0)),
-                    "skipped": int(root.attrib.get("skipped", 0)),
-                    "passed": 0
-                }
-                summary["passed"] = summary["total"] - summary["failed"] - summary["skipped"]
-                
+                summary = None
                 tests = []
-                for tc in root.findall("testcase"):
-                    outcome = "passed"
-                    if tc.find("failure") is not None or tc.find("error") is not None:
-                        outcome = "failed"
-                    elif tc.find("skipped") is not None:
-                        outcome = "skipped"
+                
+                # Stream the report so large Surefire XMLs are never held as a full tree
+                with open(xml_path, "rb") as source:
+                    for event, elem in ET.iterparse(source, events=("start", "end")):
+                        if event == "start":
+                            # <testsuite tests="X" failures="Y" skipped="Z" ...>
+                            if summary is None and elem.tag == "testsuite":
+                                summary = {
+                                    "total": int(elem.attrib.get("tests", 0)),
+                                    "failed": int(elem.attrib.get("failures", 0)) + int(elem.attrib.get("errors", 0)),
+                                    "skipped": int(elem.attrib.get("skipped", 0)),
+                                    "passed": 0
+                                }
+                                summary["passed"] = summary["total"] - summary["failed"] - summary["skipped"]
+                            continue
                         
-                    tests.append({
-                        "nodeid": tc.attrib.get("name"),
-                        "outcome": outcome,
-                        "duration": float(tc.attrib.get("time", 0))
-                    })
+                        if elem.tag != "testcase":
+                            continue
+                        
+                        # One scan over the (usually 0-2) children; failures win over skips
+                        outcome = "passed"
+                        for child in elem:
+                            if child.tag in _FAILURE_TAGS:
+                                outcome = "failed"
+                                break
+                            if child.tag == "skipped":
+                                outcome = "skipped"
+                            
+                        tests.append({
+                            "nodeid": elem.attrib.get("name"),
+                            "outcome": outcome,
+                            "duration": float(elem.attrib.get("time", 0))
+                        })
+                        
+                        # Free the finished testcase (and, with lxml, its processed siblings)
+                        elem.clear()
+                        if hasattr(elem, "getprevious"):
+                            while elem.getprevious() is not None:
+                                del elem.getparent()[0]
+                
+                if summary is None:
+                    summary = {"passed": 0, "failed": 0, "skipped": 0, "total": 0}
                 
                 return {
                     "success": summary["failed"] == 0,
@@ -185,17 +265,3 @@ class JUnitAdapter:
             "stdout": result.stdout,
             "stderr": result.stderr
         }
-
-    def _error_result(self, msg: str) -> Dict[str, Any]:
-         return {
-            "success": False,
-            "exit_code": -1,
-            "error": msg,
-            "tests": [],
-            "summary": {"passed": 0, "failed": 0, "skipped": 0, "total": 0},
-        }
-
-    def _indent(self, code: str, spaces: int) -> str:
-        indent = " " * spaces
-        lines = code.split("\n")
-        return "\n".join(indent + line if line.strip() else line for line in lines)
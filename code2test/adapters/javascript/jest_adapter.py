@@ -5,13 +5,13 @@ Adapter for Jest test file generation and execution.
 """
 
 import os
+import functools
 import subprocess
-import json
-import tempfile
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 from code2test.core.models import TestFile, TestCase, TestStatus
+from code2test.adapters.base_adapter import BaseAdapter, iter_json_report
 
 
 # Default Jest imports
@@ -22,15 +22,33 @@ DEFAULT_IMPORTS = [
 ]
 
 
-class JestAdapter:
+@functools.lru_cache(maxsize=4096)
+def generate_import_statement(component_path: str) -> Optional[str]:
+    """
+    Generate a namespace import for a JavaScript/TypeScript source file.
+    """
+    if not component_path:
+        return None
+        
+    path = Path(component_path)
+    
+    # Determine relative path from test file (assuming tests parallel src)
+    # This is a simplification; handling imports in JS is complex
+    # For now, return a placeholder or simple require/import
+    file_name = path.stem
+    # Assuming we are in a 'tests' dir and importing from 'src'
+    # import { Module } from '../src/path/to/module';
+    
+    return f"import * as {file_name} from '../{component_path}';" # Optimized guess
+
+
+class JestAdapter(BaseAdapter):
     """
     Adapter for Jest test generation and execution.
     """
     
     def __init__(self, repo_path: str):
-        self.repo_path = Path(repo_path)
-        from code2test.core.templates import TemplateManager
-        self.template_manager = TemplateManager()
+        super().__init__(repo_path)
     
     def generate_test_file_content(
         self,
@@ -52,16 +70,17 @@ class JestAdapter:
         # Prepare context
         component_name = Path(test_file.component_path).stem
         
-        tests_data = []
-        for tc in test_file.test_cases:
-            tests_data.append({
-                "intent": tc.intent_text,
+        tests_data = [
+            {
+                "intent": intent,
                 "setup": "",
-                "action": tc.test_code,
+                "action": code,
                 "assertions": ""
-            })
+            }
+            for intent, code in ((tc.intent_text, tc.test_code) for tc in test_file.test_cases)
+        ]
 
-        return self.template_manager.render(
+        return self.template_manager.render_cached(
             "javascript/jest/test_file.j2",
             {
                 "component_name": component_name,
@@ -75,19 +94,7 @@ class JestAdapter:
         """
         Generate import statement for the component under test.
         """
-        if not component_path:
-            return None
-            
-        path = Path(component_path)
-        
-        # Determine relative path from test file (assuming tests parallel src)
-        # This is a simplification; handling imports in JS is complex
-        # For now, return a placeholder or simple require/import
-        file_name = path.stem
-        # Assuming we are in a 'tests' dir and importing from 'src'
-        # import { Module } from '../src/path/to/module';
-        
-        return f"import * as {file_name} from '../{component_path}';" # Optimized guess
+        return generate_import_statement(component_path)
     
     def run_tests(
         self,
@@ -99,21 +106,11 @@ class JestAdapter:
         """
         full_path = self.repo_path / test_path
         
-        # Create temp file for JSON results
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json_path = f.name
+        json_path = self._report_path()
             
         try:
-            # Command: npx jest <file> --json --outputFile=<json_path>
-            cmd = [
-                "npx", "jest",
-                str(full_path),
-                "--json",
-                f"--outputFile={json_path}"
-            ]
-            
             result = subprocess.run(
-                cmd,
+                self._build_command(full_path, json_path),
                 cwd=str(self.repo_path),
                 capture_output=True,
                 text=True,
@@ -126,9 +123,36 @@ class JestAdapter:
             return self._error_result(f"Timeout after {timeout} seconds")
         except Exception as e:
              return self._error_result(str(e))
-        finally:
-            if os.path.exists(json_path):
-                os.unlink(json_path)
+
+    async def run_tests_async(
+        self,
+        test_path: str,
+        timeout: int = 60
+    ) -> Dict[str, Any]:
+        """
+        Execute Jest without blocking the event loop.
+        """
+        full_path = self.repo_path / test_path
+        
+        json_path = self._report_path()
+            
+        try:
+            result = await self._exec_async(self._build_command(full_path, json_path), timeout)
+            return self._parse_result(json_path, result, timeout)
+            
+        except subprocess.TimeoutExpired:
+            return self._error_result(f"Timeout after {timeout} seconds")
+        except Exception as e:
+             return self._error_result(str(e))
+
+    def _build_command(self, full_path: Path, json_path: str) -> List[str]:
+        # Command: npx jest <file> --json --outputFile=<json_path>
+        return [
+            "npx", "jest",
+            str(full_path),
+            "--json",
+            f"--outputFile={json_path}"
+        ]
 
     def _parse_result(self, json_path: str, result: subprocess.CompletedProcess, timeout: int) -> Dict[str, Any]:
         tests_results = []
@@ -136,32 +160,31 @@ class JestAdapter:
 
         if os.path.exists(json_path):
             try:
-                with open(json_path) as f:
-                    report = json.load(f)
-                
                 # Jest JSON format extraction
                 # report['testResults'][0]['assertionResults']
-                for suite in report.get("testResults", []):
-                    for assertion in suite.get("assertionResults", []):
-                        status = assertion.get("status") # passed, failed, pending
-                        title = assertion.get("title")
+                assertions = iter_json_report(json_path, "testResults.item.assertionResults.item")
+                for assertion in assertions:
+                    status = assertion.get("status") # passed, failed, pending
+                    title = assertion.get("title")
+                    
+                    summary["total"] += 1
+                    if status == "passed":
+                        summary["passed"] += 1
+                    elif status == "failed":
+                        summary["failed"] += 1
+                    elif status == "pending": # skipped
+                        summary["skipped"] += 1
                         
-                        summary["total"] += 1
-                        if status == "passed":
-                            summary["passed"] += 1
-                        elif status == "failed":
-                            summary["failed"] += 1
-                        elif status == "pending": # skipped
-                            summary["skipped"] += 1
-                            
-                        tests_results.append({
-                            "nodeid": title,
-                            "outcome": status,
-                            "duration": 0, # Could extract if needed
-                            "call": {}
-                        })
+                    tests_results.append({
+                        "nodeid": title,
+                        "outcome": status,
+                        "duration": 0, # Could extract if needed
+                        "call": {}
+                    })
             except Exception:
                 pass
+            finally:
+                self._discard_report(json_path)
 
         return {
             "success": result.returncode == 0,
@@ -172,20 +195,6 @@ class JestAdapter:
             "stderr": result.stderr,
         }
 
-    def _error_result(self, error_msg: str) -> Dict[str, Any]:
-        return {
-            "success": False,
-            "exit_code": -1,
-            "error": error_msg,
-            "tests": [],
-            "summary": {"passed": 0, "failed": 0, "skipped": 0, "total": 0},
-        }
-
     def generate_mock(self, name: str, mock_code: str) -> str:
         """Generate a Jest mock."""
         return f"const {name} = jest.fn({mock_code});"
-
-    def _indent(self, code: str, spaces: int) -> str:
-        indent = " " * spaces
-        lines = code.split("\n")
-        return "\n".join(indent + line if line.strip() else line for line in lines)
@@ -4,14 +4,18 @@ Code2Test Pytest Adapter
 Adapter for pytest test file generation and execution.
 """
 
+import io
 import os
+import sys
+import functools
+import contextlib
+import collections
 import subprocess
-import json
-import tempfile
-from typing import Dict, List, Any, Optional
-from pathlib import Path
+from typing import Deque, Dict, List, Any, Optional
+from pathlib import Path, PurePosixPath
 
 from code2test.core.models import TestFile, TestCase, TestStatus
+from code2test.adapters.base_adapter import BaseAdapter, indent_code, iter_json_report
 
 
 # Default pytest imports
@@ -20,7 +24,91 @@ DEFAULT_IMPORTS = [
 ]
 
 
-class PytestAdapter:
+@functools.lru_cache(maxsize=4096)
+def generate_import_statement(component_path: str) -> Optional[str]:
+    """
+    Generate a star import for a Python source file.
+    
+    Args:
+        component_path: Path to the source file
+        
+    Returns:
+        Import statement or None
+    """
+    if not component_path:
+        return None
+    
+    # Convert file path to module path
+    # e.g., src/auth/token.py -> src.auth.token
+    # Normalise Windows separators so one POSIX split handles both
+    path = PurePosixPath(component_path.replace("\\", "/"))
+    
+    if path.suffix != ".py":
+        return None
+    
+    # Drop the .py extension and any empty, "." or root components
+    module_path = ".".join(
+        part for part in path.with_suffix("").parts if part not in ("", ".", "/")
+    )
+    
+    return f"from {module_path} import *"
+
+
+class _ResultCollector:
+    """pytest plugin recording one entry per test, shaped like pytest-json-report's."""
+    
+    def __init__(self):
+        self.tests: List[Dict[str, Any]] = []
+    
+    def pytest_runtest_logreport(self, report) -> None:
+        # A test's outcome comes from its call phase, or from the setup
+        # phase when that errored or skipped it before it ran
+        if report.when != "call" and (report.when != "setup" or report.passed):
+            return
+        
+        outcome = report.outcome
+        if hasattr(report, "wasxfail"):
+            outcome = "xfailed" if report.skipped else "xpassed"
+        elif report.when == "setup" and report.failed:
+            outcome = "error"
+        
+        self.tests.append({
+            "nodeid": report.nodeid,
+            "outcome": outcome,
+            "duration": report.duration,
+            "call": {
+                "outcome": report.outcome,
+                "longrepr": str(report.longrepr) if report.longrepr else "",
+            },
+        })
+
+
+class _TailBuffer(io.TextIOBase):
+    """Text stream that keeps only the last `limit` characters written to it."""
+    
+    encoding = "utf-8"
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self._chunks: Deque[str] = collections.deque()
+        self._size = 0
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, text: str) -> int:
+        self._chunks.append(text)
+        self._size += len(text)
+        # Drop whole chunks that lie entirely before the tail
+        while self._size - len(self._chunks[0]) >= self.limit:
+            self._size -= len(self._chunks.popleft())
+        return len(text)
+    
+    def getvalue(self) -> str:
+        return "".join(self._chunks)[-self.limit:]
+
+
+class PytestAdapter(BaseAdapter):
     """
     Adapter for pytest test generation and execution.
     
@@ -37,9 +125,7 @@ class PytestAdapter:
         Args:
             repo_path: Path to repository root
         """
-        self.repo_path = Path(repo_path)
-        from code2test.core.templates import TemplateManager
-        self.template_manager = TemplateManager()
+        super().__init__(repo_path)
     
     def generate_test_file_content(
         self,
@@ -80,22 +166,25 @@ class PytestAdapter:
         # We will modify the template or the context to handle the existing 'test_code' string.
         # Actually, let's adapt the context to match the template we wrote.
         
-        tests_data = []
-        for tc in test_file.test_cases:
-            # If test_code is already full python code, we might struggle to split it.
-            # But the Template expects setup/action/assertions blocks.
-            # If we don't have them split, we can just pass everything in 'action' for now.
-            tests_data.append({
-                "name": tc.name,
-                "intent": tc.intent_text,
+        # If test_code is already full python code, we might struggle to split it.
+        # But the Template expects setup/action/assertions blocks.
+        # If we don't have them split, we can just pass everything in 'action' for now.
+        tests_data = [
+            {
+                "name": name,
+                "intent": intent,
                 "fixtures": [], # We don't track per-test fixtures yet in this model explicitly
                 "setup": "",
-                "action": tc.test_code, # Passing full code body here
+                "action": code, # Passing full code body here
                 "assertions": ""
-            })
+            }
+            for name, intent, code in (
+                (tc.name, tc.intent_text, tc.test_code) for tc in test_file.test_cases
+            )
+        ]
 
         # Render
-        return self.template_manager.render(
+        return self.template_manager.render_cached(
             "python/pytest/test_file.j2",
             {
                 "component_path": test_file.component_path,
@@ -119,31 +208,13 @@ class PytestAdapter:
         Returns:
             Import statement or None
         """
-        if not component_path:
-            return None
-        
-        # Convert file path to module path
-        # e.g., src/auth/token.py -> src.auth.token
-        path = Path(component_path)
-        
-        if path.suffix != ".py":
-            return None
-        
-        # Remove .py extension
-        module_path = str(path.with_suffix(""))
-        
-        # Replace path separators with dots
-        module_path = module_path.replace(os.sep, ".").replace("/", ".")
-        
-        # Remove leading dots
-        module_path = module_path.lstrip(".")
-        
-        return f"from {module_path} import *"
+        return generate_import_statement(component_path)
     
     def run_tests(
         self,
         test_path: str,
-        timeout: int = 60
+        timeout: int = 60,
+        jobs: int = 1
     ) -> Dict[str, Any]:
         """
         Execute pytest and return results.
@@ -151,83 +222,170 @@ class PytestAdapter:
         Args:
             test_path: Path to test file or directory
             timeout: Timeout in seconds
+            jobs: Number of pytest-xdist worker processes; above 1 the
+                  tests are distributed by file (requires pytest-xdist)
             
         Returns:
             Dictionary with test results
         """
         full_path = self.repo_path / test_path
         
-        # Create temp file for JSON results
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json_path = f.name
+        json_path = self._report_path()
         
         try:
             result = subprocess.run(
-                [
-                    "python", "-m", "pytest",
-                    str(full_path),
-                    "-v",
-                    "--tb=short",
-                    f"--json-report",
-                    f"--json-report-file={json_path}",
-                ],
+                self._build_command(full_path, json_path, jobs),
                 cwd=str(self.repo_path),
                 capture_output=True,
                 text=True,
                 timeout=timeout,
             )
+            return self._parse_result(json_path, result)
             
-            # Parse JSON report
-            tests_results = []
-            summary = {"passed": 0, "failed": 0, "skipped": 0, "total": 0}
+        except subprocess.TimeoutExpired:
+            return self._error_result(f"Timeout after {timeout} seconds")
+    
+    def run_tests_in_process(
+        self,
+        test_path: str,
+        output_tail: Optional[int] = None,
+        jobs: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Execute pytest inside the current interpreter and return results.
+        
+        Skips the interpreter startup, plugin loading and JSON report of a
+        subprocess run. The tests share this interpreter and its imported
+        modules, the working directory and sys.path are changed while they
+        run, and no timeout is applied, so this is opt-in (verify
+        --in-process) and run_tests stays the default.
+        
+        Args:
+            test_path: Path to test file or directory
+            output_tail: Keep only this many trailing characters of stdout
+                         and stderr instead of the full output
+            jobs: Number of pytest-xdist worker processes; above 1 the
+                  tests are distributed by file (requires pytest-xdist)
             
-            if os.path.exists(json_path):
-                try:
-                    with open(json_path) as f:
-                        report = json.load(f)
-                    
-                    for test in report.get("tests", []):
-                        outcome = test.get("outcome", "")
-                        summary["total"] += 1
-                        
-                        if outcome == "passed":
-                            summary["passed"] += 1
-                        elif outcome == "failed":
-                            summary["failed"] += 1
-                        elif outcome == "skipped":
-                            summary["skipped"] += 1
-                        
-                        tests_results.append({
-                            "nodeid": test.get("nodeid", ""),
-                            "outcome": outcome,
-                            "duration": test.get("duration", 0),
-                            "call": test.get("call", {}),
-                        })
-                        
-                except Exception as e:
-                    pass  # Fall back to basic parsing
+        Returns:
+            Dictionary with test results, as returned by run_tests
+        """
+        import pytest
+        
+        full_path = self.repo_path / test_path
+        collector = _ResultCollector()
+        if output_tail is None:
+            stdout, stderr = io.StringIO(), io.StringIO()
+        else:
+            stdout, stderr = _TailBuffer(output_tail), _TailBuffer(output_tail)
+        
+        args = [str(full_path), "-v", "--tb=short", "-p", "no:cacheprovider"]
+        if jobs > 1:
+            args += ["-n", str(jobs), "--dist=loadfile"]
+        
+        # Mirror `python -m pytest` run from the repository root
+        cwd = os.getcwd()
+        sys.path.insert(0, str(self.repo_path))
+        os.chdir(self.repo_path)
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                exit_code = int(pytest.main(args, plugins=[collector]))
+        finally:
+            os.chdir(cwd)
+            sys.path.remove(str(self.repo_path))
+        
+        summary = {"passed": 0, "failed": 0, "skipped": 0, "total": len(collector.tests)}
+        for test in collector.tests:
+            if test["outcome"] in summary:
+                summary[test["outcome"]] += 1
+        
+        return {
+            "success": exit_code == 0,
+            "exit_code": exit_code,
+            "tests": collector.tests,
+            "summary": summary,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+    
+    async def run_tests_async(
+        self,
+        test_path: str,
+        timeout: int = 60
+    ) -> Dict[str, Any]:
+        """
+        Execute pytest without blocking the event loop.
+        
+        Args:
+            test_path: Path to test file or directory
+            timeout: Timeout in seconds
             
-            return {
-                "success": result.returncode == 0,
-                "exit_code": result.returncode,
-                "tests": tests_results,
-                "summary": summary,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-            }
+        Returns:
+            Dictionary with test results
+        """
+        full_path = self.repo_path / test_path
+        
+        json_path = self._report_path()
+        
+        try:
+            result = await self._exec_async(self._build_command(full_path, json_path), timeout)
+            return self._parse_result(json_path, result)
             
         except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "exit_code": -1,
-                "error": f"Timeout after {timeout} seconds",
-                "tests": [],
-                "summary": {"passed": 0, "failed": 0, "skipped": 0, "total": 0},
-            }
-            
-        finally:
-            if os.path.exists(json_path):
-                os.unlink(json_path)
+            return self._error_result(f"Timeout after {timeout} seconds")
+    
+    def _build_command(self, full_path: Path, json_path: str, jobs: int = 1) -> List[str]:
+        """Build the pytest command line for a test path."""
+        cmd = [
+            "python", "-m", "pytest",
+            str(full_path),
+            "-v",
+            "--tb=short",
+            f"--json-report",
+            f"--json-report-file={json_path}",
+        ]
+        if jobs > 1:
+            cmd += ["-n", str(jobs), "--dist=loadfile"]
+        return cmd
+    
+    def _parse_result(self, json_path: str, result: subprocess.CompletedProcess) -> Dict[str, Any]:
+        """Parse the pytest JSON report into a results dictionary."""
+        tests_results = []
+        summary = {"passed": 0, "failed": 0, "skipped": 0, "total": 0}
+        
+        if os.path.exists(json_path):
+            try:
+                for test in iter_json_report(json_path, "tests.item"):
+                    outcome = test.get("outcome", "")
+                    summary["total"] += 1
+                    
+                    if outcome == "passed":
+                        summary["passed"] += 1
+                    elif outcome == "failed":
+                        summary["failed"] += 1
+                    elif outcome == "skipped":
+                        summary["skipped"] += 1
+                    
+                    tests_results.append({
+                        "nodeid": test.get("nodeid", ""),
+                        "outcome": outcome,
+                        "duration": test.get("duration", 0),
+                        "call": test.get("call", {}),
+                    })
+                    
+            except Exception as e:
+                pass  # Fall back to basic parsing
+            finally:
+                self._discard_report(json_path)
+        
+        return {
+            "success": result.returncode == 0,
+            "exit_code": result.returncode,
+            "tests": tests_results,
+            "summary": summary,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+        }
     
     def generate_fixture(
         self,
@@ -249,7 +407,7 @@ class PytestAdapter:
         return f'''@pytest.fixture(scope="{scope}")
 def {name}():
     """Fixture for {name}."""
-{self._indent(setup_code, 4)}'''
+{indent_code(setup_code, 4)}'''
     
     def generate_parametrized_test(
         self,
@@ -271,7 +429,7 @@ def {name}():
         if not parameters:
             return f'''def {test_name}():
     """Test with no parameters."""
-{self._indent(test_body, 4)}'''
+{indent_code(test_body, 4)}'''
         
         # Build parameter string
         param_names = list(parameters[0].keys())
@@ -283,10 +441,4 @@ def {name}():
         return f'''@pytest.mark.parametrize("{param_str}", [{values_str}])
 def {test_name}({param_str}):
     """Parametrized test for {test_name}."""
-{self._indent(test_body, 4)}'''
-    
-    def _indent(self, code: str, spaces: int) -> str:
-        """Indent code by specified number of spaces."""
-        indent = " " * spaces
-        lines = code.split("\n")
-        return "\n".join(indent + line if line.strip() else line for line in lines)
+{indent_code(test_body, 4)}'''
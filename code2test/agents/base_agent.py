@@ -0,0 +1,208 @@
+"""
+Code2Test Agent Base
+
+Shared plumbing for the LLM-powered agents.
+"""
+
+import asyncio
+import functools
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pydantic_ai import Agent
+
+# tiktoken gives exact token budgets when installed; otherwise fall back to characters
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Default number of LLM requests in flight at once (matches init's max_concurrency)
+DEFAULT_MAX_CONCURRENCY = 5
+
+# Tokenizer used to size prompt excerpts
+TOKENIZER_MODEL = "gpt-4o-mini"
+
+# Average characters per token, used when no tokenizer is available
+CHARS_PER_TOKEN = 10 / 3
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding() -> Optional[Any]:
+    """Load the tokenizer once; None if tiktoken or its encoding is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(TOKENIZER_MODEL)
+    except Exception:
+        # Unknown model name or encoding download failed
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def truncate_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut text down to at most max_tokens tokens.
+    
+    The same source excerpt is sent in the intent, test and diagnosis
+    prompts of a component, so results are cached.
+    
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+        
+    Returns:
+        Text prefix within the budget
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:int(max_tokens * CHARS_PER_TOKEN)]
+    
+    # Every token covers at least one character, so short text always fits
+    if len(text) <= max_tokens:
+        return text
+    token_ids = encoding.encode(text, disallowed_special=())
+    if len(token_ids) <= max_tokens:
+        return text
+    return encoding.decode(token_ids[:max_tokens])
+
+
+@functools.lru_cache(maxsize=None)
+def get_agent(model: str, system_prompt: str, output_type: Optional[Any] = None) -> Agent:
+    """
+    Get the pydantic-ai agent for a model, system prompt and output type.
+    
+    Agents hold no per-run state, so one instance per configuration is
+    shared by every agent object and component in the process. Connection
+    reuse needs no extra setup: pydantic-ai providers draw their httpx
+    client from a process-wide cache, so keep-alive TLS connections are
+    pooled across all agents of a provider.
+    
+    Args:
+        model: LLM model identifier, e.g. "openai:gpt-4o-mini"
+        system_prompt: System prompt for the agent
+        output_type: Structured output model, or None for plain text
+        
+    Returns:
+        Cached Agent instance
+    """
+    if output_type is None:
+        return Agent(model, system_prompt=system_prompt)
+    return Agent(model, system_prompt=system_prompt, output_type=output_type)
+
+
+async def gather_bounded(
+    func: Callable[..., Awaitable[Any]],
+    calls: Iterable[Sequence[Any]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[Any]:
+    """
+    Await func over many argument tuples with a bounded number in flight.
+    
+    LLM calls are pure network wait, so running them concurrently turns
+    N round trips into roughly N / max_concurrency. The calls are spread
+    over max_concurrency workers rather than one coroutine per call, so
+    large runs don't park thousands of coroutines on a semaphore.
+    
+    Args:
+        func: Coroutine function to call
+        calls: Positional argument tuples, one per call
+        max_concurrency: Maximum number of calls awaiting at once
+        
+    Returns:
+        Results in input order; a call that raised yields its exception
+    """
+    calls = list(calls)
+    results: List[Any] = [None] * len(calls)
+    queue: "asyncio.Queue[Tuple[int, Sequence[Any]]]" = asyncio.Queue()
+    for item in enumerate(calls):
+        queue.put_nowait(item)
+    
+    async def worker() -> None:
+        # Every call is queued up front, so an empty queue means we're done
+        while not queue.empty():
+            index, args = queue.get_nowait()
+            try:
+                results[index] = await func(*args)
+            except Exception as e:
+                results[index] = e
+    
+    await asyncio.gather(*[worker() for _ in range(min(max_concurrency, len(calls)))])
+    return results
+
+
+async def stream_bounded(
+    func: Callable[..., Awaitable[Any]],
+    calls: Iterable[Sequence[Any]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Like gather_bounded, but yield each result as soon as it is ready.
+    
+    Callers can show the first result after the fastest call rather than
+    the slowest one.
+    
+    Args:
+        func: Coroutine function to call
+        calls: Positional argument tuples, one per call
+        max_concurrency: Maximum number of calls awaiting at once
+        
+    Yields:
+        (index, result) pairs in completion order, where index is the
+        position of the call in calls; a call that raised yields its exception
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def run_one(index: int, args: Sequence[Any]) -> Tuple[int, Any]:
+        async with semaphore:
+            try:
+                return index, await func(*args)
+            except Exception as e:
+                return index, e
+    
+    tasks = [asyncio.ensure_future(run_one(i, args)) for i, args in enumerate(calls)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Consumer stopped early: don't leave calls running in the background
+        for task in tasks:
+            task.cancel()
+
+
+class InFlightRequests:
+    """
+    Coalesces concurrent identical LLM requests into a single call.
+    
+    Overloads, DTOs and repeated failure outputs in a batch often render
+    byte-identical prompts; the first caller makes the request and every
+    other caller with the same key awaits its result.
+    """
+    
+    def __init__(self):
+        self._pending: Dict[str, "asyncio.Future[Any]"] = {}
+        # Number of calls served by another caller's request
+        self.shared = 0
+    
+    async def run(self, key: str, request: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run request unless one with the same key is already in flight.
+        
+        Args:
+            key: Identifies the request, e.g. its llm_cache_key
+            request: Coroutine function performing the call
+            
+        Returns:
+            The result of the (possibly shared) request
+        """
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.shared += 1
+            # Shield so one waiter being cancelled doesn't cancel the others
+            return await asyncio.shield(pending)
+        
+        task = asyncio.ensure_future(request())
+        self._pending[key] = task
+        try:
+            return await task
+        finally:
+            del self._pending[key]
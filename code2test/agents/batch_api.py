@@ -0,0 +1,191 @@
+"""
+Code2Test Batch API
+
+Helpers for submitting LLM requests through the OpenAI Batch API.
+
+Batch jobs are priced at half the synchronous rate and run server-side
+within a 24h window, which suits non-interactive runs over many components.
+"""
+
+import json
+import functools
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+# Batch API endpoint used for every request line
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+# Default location of the per-batch manifests, relative to the working directory
+DEFAULT_BATCH_DIR = Path(".code2test") / "batches"
+
+
+def openai_model_name(model: str) -> str:
+    """
+    Strip the pydantic-ai provider prefix from an OpenAI model name.
+    
+    Args:
+        model: Model identifier, e.g. "openai:gpt-4o-mini"
+    
+    Returns:
+        Bare OpenAI model name
+    
+    Raises:
+        ValueError: If the model is not served by OpenAI
+    """
+    provider, _, name = model.rpartition(":")
+    if provider not in ("", "openai"):
+        raise ValueError(f"Batch mode requires an OpenAI model, got '{model}'")
+    return name
+
+
+def build_batch_line(
+    custom_id: str,
+    model: str,
+    system_prompt: str,
+    prompt: str,
+    output_type: type,
+) -> Dict[str, Any]:
+    """
+    Build one request line of a batch input file.
+    
+    Args:
+        custom_id: Identifier echoed back with the result
+        model: Model identifier
+        system_prompt: System prompt of the agent
+        prompt: User prompt
+        output_type: Pydantic model the response must conform to
+    
+    Returns:
+        Request dictionary ready to be serialised as a JSONL line
+    """
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": {
+            "model": openai_model_name(model),
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            "response_format": response_format(output_type),
+        },
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def response_format(output_type: type) -> Dict[str, Any]:
+    """
+    Structured-output response_format for a pydantic model.
+    
+    Generating a JSON schema walks the whole model, so it is done once per
+    output type rather than once per request line.
+    
+    Args:
+        output_type: Pydantic model the response must conform to
+    
+    Returns:
+        response_format dictionary (shared; do not mutate)
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": output_type.__name__,
+            "schema": output_type.model_json_schema(),
+        },
+    }
+
+
+async def submit_batch(lines: List[Dict[str, Any]]) -> str:
+    """
+    Upload request lines and start a batch job.
+    
+    Args:
+        lines: Request dictionaries from build_batch_line
+    
+    Returns:
+        Batch ID
+    """
+    from openai import AsyncOpenAI
+    
+    client = AsyncOpenAI()
+    payload = "\n".join(json.dumps(line) for line in lines).encode()
+    input_file = await client.files.create(file=("batch.jsonl", payload), purpose="batch")
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window="24h",
+    )
+    return batch.id
+
+
+async def fetch_batch(batch_id: str) -> Tuple[str, Optional[Dict[str, str]]]:
+    """
+    Check a batch job and download its results once it has completed.
+    
+    Args:
+        batch_id: Batch ID from submit_batch
+    
+    Returns:
+        (status, outputs) where outputs maps custom_id to the raw response
+        content, or is None while the batch is not completed
+    """
+    from openai import AsyncOpenAI
+    
+    client = AsyncOpenAI()
+    batch = await client.batches.retrieve(batch_id)
+    if batch.status != "completed" or not batch.output_file_id:
+        return batch.status, None
+    
+    content = await client.files.content(batch.output_file_id)
+    outputs: Dict[str, str] = {}
+    for line in content.text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if response.get("status_code") != 200:
+            continue
+        choices = response.get("body", {}).get("choices", [])
+        if choices:
+            outputs[record["custom_id"]] = choices[0]["message"]["content"]
+    
+    return batch.status, outputs
+
+
+def parse_output(content: str, output_type: type) -> Optional[BaseModel]:
+    """Parse a batch response into the agent's output model, or None if invalid."""
+    try:
+        return output_type.model_validate_json(content)
+    except ValueError:
+        return None
+
+
+def save_manifest(batch_dir: Path, batch_id: str, manifest: Dict[str, Any]) -> Path:
+    """
+    Save what is needed to turn a batch's results back into models.
+    
+    Args:
+        batch_dir: Directory holding batch manifests
+        batch_id: Batch ID
+        manifest: JSON-serialisable data keyed by custom_id
+    
+    Returns:
+        Path of the manifest file
+    """
+    batch_dir = Path(batch_dir)
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    path = batch_dir / f"{batch_id}.json"
+    path.write_text(json.dumps(manifest, default=str))
+    return path
+
+
+def load_manifest(batch_dir: Path, batch_id: str) -> Optional[Dict[str, Any]]:
+    """Load a manifest written by save_manifest, or None if it is missing."""
+    path = Path(batch_dir) / f"{batch_id}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
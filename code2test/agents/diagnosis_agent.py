@@ -5,9 +5,9 @@ LLM-powered agent for analyzing test failures and determining root cause.
 """
 
 import logging
-from typing import Dict, Any, Optional
+import re
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 
-from pydantic_ai import Agent
 from pydantic import BaseModel
 
 from code2test.core.models import (
@@ -16,9 +16,74 @@ from code2test.core.models import (
     Diagnosis,
     DiagnosisCause,
 )
+from code2test.storage.llm_cache import LLMCache, llm_cache_key
+from code2test.storage.semantic_cache import SemanticCache
+from code2test.agents.base_agent import (
+    DEFAULT_MAX_CONCURRENCY,
+    InFlightRequests,
+    gather_bounded,
+    get_agent,
+    stream_bounded,
+    truncate_tokens,
+)
 
 logger = logging.getLogger(__name__)
 
+# Token budget for the source excerpt in the prompt
+SOURCE_TOKEN_BUDGET = 600
+
+# Fast-tier confidence below which a diagnosis is re-run on the strong model
+DEFAULT_ESCALATE_THRESHOLD = 0.7
+
+# Character budgets for test output in the prompt and in stored diagnoses
+FAILURE_OUTPUT_BUDGET = 1200
+STACK_TRACE_BUDGET = 500
+
+# Expected/actual patterns in assertion output, tried in order: an earlier
+# pattern wins wherever it appears in the output, so a pytest assertion is
+# preferred over an Expected/Got line printed before it
+_ASSERTION_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        # pytest AssertionError
+        r"assert\s+(.+?)\s*==\s*(.+)",
+        # Expected vs Got
+        r"Expected:\s*(.+?)[\n\r]+\s*Got:\s*(.+)",
+        r"expected:\s*(.+?)[\n\r]+\s*actual:\s*(.+)",
+    )
+)
+
+
+# CLI panel for a diagnosis; the borders are fixed, so they are built once
+_PANEL_TEMPLATE = "\n".join((
+    f"╭─ Diagnosis ─{'─' * 50}╮",
+    "│ {explanation}",
+    "│",
+    "│ Likely cause: {cause} ({confidence:.0%})",
+    f"╰─{'─' * 62}╯",
+))
+
+def compress_log(text: str, budget: int = FAILURE_OUTPUT_BUDGET) -> str:
+    """
+    Shorten test output to a character budget, keeping mostly the end.
+    
+    Runners print banners and warnings first and the assertion and
+    traceback last, so a quarter of the budget goes to the head, the
+    rest to the tail, and the middle is elided.
+    
+    Args:
+        text: Raw test output
+        budget: Maximum number of characters kept
+        
+    Returns:
+        The text itself if it fits, otherwise head, elision marker and tail
+    """
+    if len(text) <= budget:
+        return text
+    head = budget // 4
+    tail = budget - head
+    return f"{text[:head]}\n...[{len(text) - budget} chars elided]...\n{text[-tail:]}"
+
 
 class DiagnosisResult(BaseModel):
     """Result from failure diagnosis."""
@@ -28,6 +93,9 @@ class DiagnosisResult(BaseModel):
     suggested_fix: Optional[str] = None
 
 
+# Static guidance lives entirely in the system prompt. The user prompt puts
+# per-component data (source, intent) before per-test data, so failures of
+# the same component share the longest possible cacheable prefix.
 DIAGNOSIS_SYSTEM_PROMPT = """You are an expert debugger and test analyst.
 Your task is to analyze test failures and determine the root cause.
 
@@ -41,22 +109,31 @@ Analyze the failure carefully:
 - Compare the actual behavior with the expected behavior
 - Consider if the intent description matches the code's purpose
 
-Provide a clear confidence score (0.0-1.0) for your diagnosis."""
+Determine the root cause:
+1. Is the TEST wrongly implementing the intent?
+2. Is the CODE buggy and not matching the intent?
+3. Is the INTENT incorrectly describing what the code does?
+
+Provide your diagnosis with:
+- cause: TEST_WRONG, CODE_BUG, or INTENT_WRONG
+- confidence: a clear confidence score (0.0-1.0)
+- explanation: Why you believe this is the cause
+- suggested_fix: How to fix the issue (optional)"""
 
 
 DIAGNOSIS_PROMPT_TEMPLATE = """Analyze this test failure:
 
-**Test Name:** {test_name}
-**Test Code:**
+**Component Under Test:**
 ```python
-{test_code}
+{source_code}
 ```
 
 **Stated Intent:** {intent}
 
-**Component Under Test:**
+**Test Name:** {test_name}
+**Test Code:**
 ```python
-{source_code}
+{test_code}
 ```
 
 **Failure Output:**
@@ -65,18 +142,10 @@ DIAGNOSIS_PROMPT_TEMPLATE = """Analyze this test failure:
 ```
 
 **Expected:** {expected}
-**Actual:** {actual}
+**Actual:** {actual}"""
 
-Determine the root cause:
-1. Is the TEST wrongly implementing the intent?
-2. Is the CODE buggy and not matching the intent?
-3. Is the INTENT incorrectly describing what the code does?
-
-Provide your diagnosis with:
-- cause: TEST_WRONG, CODE_BUG, or INTENT_WRONG
-- confidence: 0.0-1.0
-- explanation: Why you believe this is the cause
-- suggested_fix: How to fix the issue (optional)"""
+# Rendered with str.format: its C parser outruns string.Template and Jinja here
+_render_diagnosis_prompt = DIAGNOSIS_PROMPT_TEMPLATE.format
 
 
 class DiagnosisAgent:
@@ -86,25 +155,31 @@ class DiagnosisAgent:
     Analyzes why tests fail and categorizes the root cause.
     """
     
-    def __init__(self, model: str = "openai:gpt-4o-mini"):
+    def __init__(
+        self,
+        model: str = "openai:gpt-4o-mini",
+        cache: Optional[LLMCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        strong_model: Optional[str] = None,
+        escalate_threshold: float = DEFAULT_ESCALATE_THRESHOLD
+    ):
         """
         Initialize diagnosis agent.
         
         Args:
-            model: LLM model to use
+            model: LLM model to use (the fast tier when strong_model is set)
+            cache: Optional on-disk cache of LLM outputs
+            semantic_cache: Optional cache serving near-duplicate prompts
+            strong_model: Optional stronger model that re-diagnoses failures
+                          the fast model is unsure about or blames on the code
+            escalate_threshold: Fast-tier confidence below which to escalate
         """
         self.model = model
-        self._agent = None
-    
-    def _get_agent(self) -> Agent:
-        """Get or create the pydantic-ai agent."""
-        if self._agent is None:
-            self._agent = Agent(
-                self.model,
-                system_prompt=DIAGNOSIS_SYSTEM_PROMPT,
-                result_type=DiagnosisResult,
-            )
-        return self._agent
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        self.strong_model = strong_model if strong_model != model else None
+        self.escalate_threshold = escalate_threshold
+        self._inflight = InFlightRequests()
     
     async def diagnose_failure(
         self,
@@ -125,22 +200,82 @@ class DiagnosisAgent:
         Returns:
             Diagnosis with cause, confidence, and suggested fix
         """
+        prompt = self.build_prompt(test_case, failure_output, component, intent)
+        return await self._diagnose_from_prompt(test_case, failure_output, component, prompt)
+    
+    def build_prompt(
+        self,
+        test_case: TestCase,
+        failure_output: str,
+        component: Dict[str, Any],
+        intent: Intent
+    ) -> str:
+        """
+        Format the diagnosis prompt for a failing test.
+        
+        Args:
+            test_case: The failing test case
+            failure_output: stdout/stderr from test execution
+            component: The component under test
+            intent: The inferred intent
+            
+        Returns:
+            User prompt for the LLM
+        """
         # Parse expected/actual from failure output
         expected, actual = self._parse_assertion_error(failure_output)
         
-        prompt = DIAGNOSIS_PROMPT_TEMPLATE.format(
+        return _render_diagnosis_prompt(
             test_name=test_case.name,
             test_code=test_case.test_code,
             intent=intent.intent_text,
-            source_code=component.get("source_code", "")[:2000],
-            failure_output=failure_output[:1000],  # Limit size
+            source_code=truncate_tokens(component.get("source_code", ""), SOURCE_TOKEN_BUDGET),
+            failure_output=compress_log(failure_output),
             expected=expected or "Unknown",
             actual=actual or "Unknown",
         )
+    
+    def build_prompts(self, failures: List[Tuple[TestCase, str, Dict[str, Any], Intent]]) -> List[str]:
+        """
+        Format the prompts for many failures in one synchronous pass.
         
+        Args:
+            failures: (test_case, failure_output, component, intent) tuples
+            
+        Returns:
+            User prompts in the same order as failures
+        """
+        return [self.build_prompt(*failure) for failure in failures]
+    
+    def _prompted_calls(
+        self,
+        failures: List[Tuple[TestCase, str, Dict[str, Any], Intent]]
+    ) -> List[Tuple[TestCase, str, Dict[str, Any], str]]:
+        """Swap each failure's intent for its prebuilt prompt."""
+        prompts = self.build_prompts(failures)
+        return [
+            (test_case, failure_output, component, prompt)
+            for (test_case, failure_output, component, _), prompt in zip(failures, prompts)
+        ]
+    
+    async def _diagnose_from_prompt(
+        self,
+        test_case: TestCase,
+        failure_output: str,
+        component: Dict[str, Any],
+        prompt: str
+    ) -> Diagnosis:
+        """Diagnose a failing test whose prompt has already been built."""
         try:
-            agent = self._get_agent()
-            result = await agent.run(prompt)
+            source_code = component.get("source_code", "")
+            output = await self._ask(self.model, prompt, source_code)
+            
+            # Cascade: a CODE_BUG verdict is reported to the user as a bug in
+            # their code, so it always gets a second opinion
+            if self.strong_model and (
+                output.confidence < self.escalate_threshold or output.cause == "CODE_BUG"
+            ):
+                output = await self._ask(self.strong_model, prompt, source_code)
             
             # Map string cause to enum
             cause_map = {
@@ -148,15 +283,15 @@ class DiagnosisAgent:
                 "CODE_BUG": DiagnosisCause.CODE_BUG,
                 "INTENT_WRONG": DiagnosisCause.INTENT_WRONG,
             }
-            cause = cause_map.get(result.data.cause, DiagnosisCause.TEST_WRONG)
+            cause = cause_map.get(output.cause, DiagnosisCause.TEST_WRONG)
             
             return Diagnosis(
                 test_name=test_case.name,
                 cause=cause,
-                confidence=result.data.confidence,
-                explanation=result.data.explanation,
-                suggested_fix=result.data.suggested_fix,
-                stack_trace=failure_output[:500] if failure_output else None,
+                confidence=output.confidence,
+                explanation=output.explanation,
+                suggested_fix=output.suggested_fix,
+                stack_trace=compress_log(failure_output, STACK_TRACE_BUDGET) if failure_output else None,
             )
             
         except Exception as e:
@@ -168,9 +303,76 @@ class DiagnosisAgent:
                 confidence=0.5,
                 explanation=f"Unable to diagnose: {str(e)}",
                 suggested_fix=None,
-                stack_trace=failure_output[:500] if failure_output else None,
+                stack_trace=compress_log(failure_output, STACK_TRACE_BUDGET) if failure_output else None,
             )
     
+    async def _ask(self, model: str, prompt: str, source_code: str) -> DiagnosisResult:
+        """Get a diagnosis from one model, serving it from the caches when possible."""
+        cache_key = llm_cache_key(model, DIAGNOSIS_SYSTEM_PROMPT, prompt, DiagnosisResult, source_code)
+        output = self.cache.get(cache_key, DiagnosisResult) if self.cache else None
+        
+        if output is None and self.semantic_cache:
+            output = self.semantic_cache.get(self._namespace(model), prompt, DiagnosisResult)
+        
+        if output is None:
+            output = await self._inflight.run(
+                cache_key, lambda: self._request(model, prompt, cache_key)
+            )
+        return output
+    
+    def _namespace(self, model: str) -> str:
+        """Semantic cache namespace for a model and this output type."""
+        return llm_cache_key(model, DIAGNOSIS_SYSTEM_PROMPT, "", DiagnosisResult)
+    
+    async def _request(self, model: str, prompt: str, cache_key: str) -> DiagnosisResult:
+        """Send one prompt to a model and store the output in the caches."""
+        agent = get_agent(model, DIAGNOSIS_SYSTEM_PROMPT, DiagnosisResult)
+        result = await agent.run(prompt)
+        output = result.output
+        if self.cache:
+            self.cache.set(cache_key, output)
+        if self.semantic_cache:
+            self.semantic_cache.set(self._namespace(model), prompt, output)
+        return output
+    
+    async def diagnose_failures_batch(
+        self,
+        failures: List[Tuple[TestCase, str, Dict[str, Any], Intent]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[Diagnosis]:
+        """
+        Diagnose many test failures concurrently.
+        
+        Args:
+            failures: (test_case, failure_output, component, intent) tuples
+            max_concurrency: Maximum LLM requests in flight
+            
+        Returns:
+            Diagnoses in the same order as failures
+        """
+        calls = self._prompted_calls(failures)
+        
+        shared_before = self._inflight.shared
+        diagnoses = await gather_bounded(self._diagnose_from_prompt, calls, max_concurrency)
+        shared = self._inflight.shared - shared_before
+        if shared:
+            logger.info(f"Deduplicated {shared}/{len(failures)} identical diagnosis prompts")
+        return diagnoses
+    
+    def stream_diagnoses(
+        self,
+        failures: List[Tuple[TestCase, str, Dict[str, Any], Intent]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> AsyncIterator[Tuple[int, Diagnosis]]:
+        """
+        Diagnose failures concurrently, yielding each diagnosis as it arrives.
+        
+        Yields:
+            (index into failures, Diagnosis) pairs in completion order
+        """
+        calls = self._prompted_calls(failures)
+        return stream_bounded(self._diagnose_from_prompt, calls, max_concurrency)
+    
     def _parse_assertion_error(self, output: str) -> tuple[Optional[str], Optional[str]]:
         """
         Parse expected and actual values from assertion error.
@@ -181,19 +383,8 @@ class DiagnosisAgent:
         Returns:
             Tuple of (expected, actual) or (None, None)
         """
-        import re
-        
-        # Common patterns
-        patterns = [
-            # pytest AssertionError
-            r"assert\s+(.+?)\s*==\s*(.+)",
-            # Expected vs Got
-            r"Expected:\s*(.+?)[\n\r]+\s*Got:\s*(.+)",
-            r"expected:\s*(.+?)[\n\r]+\s*actual:\s*(.+)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, output, re.IGNORECASE)
+        for pattern in _ASSERTION_PATTERNS:
+            match = pattern.search(output)
             if match:
                 return match.group(1).strip(), match.group(2).strip()
         
@@ -209,18 +400,8 @@ class DiagnosisAgent:
         Returns:
             Formatted string for display
         """
-        cause_labels = {
-            DiagnosisCause.TEST_WRONG: "Test incorrectly implements intent",
-            DiagnosisCause.CODE_BUG: "Potential bug in source code",
-            DiagnosisCause.INTENT_WRONG: "Intent doesn't match code behavior",
-        }
-        
-        lines = [
-            f"╭─ Diagnosis ─{'─' * 50}╮",
-            f"│ {diagnosis.explanation[:60]}",
-            f"│",
-            f"│ Likely cause: {diagnosis.cause.value} ({diagnosis.confidence:.0%})",
-            f"╰─{'─' * 62}╯",
-        ]
-        
-        return "\n".join(lines)
+        return _PANEL_TEMPLATE.format(
+            explanation=diagnosis.explanation[:60],
+            cause=diagnosis.cause.value,
+            confidence=diagnosis.confidence,
+        )
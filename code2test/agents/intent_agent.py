@@ -6,15 +6,38 @@ LLM-powered agent for intent inference when static analysis signals are weak.
 
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 
 from pydantic_ai import Agent
 from pydantic import BaseModel
 
 from code2test.core.models import Intent, IntentEvidence
+from code2test.storage.llm_cache import LLMCache, llm_cache_key
+from code2test.storage.semantic_cache import SemanticCache
+from code2test.agents.batch_api import (
+    DEFAULT_BATCH_DIR,
+    build_batch_line,
+    fetch_batch,
+    load_manifest,
+    parse_output,
+    save_manifest,
+    submit_batch,
+)
+from code2test.agents.base_agent import (
+    DEFAULT_MAX_CONCURRENCY,
+    InFlightRequests,
+    gather_bounded,
+    get_agent,
+    stream_bounded,
+    truncate_tokens,
+)
 
 logger = logging.getLogger(__name__)
 
+# Token budget for the source excerpt in the prompt
+SOURCE_TOKEN_BUDGET = 600
+
 
 class IntentInferenceResult(BaseModel):
     """Result from LLM intent inference."""
@@ -24,6 +47,9 @@ class IntentInferenceResult(BaseModel):
     unclear_aspects: List[str] = []
 
 
+# Static guidance lives entirely in the system prompt and the user prompt
+# carries only per-component data, so the shared prefix stays byte-identical
+# across calls and can be served from provider-side prompt caches.
 INTENT_SYSTEM_PROMPT = """You are an expert code analyst specializing in understanding code behavior.
 Your task is to infer the intended behavior of code components based on:
 - Source code
@@ -33,7 +59,16 @@ Your task is to infer the intended behavior of code components based on:
 
 Be specific about what the code SHOULD do, not just what it currently does.
 Focus on the behavioral contract - inputs, outputs, side effects, and error handling.
-If the intent is unclear, list the unclear aspects that need clarification."""
+If the intent is unclear, list the unclear aspects that need clarification.
+
+For each component you are given, use all available signals to describe:
+1. The primary purpose of this component
+2. Expected inputs and their constraints
+3. Expected outputs and return values
+4. Any side effects or state changes
+5. Error conditions that should be handled
+
+Provide your analysis as a clear, concise intent statement."""
 
 
 INTENT_USER_PROMPT_TEMPLATE = """Analyze this code component and infer its intended behavior:
@@ -59,16 +94,9 @@ INTENT_USER_PROMPT_TEMPLATE = """Analyze this code component and infer its inten
 {call_sites}
 
 **Dependencies:**
-{dependencies}
-
-Based on all available signals, describe:
-1. The primary purpose of this component
-2. Expected inputs and their constraints
-3. Expected outputs and return values
-4. Any side effects or state changes
-5. Error conditions that should be handled
+{dependencies}"""
 
-Provide your analysis as a clear, concise intent statement."""
+_render_intent_prompt = INTENT_USER_PROMPT_TEMPLATE.format
 
 
 class IntentAgent:
@@ -78,24 +106,30 @@ class IntentAgent:
     Used when static analysis cannot determine intent with high confidence.
     """
     
-    def __init__(self, model: str = "openai:gpt-4o-mini"):
+    def __init__(
+        self,
+        model: str = "openai:gpt-4o-mini",
+        cache: Optional[LLMCache] = None,
+        semantic_cache: Optional[SemanticCache] = None
+    ):
         """
         Initialize intent agent.
         
         Args:
             model: LLM model to use for inference
+            cache: Optional on-disk cache of LLM outputs
+            semantic_cache: Optional cache serving near-duplicate prompts
         """
         self.model = model
+        self.cache = cache
+        self.semantic_cache = semantic_cache
         self._agent = None
+        self._inflight = InFlightRequests()
     
     def _get_agent(self) -> Agent:
-        """Get or create the pydantic-ai agent."""
+        """Get the shared pydantic-ai agent for this model."""
         if self._agent is None:
-            self._agent = Agent(
-                self.model,
-                system_prompt=INTENT_SYSTEM_PROMPT,
-                output_type=IntentInferenceResult,
-            )
+            self._agent = get_agent(self.model, INTENT_SYSTEM_PROMPT, IntentInferenceResult)
         return self._agent
     
     async def infer_intent(
@@ -113,73 +147,273 @@ class IntentAgent:
         Returns:
             Inferred Intent with confidence score
         """
+        return await self._infer_from_prompt(component, self.build_prompt(component, context))
+    
+    async def _infer_from_prompt(self, component: Dict[str, Any], prompt: str) -> Intent:
+        """Infer intent for a component whose prompt has already been built."""
+        try:
+            cache_key = llm_cache_key(
+                self.model,
+                INTENT_SYSTEM_PROMPT,
+                prompt,
+                IntentInferenceResult,
+                component.get("source_code", ""),
+            )
+            output = self.cache.get(cache_key, IntentInferenceResult) if self.cache else None
+            
+            if output is None and self.semantic_cache:
+                output = self.semantic_cache.get(self._namespace(), prompt, IntentInferenceResult)
+            
+            if output is None:
+                output = await self._inflight.run(cache_key, lambda: self._request(prompt, cache_key))
+            
+            return self._build_intent(component, output)
+            
+        except Exception as e:
+            logger.error(f"Intent inference failed: {e}")
+            return self._fallback_intent(component)
+    
+    def _namespace(self) -> str:
+        """Semantic cache namespace for this model and output type."""
+        return llm_cache_key(self.model, INTENT_SYSTEM_PROMPT, "", IntentInferenceResult)
+    
+    async def _request(self, prompt: str, cache_key: str) -> IntentInferenceResult:
+        """Send one prompt to the LLM and store the output in the caches."""
+        agent = self._get_agent()
+        
+        # Simple retry loop for 429s
+        max_retries = 3
+        backoff = 2.0
+        for attempt in range(max_retries):
+            try:
+                result = await agent.run(prompt)
+                break 
+            except Exception as e:
+                # Check for rate limit
+                is_rate_limit = "429" in str(e)
+                if hasattr(e, "status_code") and e.status_code == 429:
+                    is_rate_limit = True
+
+                if is_rate_limit and attempt < max_retries - 1:
+                    wait = backoff * (2 ** attempt)
+                    logger.warning(f"Rate limited (429), retrying in {wait}s...")
+                    await asyncio.sleep(wait)
+                else:
+                    raise e
+        
+        output = result.output
+        if self.cache:
+            self.cache.set(cache_key, output)
+        if self.semantic_cache:
+            self.semantic_cache.set(self._namespace(), prompt, output)
+        return output
+    
+    def build_prompt(
+        self,
+        component: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Format the intent inference prompt for a component.
+        
+        Args:
+            component: Component data from AST analysis
+            context: Additional context (dependencies, callers, etc.)
+            
+        Returns:
+            User prompt for the LLM
+        """
         if context is None:
             context = {}
         
-        # Format prompt
-        prompt = INTENT_USER_PROMPT_TEMPLATE.format(
+        return _render_intent_prompt(
             name=component.get("name", "unknown"),
             component_type=component.get("type", "function"),
             file_path=component.get("file_path", ""),
             signature=component.get("signature", ""),
             language=component.get("language", "python"),
-            source_code=component.get("source_code", "")[:2000],  # Limit size
+            source_code=truncate_tokens(component.get("source_code", ""), SOURCE_TOKEN_BUDGET),
             docstring=component.get("docstring", "None provided"),
             call_sites=", ".join(component.get("called_by", [])[:5]) or "None",
             dependencies=", ".join(context.get("dependencies", [])[:5]) or "None",
         )
+    
+    def build_prompts(
+        self,
+        components: List[Dict[str, Any]],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> List[str]:
+        """
+        Format the prompts for many components in one synchronous pass.
         
-        try:
-            agent = self._get_agent()
+        Batch methods build every prompt up front so the concurrent phase
+        only awaits LLM I/O instead of interleaving string work with it.
+        
+        Args:
+            components: Component data from AST analysis
+            contexts: Optional per-component context, aligned with components
             
-            # Simple retry loop for 429s
-            max_retries = 3
-            backoff = 2.0
-            for attempt in range(max_retries):
-                try:
-                    result = await agent.run(prompt)
-                    break 
-                except Exception as e:
-                    # Check for rate limit
-                    is_rate_limit = "429" in str(e)
-                    if hasattr(e, "status_code") and e.status_code == 429:
-                        is_rate_limit = True
-
-                    if is_rate_limit and attempt < max_retries - 1:
-                        wait = backoff * (2 ** attempt)
-                        logger.warning(f"Rate limited (429), retrying in {wait}s...")
-                        await asyncio.sleep(wait)
-                    else:
-                        raise e
+        Returns:
+            User prompts in the same order as components
+        """
+        if contexts is None:
+            contexts = [None] * len(components)
+        return [self.build_prompt(c, ctx) for c, ctx in zip(components, contexts)]
+    
+    def _build_intent(self, component: Dict[str, Any], output: IntentInferenceResult) -> Intent:
+        """Build an Intent from the LLM output for a component."""
+        signature = component.get("signature")
+        evidence = IntentEvidence(
+            docstring=component.get("docstring"),
+            signature=signature,
+            type_hints=signature if signature and "->" in signature else None,
+            naming_signals=[],
+            call_sites=(component.get("called_by") or [])[:5],
+            dependency_intents=[],
+        )
+        
+        return Intent(
+            component_id=component.get("id", component.get("name", "unknown")),
+            component_path=component.get("file_path", ""),
+            intent_text=output.intent_text,
+            confidence=output.confidence,
+            evidence=evidence,
+        )
+    
+    def _fallback_intent(self, component: Dict[str, Any]) -> Intent:
+        """Low-confidence intent used when inference fails."""
+        return Intent(
+            component_id=component.get("id", component.get("name", "unknown")),
+            component_path=component.get("file_path", ""),
+            intent_text=f"Function '{component.get('name', 'unknown')}' - intent unclear",
+            confidence=0.3,
+            evidence=IntentEvidence(),
+        )
+    
+    async def submit_batch(
+        self,
+        components: Dict[str, Dict[str, Any]],
+        batch_dir: Path = DEFAULT_BATCH_DIR
+    ) -> str:
+        """
+        Submit intent inference for many components as one OpenAI batch job.
+        
+        Batch jobs cost half as much as synchronous calls and finish within
+        24 hours; use collect_batch to turn the results into intents.
+        
+        Args:
+            components: Component data keyed by component ID
+            batch_dir: Directory for the manifest used by collect_batch
             
-            # Build evidence
-            evidence = IntentEvidence(
-                docstring=component.get("docstring"),
-                signature=component.get("signature"),
-                type_hints=component.get("signature") if "->" in component.get("signature", "") else None,
-                naming_signals=[],
-                call_sites=component.get("called_by", [])[:5],
-                dependency_intents=[],
-            )
+        Returns:
+            Batch ID
+        """
+        lines = []
+        manifest = {}
+        for index, (comp_id, component) in enumerate(components.items()):
+            custom_id = f"c{index}"
+            context = {"dependencies": component.get("dependencies", [])}
+            lines.append(build_batch_line(
+                custom_id,
+                self.model,
+                INTENT_SYSTEM_PROMPT,
+                self.build_prompt(component, context),
+                IntentInferenceResult,
+            ))
+            # Keep only the fields _build_intent reads
+            manifest[custom_id] = {
+                "id": component.get("id", comp_id),
+                "name": component.get("name"),
+                "file_path": component.get("file_path", ""),
+                "docstring": component.get("docstring"),
+                "signature": component.get("signature"),
+                "called_by": component.get("called_by", []),
+            }
+        
+        batch_id = await submit_batch(lines)
+        save_manifest(batch_dir, batch_id, manifest)
+        logger.info(f"Submitted intent batch {batch_id} with {len(lines)} requests")
+        return batch_id
+    
+    async def collect_batch(
+        self,
+        batch_id: str,
+        batch_dir: Path = DEFAULT_BATCH_DIR
+    ) -> Tuple[str, Optional[List[Intent]]]:
+        """
+        Fetch the results of a batch submitted with submit_batch.
+        
+        Args:
+            batch_id: Batch ID
+            batch_dir: Directory holding the batch manifest
             
-            return Intent(
-                component_id=component.get("id", component.get("name", "unknown")),
-                component_path=component.get("file_path", ""),
-                intent_text=result.output.intent_text,
-                confidence=result.output.confidence,
-                evidence=evidence,
-            )
+        Returns:
+            (status, intents); intents is None until the batch has completed
+        """
+        manifest = load_manifest(batch_dir, batch_id)
+        if manifest is None:
+            raise ValueError(f"No manifest found for batch {batch_id} in {batch_dir}")
+        
+        status, outputs = await fetch_batch(batch_id)
+        if outputs is None:
+            return status, None
+        
+        intents = []
+        for custom_id, component in manifest.items():
+            output = None
+            if custom_id in outputs:
+                output = parse_output(outputs[custom_id], IntentInferenceResult)
+            if output is None:
+                intents.append(self._fallback_intent(component))
+            else:
+                intents.append(self._build_intent(component, output))
+        
+        return status, intents
+    
+    async def infer_intents_batch(
+        self,
+        components: List[Dict[str, Any]],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[Intent]:
+        """
+        Infer intents for many components concurrently.
+        
+        Args:
+            components: Component data from AST analysis
+            contexts: Optional per-component context, aligned with components
+            max_concurrency: Maximum LLM requests in flight
             
-        except Exception as e:
-            logger.error(f"Intent inference failed: {e}")
-            # Return low-confidence fallback
-            return Intent(
-                component_id=component.get("id", component.get("name", "unknown")),
-                component_path=component.get("file_path", ""),
-                intent_text=f"Function '{component.get('name', 'unknown')}' - intent unclear",
-                confidence=0.3,
-                evidence=IntentEvidence(),
-            )
+        Returns:
+            Intents in the same order as components
+        """
+        prompts = self.build_prompts(components, contexts)
+        
+        shared_before = self._inflight.shared
+        intents = await gather_bounded(
+            self._infer_from_prompt,
+            zip(components, prompts),
+            max_concurrency,
+        )
+        shared = self._inflight.shared - shared_before
+        if shared:
+            logger.info(f"Deduplicated {shared}/{len(components)} identical intent prompts")
+        return intents
+    
+    def stream_intents(
+        self,
+        components: List[Dict[str, Any]],
+        contexts: Optional[List[Optional[Dict[str, Any]]]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> AsyncIterator[Tuple[int, Intent]]:
+        """
+        Infer intents concurrently, yielding each one as it arrives.
+        
+        Yields:
+            (index into components, Intent) pairs in completion order
+        """
+        prompts = self.build_prompts(components, contexts)
+        return stream_bounded(self._infer_from_prompt, zip(components, prompts), max_concurrency)
     
     def get_clarification_prompt(
         self,
@@ -6,8 +6,9 @@ LLM-powered agent for generating tests from inferred intents.
 
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from datetime import datetime
+from pathlib import PurePosixPath
 
 from pydantic_ai import Agent
 from pydantic import BaseModel, Field
@@ -19,9 +20,24 @@ from code2test.core.models import (
     TestStatus,
     TestFramework,
 )
+from code2test.storage.llm_cache import LLMCache, llm_cache_key
+from code2test.agents.base_agent import (
+    DEFAULT_MAX_CONCURRENCY,
+    InFlightRequests,
+    gather_bounded,
+    get_agent,
+    stream_bounded,
+    truncate_tokens,
+)
 
 logger = logging.getLogger(__name__)
 
+# Directory generated test files are placed under
+TESTS_ROOT = PurePosixPath("tests")
+
+# Token budget for the source excerpt in the prompt
+SOURCE_TOKEN_BUDGET = 900
+
 
 class GeneratedTest(BaseModel):
     """A single generated test from LLM."""
@@ -38,6 +54,8 @@ class TestGenerationResult(BaseModel):
     fixtures: List[str] = Field(default_factory=list)
 
 
+# Static guidance lives entirely in the system prompt so that the prefix
+# shared by every generation request stays byte-identical across calls.
 TEST_SYSTEM_PROMPT = """You are an expert test engineer specializing in writing comprehensive, readable tests.
 Your task is to generate tests that validate the INTENDED behavior of code, not just what it currently does.
 
@@ -54,7 +72,15 @@ For pytest, use:
 - Function-based tests with `test_` prefix
 - `pytest.raises` for exception testing
 - Fixtures for shared setup
-- Parameterized tests for similar scenarios"""
+- Parameterized tests for similar scenarios
+
+When generating unit tests for a single component, include:
+1. A test for the primary happy path
+2. Tests for edge cases mentioned in the intent
+3. Tests for error conditions
+4. Any necessary fixtures
+
+Return tests using pytest syntax with clear docstrings explaining what each test validates."""
 
 
 PYTEST_GENERATION_PROMPT = """Generate pytest tests for the following component based on its inferred intent:
@@ -71,15 +97,9 @@ PYTEST_GENERATION_PROMPT = """Generate pytest tests for the following component
 **Source Code:**
 ```python
 {source_code}
-```
+```"""
 
-Generate comprehensive tests that validate this intent. Include:
-1. A test for the primary happy path
-2. Tests for edge cases mentioned in the intent
-3. Tests for error conditions
-4. Any necessary fixtures
-
-Return tests using pytest syntax with clear docstrings explaining what each test validates."""
+_render_pytest_prompt = PYTEST_GENERATION_PROMPT.format
 
 
 class TestAgent:
@@ -89,23 +109,23 @@ class TestAgent:
     Generates tests based on inferred intents using the specified test framework.
     """
     
-    def __init__(self, model: str = "openai:gpt-4o-mini"):
+    def __init__(self, model: str = "openai:gpt-4o-mini", cache: Optional[LLMCache] = None):
         """
         Initialize test agent.
         
         Args:
             model: LLM model to use for generation
+            cache: Optional on-disk cache of LLM outputs
         """
         self.model = model
+        self.cache = cache
         self._agent = None
+        self._inflight = InFlightRequests()
     
     def _get_agent(self) -> Agent:
-        """Get or create the pydantic-ai agent."""
+        """Get the shared pydantic-ai agent for this model."""
         if self._agent is None:
-            self._agent = Agent(
-                self.model,
-                system_prompt=TEST_SYSTEM_PROMPT,
-            )
+            self._agent = get_agent(self.model, TEST_SYSTEM_PROMPT, TestGenerationResult)
         return self._agent
     
     async def generate_unit_tests(
@@ -125,43 +145,68 @@ class TestAgent:
         Returns:
             TestFile with generated test cases
         """
-        if framework != TestFramework.PYTEST:
-            logger.warning(f"Framework {framework} not fully supported, using pytest patterns")
+        return await self._generate_from_prompt(
+            component, self.build_prompt(component, intent), framework
+        )
+    
+    def build_prompt(self, component: Dict[str, Any], intent: Intent) -> str:
+        """
+        Format the unit test generation prompt for a component.
         
-        prompt = PYTEST_GENERATION_PROMPT.format(
+        Args:
+            component: Component data from AST analysis
+            intent: Inferred intent for the component
+            
+        Returns:
+            User prompt for the LLM
+        """
+        return _render_pytest_prompt(
             name=component.get("name", "unknown"),
             intent=intent.intent_text,
             confidence=intent.confidence,
             signature=component.get("signature", ""),
-            source_code=component.get("source_code", "")[:3000],  # Limit size
+            source_code=truncate_tokens(component.get("source_code", ""), SOURCE_TOKEN_BUDGET),
         )
+    
+    def build_prompts(self, components: List[Dict[str, Any]], intents: List[Intent]) -> List[str]:
+        """
+        Format the prompts for many components in one synchronous pass.
+        
+        Args:
+            components: Component data from AST analysis
+            intents: Inferred intents, aligned with components
+            
+        Returns:
+            User prompts in the same order as components
+        """
+        return [self.build_prompt(c, intent) for c, intent in zip(components, intents)]
+    
+    async def _generate_from_prompt(
+        self,
+        component: Dict[str, Any],
+        prompt: str,
+        framework: TestFramework = TestFramework.PYTEST
+    ) -> TestFile:
+        """Generate unit tests for a component whose prompt has already been built."""
+        if framework != TestFramework.PYTEST:
+            logger.warning(f"Framework {framework} not fully supported, using pytest patterns")
         
         try:
-            agent = self._get_agent()
+            cache_key = llm_cache_key(
+                self.model,
+                TEST_SYSTEM_PROMPT,
+                prompt,
+                TestGenerationResult,
+                component.get("source_code", ""),
+            )
+            output = self.cache.get(cache_key, TestGenerationResult) if self.cache else None
             
-            # Simple retry loop for 429s without tenacity dependency
-            max_retries = 3
-            backoff = 2.0
-            for attempt in range(max_retries):
-                try:
-                    result = await agent.run(prompt, output_type=TestGenerationResult)
-                    break 
-                except Exception as e:
-                    # Check for rate limit
-                    is_rate_limit = "429" in str(e)
-                    if hasattr(e, "status_code") and e.status_code == 429:
-                        is_rate_limit = True
-
-                    if is_rate_limit and attempt < max_retries - 1:
-                        wait = backoff * (2 ** attempt)
-                        logger.warning(f"Rate limited (429), retrying in {wait}s...")
-                        await asyncio.sleep(wait)
-                    else:
-                        raise e
+            if output is None:
+                output = await self._inflight.run(cache_key, lambda: self._request(prompt, cache_key))
             
             # Convert to TestCase objects
             test_cases = []
-            for gen_test in result.output.tests:
+            for gen_test in output.tests:
                 test_cases.append(TestCase(
                     name=gen_test.name,
                     intent_text=gen_test.tests_behavior,
@@ -179,8 +224,8 @@ class TestAgent:
                 component_path=component_path,
                 test_cases=test_cases,
                 framework=framework,
-                imports=result.output.imports,
-                fixtures=result.output.fixtures,
+                imports=output.imports,
+                fixtures=output.fixtures,
                 created_at=datetime.now(),
             )
             
@@ -195,6 +240,87 @@ class TestAgent:
                 framework=framework,
             )
     
+    async def _request(self, prompt: str, cache_key: str) -> TestGenerationResult:
+        """Send one prompt to the LLM and store the output in the cache."""
+        agent = self._get_agent()
+        
+        # Simple retry loop for 429s without tenacity dependency
+        max_retries = 3
+        backoff = 2.0
+        for attempt in range(max_retries):
+            try:
+                result = await agent.run(prompt)
+                break 
+            except Exception as e:
+                # Check for rate limit
+                is_rate_limit = "429" in str(e)
+                if hasattr(e, "status_code") and e.status_code == 429:
+                    is_rate_limit = True
+
+                if is_rate_limit and attempt < max_retries - 1:
+                    wait = backoff * (2 ** attempt)
+                    logger.warning(f"Rate limited (429), retrying in {wait}s...")
+                    await asyncio.sleep(wait)
+                else:
+                    raise e
+        
+        output = result.output
+        if self.cache:
+            self.cache.set(cache_key, output)
+        return output
+    
+    async def generate_unit_tests_batch(
+        self,
+        components: List[Dict[str, Any]],
+        intents: List[Intent],
+        framework: TestFramework = TestFramework.PYTEST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> List[TestFile]:
+        """
+        Generate unit tests for many components concurrently.
+        
+        Args:
+            components: Component data from AST analysis
+            intents: Inferred intents, aligned with components
+            framework: Test framework to use
+            max_concurrency: Maximum LLM requests in flight
+            
+        Returns:
+            Test files in the same order as components
+        """
+        prompts = self.build_prompts(components, intents)
+        
+        shared_before = self._inflight.shared
+        test_files = await gather_bounded(
+            self._generate_from_prompt,
+            ((component, prompt, framework) for component, prompt in zip(components, prompts)),
+            max_concurrency,
+        )
+        shared = self._inflight.shared - shared_before
+        if shared:
+            logger.info(f"Deduplicated {shared}/{len(components)} identical test generation prompts")
+        return test_files
+    
+    def stream_unit_tests(
+        self,
+        components: List[Dict[str, Any]],
+        intents: List[Intent],
+        framework: TestFramework = TestFramework.PYTEST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> AsyncIterator[Tuple[int, TestFile]]:
+        """
+        Generate unit tests concurrently, yielding each file as it arrives.
+        
+        Yields:
+            (index into components, TestFile) pairs in completion order
+        """
+        prompts = self.build_prompts(components, intents)
+        return stream_bounded(
+            self._generate_from_prompt,
+            ((component, prompt, framework) for component, prompt in zip(components, prompts)),
+            max_concurrency,
+        )
+    
     async def generate_integration_tests(
         self,
         module: Dict[str, Any],
@@ -238,23 +364,31 @@ Generate integration tests that verify:
 Use pytest syntax with appropriate fixtures."""
 
         try:
-            agent = self._get_agent()
+            cache_key = llm_cache_key(self.model, TEST_SYSTEM_PROMPT, prompt, TestGenerationResult)
+            output = self.cache.get(cache_key, TestGenerationResult) if self.cache else None
             
-            # Simple retry loop for 429s
-            max_retries = 3
-            backoff = 2.0
-            for attempt in range(max_retries):
-                try:
-                    result = await agent.run(prompt, output_type=TestGenerationResult)
-                    break
-                except Exception as e:
-                    is_rate_limit = "429" in str(e) or (hasattr(e, "status_code") and e.status_code == 429)
-                    if is_rate_limit and attempt < max_retries - 1:
-                        wait = backoff * (2 ** attempt)
-                        logger.warning(f"Rate limited (429), retrying in {wait}s...")
-                        await asyncio.sleep(wait)
-                    else:
-                        raise e
+            if output is None:
+                agent = self._get_agent()
+                
+                # Simple retry loop for 429s
+                max_retries = 3
+                backoff = 2.0
+                for attempt in range(max_retries):
+                    try:
+                        result = await agent.run(prompt)
+                        break
+                    except Exception as e:
+                        is_rate_limit = "429" in str(e) or (hasattr(e, "status_code") and e.status_code == 429)
+                        if is_rate_limit and attempt < max_retries - 1:
+                            wait = backoff * (2 ** attempt)
+                            logger.warning(f"Rate limited (429), retrying in {wait}s...")
+                            await asyncio.sleep(wait)
+                        else:
+                            raise e
+                
+                output = result.output
+                if self.cache:
+                    self.cache.set(cache_key, output)
             
             test_cases = [
                 TestCase(
@@ -263,7 +397,7 @@ Use pytest syntax with appropriate fixtures."""
                     test_code=gen_test.test_code,
                     status=TestStatus.PENDING,
                 )
-                for gen_test in result.output.tests
+                for gen_test in output.tests
             ]
             
             module_path = module.get("path", "unknown")
@@ -275,8 +409,8 @@ Use pytest syntax with appropriate fixtures."""
                 component_path=module_path,
                 test_cases=test_cases,
                 framework=framework,
-                imports=result.output.imports,
-                fixtures=result.output.fixtures,
+                imports=output.imports,
+                fixtures=output.fixtures,
             )
             
         except Exception as e:
@@ -300,21 +434,17 @@ Use pytest syntax with appropriate fixtures."""
             Path for test file
         """
         # Convert src/module/file.py -> tests/module/test_file.py
-        import os
-        
-        dirname = os.path.dirname(source_path)
-        basename = os.path.basename(source_path)
+        path = PurePosixPath(source_path)
+        parent = path.parent
         
         # Handle common patterns
-        if dirname.startswith("src/"):
-            dirname = dirname[4:]  # Remove src/ prefix
+        if parent.parts[:1] == ("src",):
+            parent = parent.relative_to("src")  # Remove src/ prefix
         
         # Add test_ prefix to filename
-        if not basename.startswith("test_"):
-            name, ext = os.path.splitext(basename)
-            basename = f"test_{name}{ext}"
+        name = path.name if path.name.startswith("test_") else f"test_{path.name}"
         
-        return os.path.join("tests", dirname, basename) if dirname else os.path.join("tests", basename)
+        return str(TESTS_ROOT / parent / name)
     
     def format_test_preview(self, test_file: TestFile) -> str:
         """
@@ -0,0 +1,67 @@
+"""
+Batch commands for Code2Test CLI.
+"""
+
+import os
+import sys
+import asyncio
+from pathlib import Path
+
+import click
+
+from code2test.cli.display import DisplayManager
+from code2test.cli.config_manager import ConfigManager
+
+
+@click.group(name="batch")
+def batch_group():
+    """Track intent inference jobs submitted with 'code2test test --batch'."""
+    pass
+
+
+@batch_group.command(name="status")
+@click.argument("batch_id")
+def batch_status(batch_id: str) -> None:
+    """
+    Check a batch job and store its intents once it has completed.
+    
+    \b
+    Examples:
+        code2test batch status batch_abc123
+    """
+    display = DisplayManager()
+    
+    from code2test.agents.intent_agent import IntentAgent
+    from code2test.storage import IntentDatabase
+    
+    config_manager = ConfigManager()
+    config_manager.load()
+    api_key = config_manager.get_api_key()
+    if api_key:
+        os.environ["OPENAI_API_KEY"] = api_key
+    
+    code2test_dir = Path.cwd() / ".code2test"
+    
+    try:
+        status, intents = asyncio.run(
+            IntentAgent().collect_batch(batch_id, code2test_dir / "batches")
+        )
+    except Exception as e:
+        display.error(f"Failed to check batch {batch_id}: {e}")
+        sys.exit(1)
+    
+    if intents is None:
+        display.info(f"Batch {batch_id} is {status}")
+        return
+    
+    db = IntentDatabase(str(code2test_dir / "code2test.db"))
+    stored = db.get_intents_bulk([intent.component_id for intent in intents])
+    for intent in intents:
+        # Never overwrite intents the user has written by hand
+        existing = stored.get(intent.component_id)
+        if existing and existing.user_edited:
+            continue
+        db.save_intent(intent)
+    
+    display.success(f"Batch {batch_id} completed: stored {len(intents)} intents")
+    display.info("View them with 'code2test intent show'")
@@ -8,6 +8,7 @@ import click
 from rich.prompt import Confirm, Prompt
 
 from code2test.cli.display import DisplayManager
+from code2test.cli.utils.fs import safe_write
 
 @click.command("init")
 @click.argument("path", type=click.Path(exists=True, file_okay=False, dir_okay=True), default=".")
@@ -57,6 +58,7 @@ def init_command(path: str) -> None:
         "confidence_threshold": 0.6,
         "auto_accept": False,
         "max_concurrency": 5,
+        "semantic_cache": False,
         "exclude_patterns": [
             "node_modules", 
             "venv", 
@@ -67,8 +69,8 @@ def init_command(path: str) -> None:
         ]
     }
     
-    with open(config_file, "w") as f:
-        json.dump(config, f, indent=2)
-        
+    # Atomic write: an interrupted init never leaves a truncated config behind
+    safe_write(config_file, json.dumps(config, indent=2))
+    
     display.success(f"Initialized Code2Test configuration in {config_file}")
     display.info("Run 'code2test generate' to start generating tests!")
@@ -2,21 +2,24 @@
 Intent command for Code2Test CLI.
 """
 
+import textwrap
 from pathlib import Path
 from typing import Optional
 import click
-from rich.console import Console
 
-from code2test.cli.display import DisplayManager
+from code2test.cli.display import DisplayManager, console
 from code2test.cli.interactive import InteractiveSession
 
-console = Console()
+
+# Choices of the intent command
+_ACTIONS = click.Choice(["show", "edit", "export"])
+_FORMATS = click.Choice(["text", "json"])
 
 
 @click.command("intent")
-@click.argument("action", type=click.Choice(["show", "edit", "export"]))
+@click.argument("action", type=_ACTIONS)
 @click.argument("component", required=False)
-@click.option("--format", type=click.Choice(["text", "json"]), default="text")
+@click.option("--format", type=_FORMATS, default="text")
 def intent_command(
     action: str,
     component: Optional[str],
@@ -53,22 +56,26 @@ def intent_command(
             else:
                 display.warning(f"No intent found for: {component}")
         else:
-            intents = db.get_all_intents()
-            if intents:
-                for intent in intents:
-                    display.show_intent(intent)
-            else:
+            shown = False
+            for intent in db.iter_intents():
+                display.show_intent(intent)
+                shown = True
+            if not shown:
                 display.info("No intents stored yet.")
     
     elif action == "export":
-        intents = db.get_all_intents()
-        
         if format == "json":
-            import json
-            data = [i.model_dump() for i in intents]
-            console.print(json.dumps(data, indent=2, default=str))
+            # Stream one element at a time so neither the intents nor the
+            # document are held in memory; Rich is bypassed as it would parse
+            # the output for markup and highlighting
+            separator = "[\n"
+            for intent in db.iter_intents():
+                element = textwrap.indent(intent.model_dump_json(indent=2), "  ")
+                click.echo(separator + element, nl=False)
+                separator = ",\n"
+            click.echo("[]" if separator == "[\n" else "\n]")
         else:
-            for intent in intents:
+            for intent in db.iter_intents():
                 console.print(f"{intent.component_id}: {intent.intent_text}")
     
     elif action == "edit":
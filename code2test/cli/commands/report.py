@@ -2,24 +2,28 @@
 Report command for Code2Test CLI.
 """
 
+import io
 from pathlib import Path
 import click
-from rich.console import Console
-from rich.table import Table
 
-from code2test.cli.display import DisplayManager
+from code2test.cli.display import DisplayManager, console
 
-console = Console()
+
+# Choices of the report command
+_REPORT_TYPES = click.Choice(["summary", "coverage"])
+_FORMATS = click.Choice(["text", "html", "json"])
 
 
 @click.command("report")
-@click.argument("type", type=click.Choice(["summary", "coverage"]), default="summary")
-@click.option("--format", type=click.Choice(["text", "html", "json"]), default="text")
+@click.argument("type", type=_REPORT_TYPES, default="summary")
+@click.option("--format", type=_FORMATS, default="text")
 @click.option("--output", type=click.Path(), default="report.html")
+@click.option("--pretty", is_flag=True, default=False, help="Render the summary in a Rich panel")
 def report_command(
     type: str,
     format: str,
-    output: str
+    output: str,
+    pretty: bool
 ) -> None:
     """
     Generate quality and coverage reports.
@@ -27,12 +31,13 @@ def report_command(
     \b
     Examples:
         code2test report summary          # View summary report
+        code2test report summary --pretty # View it in a formatted panel
         code2test report coverage --format html   # Generate HTML coverage report
     """
     display = DisplayManager()
     
     # Import storage
-    from code2test.storage import IntentDatabase, TestRegistry
+    from code2test.storage import close_all, open_shared_db
     
     # Find database
     db_path = Path.cwd() / ".code2test" / "code2test.db"
@@ -41,32 +46,44 @@ def report_command(
         display.error("No database found. Run 'code2test test' first.")
         return
         
-    db = IntentDatabase(str(db_path))
-    registry = TestRegistry(str(db_path))
+    db, registry = open_shared_db(db_path)
     
-    intents = db.get_all_intents()
     # Mock retrieval of tests from registry (registry API needs to support listing all)
-    # For now we'll do a basic stats report
-    
-    total_intents = len(intents)
-    high_confidence = len([i for i in intents if i.confidence >= 0.8])
-    medium_confidence = len([i for i in intents if 0.5 <= i.confidence < 0.8])
-    low_confidence = len([i for i in intents if i.confidence < 0.5])
+    # For now we'll do a basic stats report, counted in SQLite without
+    # loading the intents themselves
+    total_intents, high_confidence, medium_confidence, low_confidence = (
+        db.get_confidence_histogram()
+    )
+    # Everything the report needs has been read
+    close_all()
     
     if type == "summary":
-        table = Table(title="Code2Test Summary Report")
-        table.add_column("Metric", style="cyan")
-        table.add_column("Value", style="green")
-        
-        table.add_row("Total Intents Extracted", str(total_intents))
-        table.add_row("High Confidence (>80%)", str(high_confidence))
-        table.add_row("Medium Confidence (>50%)", str(medium_confidence))
-        table.add_row("Low Confidence (<50%)", str(low_confidence))
+        rows = [
+            ("Total Intents Extracted", total_intents),
+            ("High Confidence (>80%)", high_confidence),
+            ("Medium Confidence (>50%)", medium_confidence),
+            ("Low Confidence (<50%)", low_confidence),
+        ]
         
         # Add test stats if we had them easily accessible
         # tests = registry.get_all_tests() ...
         
-        console.print(table)
+        if pretty:
+            from rich.panel import Panel
+            
+            # One pre-aligned block in a panel: a single markup parse and
+            # no per-cell width measurement as with a Table
+            body = "\n".join(
+                f"[cyan]{metric:<26}[/cyan][green]{value:>8}[/green]" for metric, value in rows
+            )
+            console.print(Panel(body, title="Code2Test Summary Report", expand=False))
+        else:
+            # Plain text skips Rich's markup parsing and cell measurement
+            buf = io.StringIO()
+            buf.write("Code2Test Summary Report\n")
+            for metric, value in rows:
+                buf.write(f"{metric:<26}{value:>8}\n")
+            click.echo(buf.getvalue(), nl=False)
         
     elif type == "coverage":
         display.info("Coverage reporting not yet implemented.")
@@ -6,21 +6,29 @@ import os
 import sys
 import logging
 import asyncio
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 import click
-from rich.console import Console
 
-from code2test.cli.display import DisplayManager
-from code2test.cli.interactive import InteractiveSession, run_interactive_generation
+from code2test.cli.display import BufferedDisplay, console
 from code2test.cli.config_manager import ConfigManager
-from code2test.core import TestGenerator, GenerationConfig, TestFramework
-from code2test.src.be.dependency_analyzer import DependencyGraphBuilder
-from code2test.src.config import Config
 
 logger = logging.getLogger(__name__)
-console = Console()
+
+
+# Choices of the test command
+_FRAMEWORKS = click.Choice(["pytest", "unittest"])
+_REPORT_FORMATS = click.Choice(["none", "html", "json", "all"])
+
+
+def _validate_confidence(ctx: click.Context, param: click.Parameter, value: float) -> float:
+    """Reject thresholds outside 0.0-1.0 before the command body runs."""
+    if not 0.0 <= value <= 1.0:
+        raise click.BadParameter("Confidence must be between 0.0 and 1.0")
+    return value
 
 
 @click.command("test")
@@ -35,6 +43,7 @@ console = Console()
     "--confidence",
     type=float,
     default=0.6,
+    callback=_validate_confidence,
     help="Minimum confidence threshold for auto-acceptance (0.0-1.0)"
 )
 @click.option(
@@ -51,7 +60,7 @@ console = Console()
 )
 @click.option(
     "--framework",
-    type=click.Choice(["pytest", "unittest"]),
+    type=_FRAMEWORKS,
     default="pytest",
     help="Test framework to use"
 )
@@ -74,10 +83,22 @@ console = Console()
 )
 @click.option(
     "--report",
-    type=click.Choice(["none", "html", "json", "all"]),
+    type=_REPORT_FORMATS,
     default="none",
     help="Generate reports after test generation"
 )
+@click.option(
+    "--batch",
+    is_flag=True,
+    default=False,
+    help="Submit intent inference as an OpenAI batch job (half price, results within 24h)"
+)
+@click.option(
+    "--editor-review/--no-editor-review",
+    default=None,
+    help="Review intents in one $EDITOR session instead of one prompt each "
+         "(default: when more than 20 need review)"
+)
 @click.option(
     "--verbose", "-v",
     is_flag=True,
@@ -95,6 +116,8 @@ def test_command(
     exclude: Optional[str],
     exit_code: bool,
     report: str,
+    batch: bool,
+    editor_review: Optional[bool],
     verbose: bool
 ) -> None:
     """
@@ -109,8 +132,33 @@ def test_command(
         code2test test --auto .           # Auto-generate for entire repo
         code2test test --dry-run src/     # Preview without writing
         code2test test --confidence 0.8   # Only accept high-confidence
+        code2test test --batch .          # Queue intent inference as a batch job
     """
-    display = DisplayManager(quiet=not verbose)
+    with BufferedDisplay(quiet=not verbose) as display:
+        _run_test_command(
+            display,
+            path, auto, confidence, dry_run, output_dir, framework,
+            include, exclude, exit_code, report, batch, editor_review, verbose,
+        )
+
+
+def _run_test_command(
+    display: BufferedDisplay,
+    path: str,
+    auto: bool,
+    confidence: float,
+    dry_run: bool,
+    output_dir: str,
+    framework: str,
+    include: Optional[str],
+    exclude: Optional[str],
+    exit_code: bool,
+    report: str,
+    batch: bool,
+    editor_review: Optional[bool],
+    verbose: bool
+) -> None:
+    """Body of test_command; status messages are buffered between phases."""
     
     # Setup logging
     if verbose:
@@ -118,33 +166,28 @@ def test_command(
     else:
         logging.basicConfig(level=logging.WARNING)
     
-    # Validate confidence
-    if not 0.0 <= confidence <= 1.0:
-        display.error("Confidence must be between 0.0 and 1.0")
-        sys.exit(1)
-    
-    # Load configuration
-    config_manager = ConfigManager()
-    if not config_manager.load() or not config_manager.is_configured():
+    # Load configuration (file and keyring are read once)
+    snapshot = ConfigManager().snapshot()
+    if not snapshot.configured:
         display.warning("Code2Test is not fully configured.")
         display.info("Usage may fail if API keys are missing. Run 'code2test config set' to configure.")
     
-    # Set API key in environment for agents
-    api_key = config_manager.get_api_key()
+    # Environment for the agents, applied in one update once the model is known
+    env_updates: Dict[str, str] = {}
+    
+    api_key = snapshot.api_key
     if api_key:
-        os.environ["OPENAI_API_KEY"] = api_key
+        env_updates["OPENAI_API_KEY"] = api_key
         # Support for Gemini/Google models which might look for these keys
-        os.environ["GEMINI_API_KEY"] = api_key
-        os.environ["GOOGLE_API_KEY"] = api_key
+        env_updates["GEMINI_API_KEY"] = api_key
+        env_updates["GOOGLE_API_KEY"] = api_key
     
     # Resolve paths
-    repo_path = Path(path).resolve()
+    repo_path = Path(os.path.abspath(path))
     
     # Get configured model
-    cli_config = config_manager.get_config()
-    main_model = cli_config.main_model if cli_config and cli_config.main_model else None
+    main_model = snapshot.main_model
     
-    # If no model configured, infer from env/keys
     # If no model configured, infer from env/keys
     if not main_model:
         llm_backend = os.environ.get("LLM_BACKEND", "").lower()
@@ -156,13 +199,13 @@ def test_command(
                 main_model = f"azure:{azure_deployment}"
                 # Ensure API version is available for clients that need it
                 if os.environ.get("AZURE_OPENAI_API_VERSION"):
-                    os.environ["OPENAI_API_VERSION"] = os.environ["AZURE_OPENAI_API_VERSION"]
+                    env_updates["OPENAI_API_VERSION"] = os.environ["AZURE_OPENAI_API_VERSION"]
                 else:
                     # Default to a version that supports tool_choice='required'
                     # See: https://learn.microsoft.com/en-us/azure/ai-services/openai/reference#chat-completions
                     default_version = "2024-06-01"
                     if not os.environ.get("OPENAI_API_VERSION"):
-                         os.environ["OPENAI_API_VERSION"] = default_version
+                         env_updates["OPENAI_API_VERSION"] = default_version
                          display.info(f"Using default Azure API version: {default_version}")
                 display.info(f"Detected Azure configuration, using deployment: {azure_deployment}")
             else:
@@ -178,9 +221,18 @@ def test_command(
         else:
             main_model = "openai:gpt-4o-mini"
     
+    os.environ.update(env_updates)
+    
     display.info(f"Using model: {main_model}")
     display.info(f"Analyzing: {repo_path}")
     
+    # Import generation machinery (pulls in the agents and analyzers, so it
+    # is kept off the path of --help and early validation exits)
+    from code2test.cli.interactive import run_interactive_generation
+    from code2test.core import TestGenerator, GenerationConfig, TestFramework
+    from code2test.src.be.dependency_analyzer import DependencyGraphBuilder
+    from code2test.src.config import Config
+    
     try:
         # Create configuration
         config = GenerationConfig(
@@ -202,7 +254,6 @@ def test_command(
         # Analyze codebase
         display.info("Parsing codebase...")
         
-        # Use the existing dependency analyzer
         # Use the existing dependency analyzer
         # We need to construct Config correctly as it requires many fields
         # and patterns go into agent_instructions
@@ -225,6 +276,7 @@ def test_command(
         )
         
         builder = DependencyGraphBuilder(repo_config)
+        display.flush()
         components, leaf_nodes = builder.build_dependency_graph()
         
         if not components:
@@ -233,24 +285,18 @@ def test_command(
             
         display.success(f"Found {len(components)} components")
         
-        # Convert Node objects to dictionaries for compatibility
-        # and map 'depends_on' to 'dependencies'
-        components_dict = {}
-        for k, v in components.items():
-            if hasattr(v, 'model_dump'):
-                data = v.model_dump()
-            else:
-                data = v.dict()
-            
-            # Map depends_on to dependencies
-            if 'depends_on' in data:
-                data['dependencies'] = list(data['depends_on'])
-            else:
-                data['dependencies'] = []
-                
-            components_dict[k] = data
+        if batch:
+            # Bulk, non-interactive: hand intent inference to the Batch API
+            from code2test.agents.intent_agent import IntentAgent
             
-        components = components_dict
+            display.flush()
+            batch_id = asyncio.run(IntentAgent(model=main_model).submit_batch(
+                components,
+                repo_path / ".code2test" / "batches",
+            ))
+            display.success(f"Submitted batch {batch_id} for {len(components)} components")
+            display.info(f"Check it with 'code2test batch status {batch_id}' from {repo_path}")
+            return
         
         # Create generator
         generator = TestGenerator(
@@ -262,14 +308,8 @@ def test_command(
             # Non-interactive batch mode
             display.info("Running in auto mode...")
             
-            async def run_batch():
-                suite = await generator.generate_tests_for_module(
-                    str(repo_path),
-                    components
-                )
-                return suite
-            
-            suite = asyncio.run(run_batch())
+            display.flush()
+            suite = asyncio.run(generator.generate_tests_for_module(str(repo_path), components))
             
             display.show_summary_table(generator.get_stats())
             
@@ -285,22 +325,29 @@ def test_command(
                         report_dir = Path(output_dir) / "reports"
                         report_dir.mkdir(parents=True, exist_ok=True)
                         
+                        # Read once and shared by both generators for --report all
+                        intents_dict = generator.intent_db.get_all_intents_dict()
+                        
+                        jobs = []
                         if report in ["html", "all"]:
-                            html_path = report_dir / "report.html"
-                            html_gen = HTMLReportGenerator()
-                            html_gen.generate_report(suite, generator.intent_db.get_all_intents_dict(), str(html_path))
-                            display.success(f"HTML report generated: {html_path}")
-                            
+                            jobs.append(("HTML", HTMLReportGenerator(), report_dir / "report.html"))
                         if report in ["json", "all"]:
-                            json_path = report_dir / "report.json"
-                            json_gen = JSONReportGenerator()
-                            json_gen.generate_report(suite, generator.intent_db.get_all_intents_dict(), str(json_path))
-                            display.success(f"JSON report generated: {json_path}")
+                            jobs.append(("JSON", JSONReportGenerator(), report_dir / "report.json"))
+                        
+                        # Both only read suite and intents, so they can render
+                        # and write side by side
+                        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                            futures = [
+                                executor.submit(gen.generate_report, suite, intents_dict, str(report_path))
+                                for _, gen, report_path in jobs
+                            ]
+                            for (label, _, report_path), future in zip(jobs, futures):
+                                future.result()
+                                display.success(f"{label} report generated: {report_path}")
                             
                     except Exception as e:
                         display.error(f"Failed to generate report: {e}")
                         if verbose:
-                            import traceback
                             traceback.print_exc()
             else:
                 display.info(f"Would generate {suite.total_tests} tests (dry-run)")
@@ -308,13 +355,16 @@ def test_command(
             # Handle exit code
             if exit_code and not dry_run:
                 # Check for verification failures
-                failed_files = [tf for tf in suite.test_files if not tf.verified]
+                failed_files = sum(1 for tf in suite.test_files if not tf.verified)
                 if failed_files:
-                    display.error(f"{len(failed_files)} files failed verification")
+                    display.error(f"{failed_files} files failed verification")
                     sys.exit(1)
         else:
             # Interactive mode
-            run_interactive_generation(generator, components, auto_accept=auto)
+            display.flush()
+            run_interactive_generation(
+                generator, components, auto_accept=auto, review_in_editor=editor_review
+            )
         
     except KeyboardInterrupt:
         display.warning("\nGeneration interrupted")
@@ -322,6 +372,9 @@ def test_command(
     except Exception as e:
         display.error(f"Generation failed: {e}")
         if verbose:
-            import traceback
             traceback.print_exc()
         sys.exit(1)
+    finally:
+        # Release the database connection opened by the generator
+        from code2test.storage import close_all
+        close_all()
@@ -2,13 +2,20 @@
 Verify command for Code2Test CLI.
 """
 
+import os
+import importlib.util
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 import click
-from rich.console import Console
 
-from code2test.cli.display import DisplayManager
+from code2test.cli.display import DisplayManager, console
 
-console = Console()
+if TYPE_CHECKING:
+    from code2test.core.models import Intent, TestCase, TestFile
+
+
+# Trailing characters of pytest output shown with --verbose
+OUTPUT_TAIL_CHARS = 1000
 
 
 @click.command("verify")
@@ -16,11 +23,33 @@ console = Console()
 @click.option("--diagnose", is_flag=True, help="Diagnose and explain failures")
 @click.option("--fix", is_flag=True, help="Attempt to auto-fix failed tests")
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Run tests in N parallel processes (requires pytest-xdist)"
+)
+@click.option(
+    "--timeout",
+    type=click.IntRange(min=1),
+    default=60,
+    show_default=True,
+    help="Seconds before the test run is stopped"
+)
+@click.option(
+    "--in-process",
+    is_flag=True,
+    help="Run pytest inside code2test's interpreter (faster startup, no timeout)"
+)
 def verify_command(
     path: str,
     diagnose: bool,
     fix: bool,
-    verbose: bool
+    verbose: bool,
+    jobs: int,
+    timeout: int,
+    in_process: bool
 ) -> None:
     """
     Run and verify generated tests.
@@ -31,22 +60,37 @@ def verify_command(
     Examples:
         code2test verify tests/           # Verify all tests
         code2test verify --diagnose       # Diagnose failures
+        code2test verify -j 8             # Run tests on 8 cores
+        code2test verify --timeout 600    # Allow a slow suite 10 minutes
     """
     display = DisplayManager(quiet=not verbose)
     
-    test_path = Path(path).resolve()
+    test_path = Path(os.path.abspath(path))
     display.info(f"Verifying tests in: {test_path}")
     
-    # Import verifier components
+    # Import the test runner; diagnosis components are only loaded on demand
     from code2test.adapters.python.pytest_adapter import PytestAdapter
-    from code2test.agents.diagnosis_agent import DiagnosisAgent
-    from code2test.core.models import TestStatus
-    from code2test.core.intent import IntentExtractor
+    
+    if jobs > 1 and importlib.util.find_spec("xdist") is None:
+        display.warning(
+            "pytest-xdist is not installed; running tests in one process. "
+            "Install it with: pip install 'code2test\\[parallel]'"
+        )
+        jobs = 1
     
     # Run tests
     # TODO: Detect framework or take as arg
-    adapter = PytestAdapter(str(test_path.parent))
-    results = adapter.run_tests(str(test_path))
+    with PytestAdapter(str(test_path.parent)) as adapter:
+        if in_process:
+            results = adapter.run_tests_in_process(
+                str(test_path), output_tail=OUTPUT_TAIL_CHARS, jobs=jobs
+            )
+        else:
+            results = adapter.run_tests(str(test_path), timeout, jobs=jobs)
+    
+    if results.get("error"):
+        display.error(f"Test run failed: {results['error']}")
+        return
     
     summary = results.get("summary", {})
     
@@ -61,26 +105,113 @@ def verify_command(
     # Diagnostics and Fix Logic
     if diagnose or fix:
         import asyncio
-        from code2test.storage import IntentDatabase
-        
-        # We need more than just the results dict here; we need analysis of failures
-        # Ideally, we would reload the test file context.
-        # For this implementation, we will mock the diagnosis flow as if we had the context objects
-        # In a real implementation, we would need to hydrate TestFile objects from the disk
+        from code2test.agents.diagnosis_agent import DiagnosisAgent
+        from code2test.cli.config_manager import ConfigManager
+        from code2test.storage import close_all
         
-        display.info("Analyzing failures...")
+        db_path = Path.cwd() / ".code2test" / "code2test.db"
+        failures = _collect_failures(results.get("tests", []), db_path) if db_path.exists() else []
+        close_all()
         
-        # Note: This is a simplified "offline" fix flow. 
-        # Truly robust fixing requires the full Generator context (components, intents).
-        # Here we warn the user if we can't fully hydrate the context.
+        if failures:
+            config_manager = ConfigManager()
+            config_manager.load()
+            api_key = config_manager.get_api_key()
+            if api_key:
+                os.environ["OPENAI_API_KEY"] = api_key
+            
+            display.info(f"Analyzing {len(failures)} failures...")
+            
+            # All failures are diagnosed concurrently, bounded by the agent's
+            # default concurrency
+            diagnoses = asyncio.run(DiagnosisAgent().diagnose_failures_batch(failures))
+            
+            for (test_case, _, _, _), diagnosis in zip(failures, diagnoses):
+                if isinstance(diagnosis, Exception):
+                    display.warning(f"Could not diagnose {test_case.name}: {diagnosis}")
+                    continue
+                console.print(f"\n✗ {test_case.name} [red]FAILED[/red]")
+                display.show_diagnosis_panel(diagnosis)
+        else:
+            display.warning("No failing tests were generated by code2test; nothing to diagnose.")
         
-        console.print("\n[dim]Note: 'verify --fix' in offline mode has limited context.[/dim]")
-        console.print("[dim]For full self-healing, run 'code2test test --auto'[/dim]\n")
-
         if fix:
+            console.print("\n[dim]Note: 'verify --fix' in offline mode has limited context.[/dim]")
+            console.print("[dim]For full self-healing, run 'code2test test --auto'[/dim]\n")
             display.warning("Auto-fixing is best handled during generation via 'code2test test'.")
             display.info("Use 'code2test test --auto --exit-code' for CI/CD self-healing.")
-            
+    
     if results.get("stdout") and verbose:
         console.print("\n[dim]Output:[/dim]")
-        console.print(results["stdout"][-1000:])
+        console.print(results["stdout"][-OUTPUT_TAIL_CHARS:])
+
+
+def _collect_failures(
+    tests: List[Dict[str, Any]],
+    db_path: Path
+) -> List[Tuple["TestCase", str, Dict[str, Any], "Intent"]]:
+    """
+    Match failed pytest results to the generated tests and intents they came from.
+    
+    Args:
+        tests: Per-test results from the pytest adapter
+        db_path: Path to the code2test database
+        
+    Returns:
+        (test_case, failure_output, component, intent) tuples for every
+        failure whose test file and intent are registered
+    """
+    from code2test.core.models import TestCase
+    from code2test.storage import open_shared_db
+    
+    intent_db, registry = open_shared_db(db_path)
+    
+    # Registered test files by file name; node IDs are relative to the
+    # pytest rootdir, so the full path is matched as a suffix below
+    test_files: Dict[str, List["TestFile"]] = {}
+    for test_file in registry.get_all_tests():
+        test_files.setdefault(Path(test_file.path).name, []).append(test_file)
+    
+    sources: Dict[str, str] = {}
+    failures = []
+    for test in tests:
+        if test.get("outcome") not in ("failed", "error"):
+            continue
+        
+        file_part, _, test_part = test["nodeid"].partition("::")
+        file_parts = Path(file_part).parts
+        test_file = next(
+            (
+                candidate for candidate in test_files.get(Path(file_part).name, [])
+                if Path(os.path.abspath(candidate.path)).parts[-len(file_parts):] == file_parts
+            ),
+            None,
+        )
+        if test_file is None:
+            continue
+        
+        intent = intent_db.get_intent(test_file.component_id)
+        if intent is None:
+            continue
+        
+        name = test_part.rpartition("::")[2].partition("[")[0]
+        test_case = next(
+            (tc for tc in test_file.test_cases if tc.name == name),
+            None,
+        ) or TestCase(name=name, intent_text=intent.intent_text, test_code="")
+        
+        source_path = test_file.component_path
+        if source_path not in sources:
+            try:
+                sources[source_path] = Path(source_path).read_text()
+            except OSError:
+                sources[source_path] = ""
+        
+        component = {
+            "id": test_file.component_id,
+            "file_path": source_path,
+            "source_code": sources[source_path],
+        }
+        failures.append((test_case, test.get("call", {}).get("longrepr", ""), component, intent))
+    
+    return failures
@@ -4,7 +4,7 @@ Configuration manager with keyring integration for secure credential storage.
 
 import json
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 import keyring
 from keyring.errors import KeyringError
 
@@ -23,6 +23,15 @@ CONFIG_FILE = CONFIG_DIR / "config.json"
 CONFIG_VERSION = "1.0"
 
 
+class ConfigSnapshot(NamedTuple):
+    """Everything a command needs from the configuration, read once."""
+    
+    loaded: bool
+    configured: bool
+    api_key: Optional[str]
+    main_model: Optional[str]
+
+
 class ConfigManager:
     """
     Manages CodeWiki configuration with secure keyring storage for API keys.
@@ -36,7 +45,10 @@ class ConfigManager:
     def __init__(self):
         """Initialize the configuration manager."""
         self._api_key: Optional[str] = None
+        # Set once the keyring has been asked, so a missing key is looked up once
+        self._api_key_loaded = False
         self._config: Optional[Configuration] = None
+        self._snapshot: Optional[ConfigSnapshot] = None
         self._keyring_available = self._check_keyring_available()
     
     def _check_keyring_available(self) -> bool:
@@ -76,6 +88,7 @@ class ConfigManager:
             except KeyringError:
                 # Keyring unavailable, API key will be None
                 pass
+            self._api_key_loaded = True
             
             return True
         except (json.JSONDecodeError, FileSystemError) as e:
@@ -150,6 +163,9 @@ class ConfigManager:
         if max_depth is not None:
             self._config.max_depth = max_depth
         
+        # Any cached snapshot is stale from here on
+        self._snapshot = None
+        
         # Validate configuration (only if base fields are set)
         if self._config.base_url and self._config.main_model and self._config.cluster_model:
             self._config.validate()
@@ -184,14 +200,33 @@ class ConfigManager:
         Returns:
             API key or None if not set
         """
-        if self._api_key is None:
+        if self._api_key is None and not self._api_key_loaded:
             try:
                 self._api_key = keyring.get_password(KEYRING_SERVICE, KEYRING_API_KEY_ACCOUNT)
             except KeyringError:
                 pass
+            self._api_key_loaded = True
         
         return self._api_key
     
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        Load the configuration once and return what commands need from it.
+        
+        Later calls return the same snapshot without touching the config
+        file or the keyring again.
+        
+        Returns:
+            ConfigSnapshot with load state, API key and main model
+        """
+        if self._snapshot is None:
+            loaded = self.load()
+            configured = loaded and self.is_configured()
+            api_key = self.get_api_key()
+            main_model = self._config.main_model if self._config and self._config.main_model else None
+            self._snapshot = ConfigSnapshot(loaded, configured, api_key, main_model)
+        return self._snapshot
+    
     def get_config(self) -> Optional[Configuration]:
         """
         Get current configuration.
@@ -223,6 +258,7 @@ class ConfigManager:
         try:
             keyring.delete_password(KEYRING_SERVICE, KEYRING_API_KEY_ACCOUNT)
             self._api_key = None
+            self._snapshot = None
         except KeyringError:
             pass
     
@@ -237,6 +273,7 @@ class ConfigManager:
         
         self._config = None
         self._api_key = None
+        self._snapshot = None
     
     @property
     def keyring_available(self) -> bool:
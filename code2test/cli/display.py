@@ -4,14 +4,17 @@ Code2Test CLI Display Module
 Rich terminal rendering for test generation output.
 """
 
-from typing import Dict, List, Any, Optional
+import functools
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Tuple
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.tree import Tree
 from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+from rich.style import Style
+from rich.progress import Progress, ProgressColumn, SpinnerColumn, TextColumn, BarColumn
 from rich.syntax import Syntax
+from rich.segment import Segment, Segments
 from rich.live import Live
 
 from code2test.core.models import (
@@ -25,9 +28,61 @@ from code2test.core.models import (
 )
 
 
-# Global console instance
+# Console shared by every display and command, so the terminal is probed once
 console = Console()
 
+# Pre-styled icons of status messages, so only the message itself is parsed
+_INFO_ICON = Text("ℹ", style=Style(color="blue"))
+_SUCCESS_ICON = Text("✓", style=Style(color="green"))
+_WARNING_ICON = Text("⚠", style=Style(color="yellow"))
+_ERROR_ICON = Text("✗", style=Style(color="red"))
+
+# Markup shown next to each test case
+_STATUS_ICONS: Dict[TestStatus, str] = {
+    TestStatus.PENDING: "○",
+    TestStatus.PASSED: "[green]✓[/green]",
+    TestStatus.FAILED: "[red]✗[/red]",
+    TestStatus.SKIPPED: "[yellow]○[/yellow]",
+    TestStatus.XFAIL: "[magenta]○[/magenta]",
+}
+
+# Border colour and description of each diagnosis cause
+_CAUSE_COLORS: Dict[DiagnosisCause, str] = {
+    DiagnosisCause.TEST_WRONG: "yellow",
+    DiagnosisCause.CODE_BUG: "red",
+    DiagnosisCause.INTENT_WRONG: "magenta",
+}
+
+_CAUSE_LABELS: Dict[DiagnosisCause, str] = {
+    DiagnosisCause.TEST_WRONG: "Test incorrectly implements intent",
+    DiagnosisCause.CODE_BUG: "Potential bug in source code",
+    DiagnosisCause.INTENT_WRONG: "Intent doesn't match actual behavior",
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _render_test_code(console: Console, code: str, title: str, width: int) -> Tuple[Segment, ...]:
+    """
+    Highlight a test case into a panel and render it to segments.
+    
+    Lexing and wrapping dominate the cost of showing a test, so the result
+    is cached per console, code, title and terminal width; showing the same
+    test again only writes the stored segments.
+    
+    Args:
+        console: Console the segments are rendered for
+        code: Test source code
+        title: Panel title
+        width: Render width
+    
+    Returns:
+        Segments of the panel, newlines included
+    """
+    syntax = Syntax(code, "python", theme="monokai", line_numbers=True, word_wrap=True)
+    panel = Panel(syntax, title=title, border_style="dim")
+    lines = console.render_lines(panel, console.options.update_width(width), new_lines=True)
+    return tuple(segment for line in lines for segment in line)
+
 
 class DisplayManager:
     """Manages rich terminal output for Code2Test."""
@@ -39,9 +94,17 @@ class DisplayManager:
         Args:
             quiet: Suppress non-essential output
         """
-        self.console = Console()
+        self.console = console
         self.quiet = quiet
     
+    def flush(self) -> None:
+        """Print any pending output; DisplayManager writes immediately, so there is none."""
+    
+    def _print(self, *objects: Any, **kwargs: Any) -> None:
+        """Print to the console after any pending output. All display output goes through here."""
+        self.flush()
+        self.console.print(*objects, **kwargs)
+    
     def show_intent(self, intent: Intent, component_name: str = "") -> None:
         """
         Display inferred intent with confidence indicator.
@@ -63,20 +126,24 @@ class DisplayManager:
         
         name = component_name or intent.component_id
         
-        self.console.print()
-        self.console.print(f"▶ [bold]{name}[/bold]")
-        self.console.print(
-            f"  Intent [{color}]({intent.confidence:.0%} confidence)[/{color}]:"
-        )
-        self.console.print(f'  [italic]"{intent.intent_text}"[/italic]')
+        # Compose every line first so the intent is rendered in one print
+        lines = [
+            "",
+            f"▶ [bold]{name}[/bold]",
+            f"  Intent [{color}]({intent.confidence:.0%} confidence)[/{color}]:",
+            f'  [italic]"{intent.intent_text}"[/italic]',
+        ]
         
         # Show evidence summary
-        if intent.evidence.docstring:
-            self.console.print(f"  [dim]├─ Docstring: ✓[/dim]")
-        if intent.evidence.type_hints:
-            self.console.print(f"  [dim]├─ Type hints: ✓[/dim]")
-        if intent.evidence.naming_signals:
-            self.console.print(f"  [dim]└─ Naming: {', '.join(intent.evidence.naming_signals)}[/dim]")
+        evidence = intent.evidence
+        if evidence.docstring:
+            lines.append("  [dim]├─ Docstring: ✓[/dim]")
+        if evidence.type_hints:
+            lines.append("  [dim]├─ Type hints: ✓[/dim]")
+        if evidence.naming_signals:
+            lines.append(f"  [dim]└─ Naming: {', '.join(evidence.naming_signals)}[/dim]")
+        
+        self._print("\n".join(lines))
     
     def show_test_preview(self, test_file: TestFile) -> None:
         """
@@ -85,12 +152,12 @@ class DisplayManager:
         Args:
             test_file: Generated test file
         """
-        self.console.print()
-        self.console.print(f"  Generated [bold]{len(test_file.test_cases)}[/bold] tests:")
-        
-        for tc in test_file.test_cases:
-            icon = self._get_status_icon(tc.status)
-            self.console.print(f"  {icon} {tc.name}")
+        # Compose every line first so the preview is rendered in one print
+        lines = ["", f"  Generated [bold]{len(test_file.test_cases)}[/bold] tests:"]
+        lines.extend(
+            f"  {self._get_status_icon(tc.status)} {tc.name}" for tc in test_file.test_cases
+        )
+        self._print("\n".join(lines))
     
     def show_test_code(self, test_case: TestCase) -> None:
         """
@@ -99,15 +166,11 @@ class DisplayManager:
         Args:
             test_case: Test case to display
         """
-        syntax = Syntax(
-            test_case.test_code,
-            "python",
-            theme="monokai",
-            line_numbers=True,
-            word_wrap=True,
+        segments = _render_test_code(
+            self.console, test_case.test_code, test_case.name, self.console.width
         )
-        self.console.print()
-        self.console.print(Panel(syntax, title=test_case.name, border_style="dim"))
+        self._print()
+        self._print(Segments(segments), end="")
     
     def show_verification_result(self, result: VerificationResult) -> None:
         """
@@ -116,31 +179,23 @@ class DisplayManager:
         Args:
             result: Verification result
         """
-        self.console.print()
-        self.console.print("Running tests...")
-        
-        for name in result.passed:
-            self.console.print(f"✓ {name} [green]PASSED[/green]")
-        
-        for name in result.failed:
-            self.console.print(f"✗ {name} [red]FAILED[/red]")
-        
-        for name in result.skipped:
-            self.console.print(f"○ {name} [yellow]SKIPPED[/yellow]")
+        # Compose every line first so the results are rendered in one print
+        lines = ["", "Running tests..."]
+        lines.extend(f"✓ {name} [green]PASSED[/green]" for name in result.passed)
+        lines.extend(f"✗ {name} [red]FAILED[/red]" for name in result.failed)
+        lines.extend(f"○ {name} [yellow]SKIPPED[/yellow]" for name in result.skipped)
         
         # Summary
         total = result.total_tests
         passed = len(result.passed)
-        self.console.print()
+        lines.append("")
         
         if result.all_passed:
-            self.console.print(
-                f"[green]All {total} tests passed.[/green]"
-            )
+            lines.append(f"[green]All {total} tests passed.[/green]")
         else:
-            self.console.print(
-                f"[yellow]{passed}/{total} tests passed.[/yellow]"
-            )
+            lines.append(f"[yellow]{passed}/{total} tests passed.[/yellow]")
+        
+        self._print("\n".join(lines))
     
     def show_diagnosis_panel(self, diagnosis: Diagnosis) -> None:
         """
@@ -149,20 +204,8 @@ class DisplayManager:
         Args:
             diagnosis: Diagnosis to display
         """
-        cause_colors = {
-            DiagnosisCause.TEST_WRONG: "yellow",
-            DiagnosisCause.CODE_BUG: "red",
-            DiagnosisCause.INTENT_WRONG: "magenta",
-        }
-        
-        cause_labels = {
-            DiagnosisCause.TEST_WRONG: "Test incorrectly implements intent",
-            DiagnosisCause.CODE_BUG: "Potential bug in source code",
-            DiagnosisCause.INTENT_WRONG: "Intent doesn't match actual behavior",
-        }
-        
-        color = cause_colors.get(diagnosis.cause, "white")
-        label = cause_labels.get(diagnosis.cause, str(diagnosis.cause))
+        color = _CAUSE_COLORS.get(diagnosis.cause, "white")
+        label = _CAUSE_LABELS.get(diagnosis.cause, str(diagnosis.cause))
         
         content = Text()
         content.append(f"{diagnosis.explanation}\n\n")
@@ -179,7 +222,7 @@ class DisplayManager:
             title="Diagnosis",
             border_style=color,
         )
-        self.console.print(panel)
+        self._print(panel)
     
     def show_prompt(self, prompt_text: str, choices: str) -> None:
         """
@@ -189,8 +232,8 @@ class DisplayManager:
             prompt_text: Prompt message
             choices: Available choices (e.g., "[y] Accept  [n] Skip")
         """
-        self.console.print()
-        self.console.print(f"[dim]{choices}[/dim]")
+        self._print()
+        self._print(f"[dim]{choices}[/dim]")
     
     def show_summary_table(self, stats: Dict[str, Any]) -> None:
         """
@@ -199,6 +242,19 @@ class DisplayManager:
         Args:
             stats: Statistics dictionary
         """
+        self._print()
+        self._print(self.build_summary_table(stats))
+    
+    def build_summary_table(self, stats: Dict[str, Any]) -> Table:
+        """
+        Build the summary statistics table without printing it.
+        
+        Args:
+            stats: Statistics dictionary
+            
+        Returns:
+            Table for show_summary_table or a Live display
+        """
         table = Table(title="Generation Summary")
         table.add_column("Metric", style="cyan")
         table.add_column("Value", style="green")
@@ -209,8 +265,7 @@ class DisplayManager:
         table.add_row("Verified", str(stats.get("verified_files", 0)))
         table.add_row("Avg Confidence", f"{stats.get('avg_confidence', 0):.0%}")
         
-        self.console.print()
-        self.console.print(table)
+        return table
     
     def show_test_tree(self, test_files: List[TestFile]) -> None:
         """
@@ -227,8 +282,8 @@ class DisplayManager:
                 icon = self._get_status_icon(tc.status)
                 file_node.add(f"{icon} {tc.name}")
         
-        self.console.print()
-        self.console.print(tree)
+        self._print()
+        self._print(tree)
     
     def show_progress(self, description: str) -> Progress:
         """
@@ -240,38 +295,113 @@ class DisplayManager:
         Returns:
             Progress context manager
         """
-        return Progress(
+        self.flush()
+        return Progress(*self._progress_columns, console=self.console)
+    
+    @functools.cached_property
+    def _progress_columns(self) -> Tuple[ProgressColumn, ...]:
+        """Progress bar columns, built once and reused by every show_progress call."""
+        return (
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=self.console,
         )
     
+    async def track_stream(
+        self,
+        stream: AsyncIterator[Tuple[int, Any]],
+        total: int,
+        description: str,
+        on_result: Optional[Callable[[Any], None]] = None,
+    ) -> List[Any]:
+        """
+        Consume an agent result stream, advancing a progress bar per result.
+        
+        Args:
+            stream: (index, result) pairs in completion order
+            total: Number of results expected
+            description: Progress description
+            on_result: Called with each result as soon as it arrives
+            
+        Returns:
+            Results in their original (index) order
+        """
+        results: List[Any] = [None] * total
+        with self.show_progress(description) as progress:
+            task = progress.add_task(description, total=total)
+            async for index, result in stream:
+                results[index] = result
+                if on_result is not None:
+                    on_result(result)
+                progress.advance(task)
+        return results
+    
     def info(self, message: str) -> None:
         """Display info message."""
         if not self.quiet:
-            self.console.print(f"[blue]ℹ[/blue] {message}")
+            self._print(self._status_line(_INFO_ICON, message))
     
     def success(self, message: str) -> None:
         """Display success message."""
-        self.console.print(f"[green]✓[/green] {message}")
+        self._print(self._status_line(_SUCCESS_ICON, message))
     
     def warning(self, message: str) -> None:
         """Display warning message."""
-        self.console.print(f"[yellow]⚠[/yellow] {message}")
+        self._print(self._status_line(_WARNING_ICON, message))
     
     def error(self, message: str) -> None:
         """Display error message."""
-        self.console.print(f"[red]✗[/red] {message}")
+        self._print(self._status_line(_ERROR_ICON, message))
+    
+    def _status_line(self, icon: Text, message: str) -> Text:
+        """Prefix a message with an icon, rendering the message as console.print would."""
+        return Text.assemble(icon, " ", self.console.render_str(message))
     
     def _get_status_icon(self, status: TestStatus) -> str:
         """Get icon for test status."""
-        icons = {
-            TestStatus.PENDING: "○",
-            TestStatus.PASSED: "[green]✓[/green]",
-            TestStatus.FAILED: "[red]✗[/red]",
-            TestStatus.SKIPPED: "[yellow]○[/yellow]",
-            TestStatus.XFAIL: "[magenta]○[/magenta]",
-        }
-        return icons.get(status, "?")
+        return _STATUS_ICONS.get(status, "?")
+
+
+class BufferedDisplay(DisplayManager):
+    """
+    DisplayManager that batches status messages into a single console write.
+    
+    info/success/warning messages are collected and printed together on
+    flush(), on leaving the context manager, or before any other output.
+    DisplayManager flushes before every print and progress bar, so panels,
+    tables and errors keep their order without being listed here.
+    
+    Usage:
+        with BufferedDisplay() as display:
+            display.info("...")
+    """
+    
+    def __init__(self, quiet: bool = False):
+        super().__init__(quiet=quiet)
+        self._buf: List[Text] = []
+    
+    def __enter__(self) -> "BufferedDisplay":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+    
+    def flush(self) -> None:
+        """Print all buffered messages with one console call."""
+        if self._buf:
+            self.console.print(Text("\n").join(self._buf))
+            self._buf.clear()
+    
+    def info(self, message: str) -> None:
+        """Buffer info message."""
+        if not self.quiet:
+            self._buf.append(self._status_line(_INFO_ICON, message))
+    
+    def success(self, message: str) -> None:
+        """Buffer success message."""
+        self._buf.append(self._status_line(_SUCCESS_ICON, message))
+    
+    def warning(self, message: str) -> None:
+        """Buffer warning message."""
+        self._buf.append(self._status_line(_WARNING_ICON, message))
@@ -4,12 +4,14 @@ Code2Test Interactive CLI Module
 Claude Code-style interactive prompts for test generation.
 """
 
+import sys
 import asyncio
+import threading
 from typing import Dict, List, Any, Optional, Callable
 from enum import Enum
 
 import click
-from rich.console import Console
+from rich.live import Live
 from rich.prompt import Prompt, Confirm
 
 from code2test.core.models import (
@@ -23,6 +25,16 @@ from code2test.core.models import (
 from code2test.cli.display import DisplayManager
 
 
+# Above this many intents to review, they are reviewed in one editor session
+BATCH_REVIEW_THRESHOLD = 20
+
+BATCH_REVIEW_HEADER = """\
+# Review the inferred intents, then save and close the editor.
+# Set action to y (accept) or n (skip) and edit any intent text in place.
+# Deleting an entry skips that component.
+"""
+
+
 class UserAction(str, Enum):
     """User actions for interactive prompts."""
     ACCEPT = "accept"
@@ -50,12 +62,13 @@ class InteractiveSession:
             display: Display manager for output
         """
         self.display = display or DisplayManager()
-        self.console = Console()
+        self.console = self.display.console
     
     def present_intent(
         self,
         intent: Intent,
-        component_name: str = ""
+        component_name: str = "",
+        low_confidence: Optional[bool] = None
     ) -> UserAction:
         """
         Present inferred intent and get user action.
@@ -63,23 +76,23 @@ class InteractiveSession:
         Args:
             intent: Inferred intent
             component_name: Name of the component
+            low_confidence: Result of intent.needs_clarification() if the
+                            caller has already evaluated it
             
         Returns:
             User's chosen action
         """
         self.display.show_intent(intent, component_name)
         
-        if intent.needs_clarification():
+        if low_confidence is None:
+            low_confidence = intent.needs_clarification()
+        if low_confidence:
             self.display.warning(f"Low confidence ({intent.confidence:.0%})")
         
         choices = "[y] Accept  [n] Skip  [e] Edit intent"
         self.display.show_prompt("", choices)
         
-        choice = Prompt.ask(
-            ">",
-            choices=["y", "n", "e"],
-            default="y" if intent.confidence >= 0.8 else "n"
-        )
+        choice = self._choose("yne", default="y" if intent.confidence >= 0.8 else "n")
         
         if choice == "y":
             return UserAction.ACCEPT
@@ -108,11 +121,7 @@ class InteractiveSession:
         choices = "[y] Accept  [n] Skip  [e] Edit  [r] Run first  [i] Edit intent"
         self.display.show_prompt("", choices)
         
-        choice = Prompt.ask(
-            ">",
-            choices=["y", "n", "e", "r", "i"],
-            default="r"
-        )
+        choice = self._choose("yneri", default="r")
         
         if choice == "y":
             return UserAction.ACCEPT
@@ -175,17 +184,17 @@ class InteractiveSession:
         # Show appropriate choices based on diagnosis
         if diagnosis.cause == DiagnosisCause.TEST_WRONG:
             choices = "[f] Fix test  [k] Keep (xfail)  [s] Skip"
-            valid_choices = ["f", "k", "s"]
+            valid_choices = "fks"
         elif diagnosis.cause == DiagnosisCause.CODE_BUG:
             choices = "[b] Flag as bug  [f] Fix test anyway  [s] Skip"
-            valid_choices = ["b", "f", "s"]
+            valid_choices = "bfs"
         else:  # INTENT_WRONG
             choices = "[i] Edit intent  [f] Fix test  [s] Skip"
-            valid_choices = ["i", "f", "s"]
+            valid_choices = "ifs"
         
         self.display.show_prompt("", choices)
         
-        choice = Prompt.ask(">", choices=valid_choices, default="s")
+        choice = self._choose(valid_choices, default="s")
         
         if choice == "f":
             return UserAction.FIX
@@ -198,6 +207,32 @@ class InteractiveSession:
         else:
             return UserAction.SKIP
     
+    def _choose(self, valid: str, default: str) -> str:
+        """
+        Read a single-key choice without waiting for Enter.
+        
+        click.getchar needs a terminal, so piped or scripted input falls
+        back to a line-based prompt on stdin.
+        
+        Args:
+            valid: Accepted keys, one character each
+            default: Key chosen by pressing Enter
+            
+        Returns:
+            The chosen key
+        """
+        if not sys.stdin.isatty():
+            return Prompt.ask(">", choices=list(valid), default=default)
+        
+        self.console.print(f"> [dim]({default})[/dim] ", end="")
+        while True:
+            key = click.getchar().lower()
+            if key in ("\r", "\n"):
+                key = default
+            if len(key) == 1 and key in valid:
+                self.console.print(key)
+                return key
+    
     def request_intent_clarification(
         self,
         intent: Intent,
@@ -252,6 +287,63 @@ class InteractiveSession:
         
         return new_intent.strip()
     
+    def batch_review_intents(self, intents: List[Intent]) -> Optional[List[UserAction]]:
+        """
+        Review many intents in one editor session instead of one prompt each.
+        
+        Intents are written to a YAML document, one entry per intent with
+        its action preset as present_intent would default it, and opened in
+        $EDITOR. Edited intent text is applied to the intent in place.
+        Entries deleted from the document are skipped.
+        
+        Args:
+            intents: Intents to review
+            
+        Returns:
+            ACCEPT or SKIP per intent, aligned with intents, or None if the
+            edited document could not be read
+        """
+        import yaml
+        
+        entries = [
+            {
+                "component": intent.component_id,
+                "confidence": round(intent.confidence, 2),
+                "action": "y" if intent.confidence >= 0.8 else "n",
+                "intent": intent.intent_text,
+            }
+            for intent in intents
+        ]
+        document = yaml.safe_dump(entries, sort_keys=False, allow_unicode=True, width=100)
+        
+        edited = click.edit(BATCH_REVIEW_HEADER + document, extension=".yaml")
+        if edited is None:
+            # Saved unchanged: take the preset actions
+            edited = document
+        
+        try:
+            reviewed = yaml.safe_load(edited) or []
+            by_component = {str(entry["component"]): entry for entry in reviewed}
+        except (yaml.YAMLError, TypeError, KeyError) as e:
+            self.display.error(f"Could not read the reviewed intents: {e}")
+            return None
+        
+        actions = []
+        for intent in intents:
+            entry = by_component.get(intent.component_id)
+            # YAML reads yes/no/true/false as booleans
+            choice = str(entry.get("action", "n")).strip().lower() if entry else "n"
+            if choice not in ("y", "yes", "true"):
+                actions.append(UserAction.SKIP)
+                continue
+            
+            new_text = str(entry.get("intent") or "").strip()
+            if new_text and new_text != intent.intent_text:
+                intent.update_intent(new_text)
+            actions.append(UserAction.ACCEPT)
+        
+        return actions
+    
     def confirm_save(self, path: str) -> bool:
         """
         Confirm saving to a path.
@@ -285,10 +377,52 @@ class InteractiveSession:
         )
 
 
+async def _prompt(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a blocking prompt without stalling the event loop.
+    
+    The prompt runs on a daemon thread rather than asyncio.to_thread's
+    executor, which is joined on shutdown: after Ctrl-C the executor
+    would wait for a thread still blocked reading stdin.
+    
+    Args:
+        func: Prompt function to call
+        *args: Arguments for func
+        
+    Returns:
+        Whatever func returns
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def resolve(result: Any, error: Optional[BaseException]) -> None:
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def target() -> None:
+        try:
+            result, error = func(*args), None
+        except BaseException as e:
+            result, error = None, e
+        try:
+            loop.call_soon_threadsafe(resolve, result, error)
+        except RuntimeError:
+            # Loop already closed, e.g. after Ctrl-C
+            pass
+    
+    threading.Thread(target=target, daemon=True).start()
+    return await future
+
+
 def run_interactive_generation(
     generator,
     components: Dict[str, Any],
-    auto_accept: bool = False
+    auto_accept: bool = False,
+    review_in_editor: Optional[bool] = None
 ) -> None:
     """
     Run interactive test generation session.
@@ -297,6 +431,8 @@ def run_interactive_generation(
         generator: TestGenerator instance
         components: Components to generate tests for
         auto_accept: Auto-accept high confidence results
+        review_in_editor: Review intents in one $EDITOR session; by default
+                          only when more than BATCH_REVIEW_THRESHOLD need review
     """
     session = InteractiveSession()
     display = session.display
@@ -310,60 +446,122 @@ def run_interactive_generation(
         skipped = 0
         generated = 0
         
+        # Review every intent up front so that test generation for the
+        # accepted components can then run concurrently
+        extracted = []
         for comp_id, component in components.items():
-            # Extract intent
             intent = generator.intent_extractor.extract_intent(component, {})
-            
+            extracted.append((comp_id, component, intent))
+        
+        # Evaluated once per intent and reused for the low-confidence warning
+        low_confidence = [intent.needs_clarification() for _, _, intent in extracted]
+        to_review = [
+            i for i, flagged in enumerate(low_confidence)
+            if not auto_accept or flagged
+        ]
+        
+        review_actions: Dict[int, UserAction] = {}
+        use_editor = review_in_editor if review_in_editor is not None else (
+            len(to_review) > BATCH_REVIEW_THRESHOLD
+        )
+        if use_editor and to_review:
+            actions = session.batch_review_intents([extracted[i][2] for i in to_review])
+            if actions is not None:
+                review_actions = dict(zip(to_review, actions))
+        
+        for i in to_review:
+            if i in review_actions:
+                continue
             # Present intent
-            if not auto_accept or intent.needs_clarification():
-                action = session.present_intent(intent, component.get("name", ""))
-                
-                if action == UserAction.SKIP:
-                    skipped += 1
-                    continue
-                elif action == UserAction.EDIT_INTENT:
-                    new_text = session.edit_intent(intent)
-                    intent.update_intent(new_text)
-            
-            # Generate tests
-            test_file = await generator.test_agent.generate_unit_tests(
-                component, intent
+            comp_id, component, intent = extracted[i]
+            action = session.present_intent(
+                intent, component.get("name", ""), low_confidence=low_confidence[i]
             )
             
-            if not test_file.test_cases:
-                display.warning(f"No tests generated for {comp_id}")
+            if action == UserAction.EDIT_INTENT:
+                new_text = session.edit_intent(intent)
+                intent.update_intent(new_text)
+                action = UserAction.ACCEPT
+            review_actions[i] = action
+        
+        comp_ids: List[str] = []
+        accepted_components: List[Any] = []
+        accepted_intents: List[Intent] = []
+        for i, (comp_id, component, intent) in enumerate(extracted):
+            if review_actions.get(i, UserAction.ACCEPT) == UserAction.SKIP:
+                skipped += 1
                 continue
-            
-            # Present tests
-            if not auto_accept:
-                action = session.present_tests(test_file, intent)
-                
-                if action == UserAction.SKIP:
-                    skipped += 1
-                    continue
-                elif action == UserAction.RUN:
-                    # Run verification
-                    result = generator.verifier.run_tests(test_file)
-                    action = session.present_verification_result(result, test_file)
+            comp_ids.append(comp_id)
+            accepted_components.append(component)
+            accepted_intents.append(intent)
+        
+        # Generate tests, presenting each file as soon as it is ready while
+        # the remaining requests stay in flight
+        stream = generator.test_agent.stream_unit_tests(
+            accepted_components,
+            accepted_intents,
+            generator.config.framework,
+            generator.config.max_concurrency,
+        )
+        
+        # The summary stays live while waiting on generation and is hidden
+        # while the user is prompted; its final state is left on screen
+        stats = {"total_intents": len(components), "total_test_files": 0, "skipped": skipped}
+        live = Live(
+            display.build_summary_table(stats),
+            console=session.console,
+            auto_refresh=False,
+            transient=True,
+        )
+        live.start(refresh=True)
+        try:
+            async for index, test_file in stream:
+                live.stop()
+                comp_id = comp_ids[index]
+                intent = accepted_intents[index]
+                try:
+                    if isinstance(test_file, Exception):
+                        display.warning(f"Test generation failed for {comp_id}: {test_file}")
+                        continue
                     
-                    if action != UserAction.ACCEPT:
-                        # Handle failures
-                        for tc in test_file.test_cases:
-                            if tc.diagnosis:
-                                session.present_diagnosis(tc.diagnosis, tc)
-            
-            # Save test file
-            if session.confirm_save(test_file.path):
-                generator.verifier.write_test_file(test_file)
-                generator.test_registry.register_test(test_file)
-                generated += 1
-                display.success(f"Saved {test_file.path}")
-        
-        # Show summary
-        display.show_summary_table({
-            "total_intents": len(components),
-            "total_test_files": generated,
-            "skipped": skipped,
-        })
+                    if not test_file.test_cases:
+                        display.warning(f"No tests generated for {comp_id}")
+                        continue
+                    
+                    # Prompts and the test run are awaited off the loop
+                    # thread, so the requests in flight keep advancing
+                    if not auto_accept:
+                        action = await _prompt(session.present_tests, test_file, intent)
+                        
+                        if action == UserAction.SKIP:
+                            skipped += 1
+                            continue
+                        elif action == UserAction.RUN:
+                            # Run verification
+                            result = await generator.verifier.run_tests_async(test_file)
+                            action = await _prompt(
+                                session.present_verification_result, result, test_file
+                            )
+                            
+                            if action != UserAction.ACCEPT:
+                                # Handle failures
+                                for tc in test_file.test_cases:
+                                    if tc.diagnosis:
+                                        await _prompt(session.present_diagnosis, tc.diagnosis, tc)
+                    
+                    # Save test file
+                    if await _prompt(session.confirm_save, test_file.path):
+                        generator.verifier.write_test_file(test_file)
+                        generator.test_registry.register_test(test_file)
+                        generated += 1
+                        display.success(f"Saved {test_file.path}")
+                finally:
+                    stats["total_test_files"] = generated
+                    stats["skipped"] = skipped
+                    live.update(display.build_summary_table(stats))
+                    live.start(refresh=True)
+        finally:
+            live.transient = False
+            live.stop()
     
     asyncio.run(run())
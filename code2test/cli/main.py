@@ -3,13 +3,53 @@ Main CLI application for Code2Test using Click framework.
 """
 
 import sys
+import importlib
+from typing import Dict, List, Optional
+
 import click
 from pathlib import Path
 
 from code2test import __version__
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """
+    Click group that imports a subcommand's module only when it is needed.
+    
+    Command modules pull in the agents, analyzers and storage layers, so
+    `code2test --version` or a single subcommand should not import them all.
+    """
+    
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # command name -> "module:attribute"
+        self.lazy_commands = lazy_commands or {}
+    
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+    
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attribute = self.lazy_commands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attribute)
+            self.add_command(command, name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_commands={
+        "config": "code2test.cli.commands.config:config_group",
+        "generate": "code2test.cli.commands.generate:generate_command",  # Legacy docs command
+        # Test generation commands
+        "test": "code2test.cli.commands.test:test_command",
+        "verify": "code2test.cli.commands.verify:verify_command",
+        "intent": "code2test.cli.commands.intent:intent_command",
+        "report": "code2test.cli.commands.report:report_command",
+        "init": "code2test.cli.commands.init:init_command",
+        "batch": "code2test.cli.commands.batch:batch_group",
+    },
+)
 @click.version_option(version=__version__, prog_name="Code2Test")
 @click.pass_context
 def cli(ctx):
@@ -28,6 +68,28 @@ def cli(ctx):
     """
     # Ensure context object exists
     ctx.ensure_object(dict)
+    
+    # Runs only when a subcommand is invoked; --help and --version exit earlier
+    _use_uvloop()
+
+
+def _use_uvloop() -> None:
+    """
+    Make every asyncio.run() in the commands use uvloop, when installed
+    (pip install 'code2test[fast]').
+    
+    uvloop schedules tasks several times faster than the default loop.
+    asyncio and uvloop are imported here rather than at module level so
+    that --help and --version skip them.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    
+    import asyncio
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 @cli.command()
@@ -38,27 +100,6 @@ def version():
     click.echo("Built on FSoft AI4Code's CodeWiki framework")
     
 
-# Import commands
-from code2test.cli.commands.config import config_group
-from code2test.cli.commands.generate import generate_command
-from code2test.cli.commands.test import test_command
-from code2test.cli.commands.verify import verify_command
-from code2test.cli.commands.intent import intent_command
-from code2test.cli.commands.report import report_command
-from code2test.cli.commands.init import init_command
-
-# Register command groups
-cli.add_command(config_group)
-cli.add_command(generate_command, name="generate")  # Legacy docs command
-
-# Register new test generation commands
-cli.add_command(test_command)      # code2test test
-cli.add_command(verify_command)    # code2test verify
-cli.add_command(intent_command)    # code2test intent
-cli.add_command(report_command)    # code2test report
-cli.add_command(init_command)      # code2test init
-
-
 def main():
     """Entry point for the CLI."""
     try:
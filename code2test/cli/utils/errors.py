@@ -11,6 +11,7 @@ Exit Codes:
 """
 
 import sys
+import traceback
 import click
 from typing import Optional
 
@@ -78,7 +79,6 @@ def handle_error(error: Exception, verbose: bool = False) -> int:
     else:
         click.secho(f"\n✗ Unexpected error: {error}", fg="red", err=True)
         if verbose:
-            import traceback
             click.echo(traceback.format_exc(), err=True)
         return EXIT_GENERAL_ERROR
 
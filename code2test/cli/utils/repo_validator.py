@@ -182,6 +182,6 @@ def count_code_files(repo_path: Path) -> int:
     """
     count = 0
     for ext in SUPPORTED_EXTENSIONS:
-        count += len(list(repo_path.rglob(f"*{ext}")))
+        count += sum(1 for _ in repo_path.rglob(f"*{ext}"))
     return count
 
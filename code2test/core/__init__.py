@@ -4,6 +4,8 @@ Code2Test Core Module
 Core functionality for intent-first test generation.
 """
 
+import importlib
+
 from code2test.core.models import (
     Intent,
     IntentEvidence,
@@ -17,9 +19,15 @@ from code2test.core.models import (
     VerificationResult,
     GenerationConfig,
 )
-from code2test.core.intent import IntentExtractor
-from code2test.core.verifier import TestVerifier
-from code2test.core.generator import TestGenerator
+
+# The core classes pull in the agents, adapters and LLM SDKs, so they are
+# imported on first access (PEP 562); importing code2test.core.models for
+# the data types stays cheap
+_LAZY_CLASSES = {
+    "IntentExtractor": "code2test.core.intent",
+    "TestVerifier": "code2test.core.verifier",
+    "TestGenerator": "code2test.core.generator",
+}
 
 __all__ = [
     # Models
@@ -39,3 +47,17 @@ __all__ = [
     "TestVerifier",
     "TestGenerator",
 ]
+
+
+def __getattr__(name):
+    module_path = _LAZY_CLASSES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    cls = getattr(importlib.import_module(module_path), name)
+    globals()[name] = cls
+    return cls
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,7 +4,9 @@ Assertion Pattern Library.
 Provides a standardized way to generate assertions across different languages/frameworks.
 """
 
-from typing import Any, Dict, Optional
+import functools
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
 
 class AssertionLibrary:
     """Library of assertion patterns for different frameworks."""
@@ -42,6 +44,33 @@ class AssertionLibrary:
         }
     }
     
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _compiled_for(cls, framework: str) -> Dict[str, Callable[..., str]]:
+        """
+        Bind a framework's patterns the first time it is used.
+        
+        The cache sits under the classmethod, so it is keyed on
+        (cls, framework): a subclass with its own PATTERNS gets its own
+        entries.
+        
+        Args:
+            framework: Lowercase test framework name
+            
+        Returns:
+            Assertion type -> the pattern's bound str.format, which takes
+            actual and expected as keyword arguments
+            
+        Raises:
+            ValueError: If the framework is unknown
+        """
+        if framework not in cls.PATTERNS:
+            raise ValueError(f"Unknown framework: {framework}")
+        return {
+            type: pattern.format
+            for type, pattern in cls.PATTERNS[framework].items()
+        }
+    
     @classmethod
     def get_assertion(cls, framework: str, type: str, actual: str, expected: str = "") -> str:
         """
@@ -56,14 +85,27 @@ class AssertionLibrary:
         Returns:
             Formatted assertion string
         """
-        framework = framework.lower()
-        if framework not in cls.PATTERNS:
-            raise ValueError(f"Unknown framework: {framework}")
-            
-        patterns = cls.PATTERNS[framework]
-        if type not in patterns:
-            # Fallback to equality if unknown
-            type = "equal"
+        compiled = cls._compiled_for(framework.lower())
+        # Fallback to equality if unknown
+        render = compiled.get(type) or compiled["equal"]
+        
+        return render(actual=actual, expected=expected)
+    
+    @classmethod
+    def render_many(cls, framework: str, specs: Iterable[Tuple[str, str, str]]) -> str:
+        """
+        Render a block of assertions for one framework.
+        
+        Args:
+            framework: Test framework (pytest, jest, junit)
+            specs: (type, actual, expected) per assertion, as for get_assertion
             
-        pattern = patterns[type]
-        return pattern.format(actual=actual, expected=expected)
+        Returns:
+            The assertions, one per line, each followed by a newline
+        """
+        compiled = cls._compiled_for(framework.lower())
+        equal = compiled["equal"]
+        return "".join(
+            f"{compiled.get(type, equal)(actual=actual, expected=expected)}\n"
+            for type, actual, expected in specs
+        )
@@ -4,8 +4,8 @@ Code2Test Generator
 Main orchestrator for the test generation pipeline.
 """
 
+import os
 import logging
-import asyncio
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Callable
 
@@ -20,8 +20,10 @@ from code2test.core.models import (
 )
 from code2test.core.intent import IntentExtractor
 from code2test.core.verifier import TestVerifier
-from code2test.storage.intent_db import IntentDatabase
-from code2test.storage.test_registry import TestRegistry
+from code2test.storage.connection import close_all, open_shared_db
+from code2test.storage.llm_cache import LLMCache
+from code2test.storage.semantic_cache import SemanticCache
+from code2test.agents.base_agent import gather_bounded
 from code2test.agents.intent_agent import IntentAgent
 from code2test.agents.test_agent import TestAgent
 from code2test.agents.diagnosis_agent import DiagnosisAgent
@@ -62,10 +64,19 @@ class TestGenerator:
         
         # Initialize components
         self.intent_extractor = IntentExtractor(self.config.confidence_threshold)
-        self.intent_db = IntentDatabase(db_path)
-        self.test_registry = TestRegistry(db_path)
+        self.intent_db, self.test_registry = open_shared_db(db_path)
         self.verifier = TestVerifier(str(repo_path))
         
+        # Cache of LLM outputs so unchanged components skip the API entirely
+        self.llm_cache: Optional[LLMCache] = None
+        if self.config.use_llm_cache:
+            self.llm_cache = LLMCache(str(Path(db_path).parent / "llm_cache.db"))
+        
+        # Opt-in: reuse outputs for near-identical prompts (boilerplate components)
+        self.semantic_cache: Optional[SemanticCache] = None
+        if self.config.semantic_cache:
+            self.semantic_cache = SemanticCache(str(Path(db_path).parent / "semantic_cache.db"))
+        
         # LLM agents (lazy init)
         self._intent_agent: Optional[IntentAgent] = None
         self._test_agent: Optional[TestAgent] = None
@@ -76,22 +87,40 @@ class TestGenerator:
         self.on_test_generated: Optional[Callable[[TestFile], None]] = None
         self.on_verification_complete: Optional[Callable[[VerificationResult], None]] = None
     
+    def __enter__(self) -> "TestGenerator":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close this thread's database connections; they reopen on next use."""
+        close_all()
+    
     @property
     def intent_agent(self) -> IntentAgent:
         if self._intent_agent is None:
-            self._intent_agent = IntentAgent(model=self.config.model)
+            self._intent_agent = IntentAgent(
+                model=self.config.model,
+                cache=self.llm_cache,
+                semantic_cache=self.semantic_cache,
+            )
         return self._intent_agent
     
     @property
     def test_agent(self) -> TestAgent:
         if self._test_agent is None:
-            self._test_agent = TestAgent(model=self.config.model)
+            self._test_agent = TestAgent(model=self.config.model, cache=self.llm_cache)
         return self._test_agent
     
     @property
     def diagnosis_agent(self) -> DiagnosisAgent:
         if self._diagnosis_agent is None:
-            self._diagnosis_agent = DiagnosisAgent()
+            self._diagnosis_agent = DiagnosisAgent(
+                cache=self.llm_cache,
+                semantic_cache=self.semantic_cache,
+                strong_model=self.config.diagnosis_strong_model,
+            )
         return self._diagnosis_agent
     
     async def generate_tests_for_module(
@@ -148,43 +177,76 @@ class TestGenerator:
         logger.info("Phase 1: Extracting intents...")
         intents: Dict[str, Intent] = {}
         
-        # Process in dependency order (leaves first)
+        # In auto-accept mode low-confidence intents are never sent to the LLM
+        ask_llm = not self.config.auto_accept
+        threshold = self.config.confidence_threshold
+        
+        # Load every stored intent up front instead of one query per component
+        stored = self.intent_db.get_intents_bulk(list(components))
+        
+        # Components are processed in dependency order (leaves first) and see
+        # the intents of the dependencies that precede them. Layering them by
+        # those dependencies lets each layer's LLM calls run concurrently.
+        earlier_deps: Dict[str, List[str]] = {}
+        depth: Dict[str, int] = {}
+        layers: List[List[str]] = []
         for comp_id, component in components.items():
-            # Check if intent already exists
-            existing = self.intent_db.get_intent(comp_id)
-            if existing and existing.user_edited:
-                intents[comp_id] = existing
-                continue
-            
-            # Get dependency intents for context
-            dep_intents = {
-                dep: intents.get(dep)
-                for dep in component.get("dependencies", [])
-                if dep in intents
-            }
-            
-            # Extract using static analysis first
-            intent = self.intent_extractor.extract_intent(component, dep_intents)
+            earlier_deps[comp_id] = [
+                dep for dep in component.get("dependencies", []) if dep in depth
+            ]
+            depth[comp_id] = max((depth[dep] + 1 for dep in earlier_deps[comp_id]), default=0)
+            if depth[comp_id] == len(layers):
+                layers.append([])
+            layers[depth[comp_id]].append(comp_id)
+        
+        for layer in layers:
+            extracted: List[str] = []
+            pending: List[str] = []
+            dep_intents_by_id: Dict[str, Dict[str, Intent]] = {}
             
-            # If low confidence and not auto-accept, use LLM
-            if intent.needs_clarification(self.config.confidence_threshold):
-                if not self.config.auto_accept:
-                    # Use LLM for better inference
-                    try:
-                        intent = await self.intent_agent.infer_intent(component, {
-                            "dependencies": list(dep_intents.keys())
-                        })
-                    except Exception as e:
-                        logger.warning(f"LLM intent inference failed: {e}")
+            for comp_id in layer:
+                # Check if intent already exists
+                existing = stored.get(comp_id)
+                if existing and existing.user_edited:
+                    intents[comp_id] = existing
+                    continue
+                
+                # Get dependency intents for context; earlier layers have
+                # already stored an intent for every one of them
+                dep_intents = {dep: intents[dep] for dep in earlier_deps[comp_id]}
+                dep_intents_by_id[comp_id] = dep_intents
+                
+                # Extract using static analysis first
+                intent = self.intent_extractor.extract_intent(components[comp_id], dep_intents)
+                intents[comp_id] = intent
+                extracted.append(comp_id)
+                
+                # If low confidence and not auto-accept, use LLM
+                if ask_llm and intent.needs_clarification(threshold):
+                    pending.append(comp_id)
             
-            intents[comp_id] = intent
-            self.intent_db.save_intent(intent)
+            if pending:
+                # Use LLM for better inference, concurrently across the layer
+                inferred = await self.intent_agent.infer_intents_batch(
+                    [components[comp_id] for comp_id in pending],
+                    [{"dependencies": list(dep_intents_by_id[comp_id])} for comp_id in pending],
+                    self.config.max_concurrency,
+                )
+                for comp_id, intent in zip(pending, inferred):
+                    if isinstance(intent, Exception):
+                        logger.warning(f"LLM intent inference failed: {intent}")
+                    else:
+                        intents[comp_id] = intent
             
-            if self.on_intent_extracted:
-                self.on_intent_extracted(intent)
+            for comp_id in extracted:
+                self.intent_db.save_intent(intents[comp_id])
+                
+                if self.on_intent_extracted:
+                    self.on_intent_extracted(intents[comp_id])
         
         logger.info(f"Extracted {len(intents)} intents")
-        return intents
+        # Keep the caller's component order rather than layer order
+        return {comp_id: intents[comp_id] for comp_id in components}
     
     async def _generate_tests_phase(
         self,
@@ -202,63 +264,67 @@ class TestGenerator:
             List of generated test files
         """
         logger.info("Phase 2: Generating tests...")
-        test_files: List[TestFile] = []
+        if not components:
+            return []
         
-        logger.info("Phase 2: Generating tests...")
-        test_files: List[TestFile] = []
+        # Load every registered test up front instead of one query per component
+        registered = self.test_registry.get_tests_for_components_bulk(list(components))
         
-        # Concurrency limit
-        semaphore = asyncio.Semaphore(5)
+        auto_accept = self.config.auto_accept
+        threshold = self.config.confidence_threshold
         
         async def process_component(comp_id: str, component: Dict[str, Any]) -> Optional[TestFile]:
-            async with semaphore:
-                intent = intents.get(comp_id)
-                if not intent:
-                    return None
-                
-                # Incremental check: if verified test exists and intent hasn't changed, skip
-                # This is a basic check. Ideally we'd compare timestamps or hashes.
-                existing_test_files = self.test_registry.get_tests_for_component(comp_id)
-                if existing_test_files:
-                     # For now, if we have any existing test, simpler logic:
-                     # If verified, skip.
-                     # If auto-mode and verified, definitely skip.
-                     is_verified = any(t.verified for t in existing_test_files)
-                     if is_verified and self.config.auto_accept:
-                         logger.info(f"Skipping {comp_id} (already verified)")
-                         return None
+            intent = intents[comp_id]
+            
+            # Incremental check: if verified test exists and intent hasn't changed, skip
+            # This is a basic check. Ideally we'd compare timestamps or hashes.
+            existing_test_files = registered.get(comp_id)
+            if existing_test_files:
+                 # For now, if we have any existing test, simpler logic:
+                 # If verified, skip.
+                 # If auto-mode and verified, definitely skip.
+                 is_verified = any(t.verified for t in existing_test_files)
+                 if is_verified and auto_accept:
+                     logger.info(f"Skipping {comp_id} (already verified)")
+                     return None
 
-                # Skip low-confidence intents in auto mode
-                if self.config.auto_accept and intent.confidence < self.config.confidence_threshold:
-                    logger.info(f"Skipping {comp_id} (low confidence: {intent.confidence:.0%})")
-                    return None
+            # Skip low-confidence intents in auto mode
+            if auto_accept and intent.needs_clarification(threshold):
+                logger.info(f"Skipping {comp_id} (low confidence: {intent.confidence:.0%})")
+                return None
+            
+            try:
+                test_file = await self.test_agent.generate_unit_tests(
+                    component,
+                    intent,
+                    self.config.framework,
+                )
+                
+                if test_file.test_cases:
+                    self.test_registry.register_test(test_file)
+                    if self.on_test_generated:
+                        self.on_test_generated(test_file)
+                    return test_file
+                        
+            except Exception as e:
+                logger.error(f"Test generation failed for {comp_id}: {e}")
+                return None
                 
-                try:
-                    test_file = await self.test_agent.generate_unit_tests(
-                        component,
-                        intent,
-                        self.config.framework,
-                    )
-                    
-                    if test_file.test_cases:
-                        self.test_registry.register_test(test_file)
-                        if self.on_test_generated:
-                            self.on_test_generated(test_file)
-                        return test_file
-                            
-                except Exception as e:
-                    logger.error(f"Test generation failed for {comp_id}: {e}")
-                    return None
-                    
-        # Create tasks
-        tasks = [
-            process_component(cid, comp) 
+        # Only components that have an intent get a call
+        calls = [
+            (cid, comp)
             for cid, comp in components.items()
+            if cid in intents
         ]
         
-        # Run tasks
-        results = await asyncio.gather(*tasks)
-        test_files = [r for r in results if r is not None]
+        # Run calls on a bounded pool of workers
+        results = await gather_bounded(process_component, calls, self.config.max_concurrency)
+        test_files = []
+        for (comp_id, _), result in zip(calls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Test generation failed for {comp_id}: {result}")
+            elif result is not None:
+                test_files.append(result)
         
         logger.info(f"Generated {len(test_files)} test files")
         return test_files
@@ -282,15 +348,15 @@ class TestGenerator:
         """
         logger.info("Phase 3: Verifying tests...")
         
-        for test_file in test_files:
+        async def verify_one(test_file: TestFile) -> None:
             # Validate syntax first
             valid, error = self.verifier.validate_syntax(test_file)
             if not valid:
                 logger.warning(f"Syntax error in {test_file.path}: {error}")
-                continue
+                return
             
-            # Run tests
-            result = self.verifier.run_tests(test_file)
+            # Run tests as an asyncio subprocess so files verify side by side
+            result = await self.verifier.run_tests_async(test_file)
             
             if self.on_verification_complete:
                 self.on_verification_complete(result)
@@ -319,6 +385,16 @@ class TestGenerator:
                 test_file.verified = True
                 self.test_registry.mark_verified(test_file.path)
         
+        # Test files are independent, so run up to one pytest process per CPU
+        results = await gather_bounded(
+            verify_one,
+            [(test_file,) for test_file in test_files],
+            os.cpu_count() or 1,
+        )
+        for test_file, result in zip(test_files, results):
+            if isinstance(result, Exception):
+                logger.error(f"Verification failed for {test_file.path}: {result}")
+        
         return test_files
     
     def get_stats(self) -> Dict[str, Any]:
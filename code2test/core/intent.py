@@ -7,8 +7,12 @@ Delegates to language-specific analyzers.
 
 import re
 import os
+import itertools
+from collections import OrderedDict
+from collections.abc import Mapping
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
+from datetime import datetime
 
 from code2test.core.models import Intent, IntentEvidence
 from code2test.core.intent_analyzers import (
@@ -19,6 +23,62 @@ from code2test.core.intent_analyzers import (
 )
 
 
+# Mentions of error handling anywhere in a component's text fields
+_ERROR_HANDLING_RE = re.compile("exception|error", re.IGNORECASE)
+
+# Words in a docstring, as str.split() would separate them
+_WORD_RE = re.compile(r"\S+")
+
+# Docstring length in words at which its weight stops growing
+DOCSTRING_FULL_WEIGHT_WORDS = 20
+
+# Extracted intents kept per IntentExtractor, least recently used dropped first
+INTENT_MEMO_SIZE = 4096
+
+# A behavior with the lowercase name prefixes and the regex that detect it
+NamingRule = Tuple[str, Tuple[str, ...], Optional[re.Pattern]]
+
+
+def _mentions_error(value: Any) -> bool:
+    """Search strings, mapping keys and values, and collection items, recursively."""
+    if isinstance(value, str):
+        return _ERROR_HANDLING_RE.search(value) is not None
+    if isinstance(value, Mapping):
+        return any(_mentions_error(k) or _mentions_error(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return any(_mentions_error(item) for item in value)
+    return False
+
+
+def compile_naming_patterns(patterns: Dict[str, str]) -> List[NamingRule]:
+    """
+    Turn an analyzer's naming patterns into prefix checks.
+    
+    Patterns are alternations of "^prefix" branches matched case-insensitively,
+    so each literal branch reduces to a startswith check on the lowercased
+    name. Branches using any other regex syntax are kept as one compiled regex.
+    
+    Args:
+        patterns: Regex pattern -> behavior, from get_naming_patterns
+        
+    Returns:
+        (behavior, prefixes, regex or None) per pattern, in pattern order
+    """
+    rules = []
+    for pattern, behavior in patterns.items():
+        branches = pattern.split("|") if "(" not in pattern else [pattern]
+        prefixes, rest = [], []
+        for branch in branches:
+            literal = branch[1:]
+            if branch.startswith("^") and literal and re.escape(literal) == literal:
+                prefixes.append(literal.lower())
+            else:
+                rest.append(branch)
+        regex = re.compile("|".join(rest), re.IGNORECASE) if rest else None
+        rules.append((behavior, tuple(prefixes), regex))
+    return rules
+
+
 @dataclass
 class IntentSignals:
     """Raw signals extracted from code for intent inference."""
@@ -78,6 +138,10 @@ class IntentExtractor:
             "java": JavaAnalyzer(),
         }
         self._default_analyzer = PythonAnalyzer()
+        # Compiled naming rules per analyzer
+        self._naming_rules: Dict[IntentAnalyzer, List[NamingRule]] = {}
+        # Extracted intents keyed by every input extract_intent reads
+        self._memo: "OrderedDict[Tuple, Intent]" = OrderedDict()
     
     def _get_analyzer(self, component: Dict[str, Any]) -> IntentAnalyzer:
         """Determine correct analyzer for component."""
@@ -113,11 +177,48 @@ class IntentExtractor:
             dependency_intents: Intents of dependencies for context
             
         Returns:
-            Inferred Intent with confidence score
+            Inferred Intent with confidence score; repeated calls with the
+            same inputs return a copy of the first result
         """
         if dependency_intents is None:
             dependency_intents = {}
         
+        key = self._memo_key(component, dependency_intents)
+        cached = self._memo.get(key)
+        if cached is not None:
+            self._memo.move_to_end(key)
+            # Callers may edit the intent and its evidence lists, so hand out
+            # a deep copy
+            now = datetime.now()
+            return cached.model_copy(update={"created_at": now, "updated_at": now}, deep=True)
+        
+        intent = self._extract_intent(component, dependency_intents)
+        self._memo[key] = intent.model_copy(deep=True)
+        if len(self._memo) > INTENT_MEMO_SIZE:
+            self._memo.popitem(last=False)
+        return intent
+    
+    def _memo_key(self, component: Dict[str, Any], dependency_intents: Dict[str, Intent]) -> Tuple:
+        """Build the memo key from the component fields and dependency intents used."""
+        return (
+            component.get("id"),
+            component.get("name"),
+            component.get("type"),
+            component.get("language"),
+            component.get("file_path"),
+            component.get("docstring"),
+            component.get("signature"),
+            component.get("cyclomatic_complexity"),
+            tuple(component.get("called_by", ())),
+            tuple((k, v.intent_text) for k, v in dependency_intents.items()),
+        )
+    
+    def _extract_intent(
+        self,
+        component: Dict[str, Any],
+        dependency_intents: Dict[str, Intent]
+    ) -> Intent:
+        """Extract intent without consulting the memo."""
         analyzer = self._get_analyzer(component)
         
         # Extract all signals
@@ -163,10 +264,13 @@ class IntentExtractor:
         docstring = analyzer.extract_docstring(component)
         if docstring:
             signals.docstring = docstring
-            # Higher weight for longer, more detailed docstrings
-            doc_length = len(docstring.split())
+            # Higher weight for longer, more detailed docstrings; words past
+            # the cap don't change it, so stop counting there
+            doc_length = sum(1 for _ in itertools.islice(
+                _WORD_RE.finditer(docstring), DOCSTRING_FULL_WEIGHT_WORDS
+            ))
             signals.docstring_weight = min(self.DOCSTRING_WEIGHT, 
-                                           self.DOCSTRING_WEIGHT * (doc_length / 20))
+                                           self.DOCSTRING_WEIGHT * (doc_length / DOCSTRING_FULL_WEIGHT_WORDS))
         
         # Signature and type hints
         signature = analyzer.extract_signature(component)
@@ -232,7 +336,7 @@ class IntentExtractor:
         # Start with docstring if available
         if signals.docstring:
             # Extract first sentence
-            first_sentence = signals.docstring.split('.')[0].strip()
+            first_sentence = signals.docstring.partition('.')[0].strip()
             if first_sentence:
                 parts.append(first_sentence)
         
@@ -259,31 +363,26 @@ class IntentExtractor:
         """
         Analyze function/class name for behavioral hints.
         """
-        signals = []
-        # Name matching might depend on language case conventions, but regex usually handles this
-        # or we normalize.
-        name_lower = name if "_" in name else name # Python/snake_case check
-        # For camelCase, splitting is harder without extra libs, but regex patterns like "^get" work
-        
-        patterns = analyzer.get_naming_patterns()
-        
-        for pattern, behavior in patterns.items():
-            if re.search(pattern, name): # Use case-sensitive matching if pattern dictates, or flags
-                 # Most patterns we defined don't use flags but rely on ^get vs ^Get or just lowercase in patterns
-                 # Actually, patterns in my analyzers used ^get etc.
-                 # Let's try case-insensitive search to be safe for mixed conventions
-                 signals.append(behavior)
-            elif re.search(pattern, name, re.IGNORECASE):
-                 signals.append(behavior)
-        
-        # De-duplicate
-        return list(set(signals))
+        rules = self._naming_rules.get(analyzer)
+        if rules is None:
+            rules = compile_naming_patterns(analyzer.get_naming_patterns())
+            self._naming_rules[analyzer] = rules
+        
+        # Patterns match case-insensitively to cover mixed conventions
+        name_lower = name.lower()
+        signals = [
+            behavior for behavior, prefixes, regex in rules
+            if name_lower.startswith(prefixes) or (regex is not None and regex.search(name))
+        ]
+        
+        # De-duplicate, keeping pattern order
+        return list(dict.fromkeys(signals))
     
     def needs_clarification(self, intent: Intent) -> bool:
         """Check if intent needs user clarification."""
         return intent.confidence < self.confidence_threshold
     
-    def get_clarification_questions(self, intent: Intent, component: Dict[str, Any]) -> List[str]:
+    def get_clarification_questions(self, intent: Intent, component: Mapping[str, Any]) -> List[str]:
         """
         Generate clarification questions for low-confidence intent.
         
@@ -309,7 +408,7 @@ class IntentExtractor:
             questions.append(f"'{name}' has complex logic. What are the main scenarios it handles?")
         
         # Check for error handling
-        if "exception" in str(component).lower() or "error" in str(component).lower():
+        if self._mentions_error_handling(component):
             questions.append(f"What error conditions should '{name}' handle?")
         
         # Default question
@@ -317,4 +416,8 @@ class IntentExtractor:
             questions.append(f"Please describe the expected behavior of '{name}'.")
         
         return questions
+    
+    def _mentions_error_handling(self, component: Mapping[str, Any]) -> bool:
+        """Check the component's keys and values for exception/error, without stringifying it."""
+        return _mentions_error(component)
 
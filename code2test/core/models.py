@@ -251,3 +251,8 @@ class GenerationConfig(BaseModel):
     output_dir: Optional[str] = None
     framework: TestFramework = TestFramework.PYTEST
     model: str = "openai:gpt-4o-mini"
+    max_concurrency: int = 5
+    use_llm_cache: bool = True
+    semantic_cache: bool = False
+    # Stronger model for low-confidence or CODE_BUG diagnoses (None disables the cascade)
+    diagnosis_strong_model: Optional[str] = None
@@ -3,8 +3,35 @@ Template manager for Code2Test.
 """
 
 import os
+import functools
 from typing import Dict, Any, Optional
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+
+# Maximum number of rendered outputs kept per TemplateManager
+RENDER_CACHE_SIZE = 512
+
+
+class _FrozenDict(tuple):
+    """Hashable stand-in for a dict inside a render cache key."""
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a template context into a hashable cache key."""
+    if isinstance(value, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Rebuild a template context from a cache key produced by _freeze."""
+    if isinstance(value, _FrozenDict):
+        return {k: _thaw(v) for k, v in value}
+    if isinstance(value, tuple):
+        return [_thaw(v) for v in value]
+    return value
+
 
 class TemplateManager:
     """Manages Jinja2 templates for test generation."""
@@ -27,7 +54,14 @@ class TemplateManager:
             loader=FileSystemLoader(templates_dir),
             autoescape=select_autoescape(),
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            # Templates ship with the package; skip the mtime check per lookup
+            auto_reload=False
+        )
+        # Compiled templates, keyed by path relative to the templates root
+        self._templates: Dict[str, Template] = {}
+        self._render_frozen = functools.lru_cache(maxsize=RENDER_CACHE_SIZE)(
+            self._render_frozen_uncached
         )
     
     def render(self, template_path: str, context: Dict[str, Any]) -> str:
@@ -42,5 +76,49 @@ class TemplateManager:
         Returns:
             Rendered string
         """
-        template = self.env.get_template(template_path)
-        return template.render(**context)
+        return self.get_template(template_path).render(**context)
+
+    def get_template(self, template_path: str) -> Template:
+        """
+        Get a compiled template, compiling it on first use only.
+        
+        Args:
+            template_path: Path to template relative to templates root
+            
+        Returns:
+            Compiled Jinja2 template
+        """
+        template = self._templates.get(template_path)
+        if template is None:
+            template = self.env.get_template(template_path)
+            self._templates[template_path] = template
+        return template
+
+    def render_cached(self, template_path: str, context: Dict[str, Any]) -> str:
+        """
+        Render a template, reusing the output for identical contexts.
+        
+        Batch generation often renders the same template with the same
+        context many times; identical requests are served from an LRU cache.
+        Contexts containing unhashable values are rendered directly.
+        
+        Args:
+            template_path: Path to template relative to templates root
+            context: Variables to pass to template
+            
+        Returns:
+            Rendered string
+        """
+        try:
+            return self._render_frozen(template_path, _freeze(context))
+        except TypeError:
+            return self.render(template_path, context)
+    
+    def _render_frozen_uncached(self, template_path: str, frozen_context: Any) -> str:
+        return self.render(template_path, _thaw(frozen_context))
+
+
+@functools.lru_cache(maxsize=None)
+def get_template_manager() -> TemplateManager:
+    """Get the shared TemplateManager for the built-in templates."""
+    return TemplateManager()
@@ -68,13 +68,7 @@ class TestVerifier:
         Returns:
             VerificationResult
         """
-        test_path = self.repo_path / test_file.path
-        
-        # Check if file exists
-        if not test_path.exists():
-            # Write test file first
-            test_path.parent.mkdir(parents=True, exist_ok=True)
-            test_path.write_text(test_file.get_full_content())
+        test_path = self._write_if_missing(test_file)
         
         # Create temp file for JSON results
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
@@ -129,49 +123,121 @@ class TestVerifier:
                 # Parse stdout for results
                 passed, failed, skipped = self._parse_pytest_output(stdout)
             
-            # Update test case statuses
-            for tc in test_file.test_cases:
-                if tc.name in passed:
-                    tc.mark_passed()
-                elif tc.name in failed:
-                    tc.mark_failed(self._extract_failure_message(stdout, tc.name))
-                elif tc.name in skipped:
-                    tc.status = TestStatus.SKIPPED
-            
-            return VerificationResult(
-                test_file_path=test_file.path,
-                all_passed=len(failed) == 0,
-                passed=passed,
-                failed=failed,
-                skipped=skipped,
-                execution_time=0.0,  # Could parse from output
-                stdout=stdout,
-                stderr=stderr,
-            )
+            return self._build_result(test_file, passed, failed, skipped, stdout, stderr)
             
         except subprocess.TimeoutExpired:
-            logger.error(f"Test execution timed out after {self.timeout}s")
-            return VerificationResult(
-                test_file_path=test_file.path,
-                all_passed=False,
-                failed=["TIMEOUT"],
-                stderr=f"Test execution timed out after {self.timeout} seconds",
-            )
+            return self._timeout_result(test_file)
             
         except Exception as e:
-            logger.error(f"Test execution failed: {e}")
-            return VerificationResult(
-                test_file_path=test_file.path,
-                all_passed=False,
-                failed=["ERROR"],
-                stderr=str(e),
-            )
+            return self._error_result(test_file, e)
             
         finally:
             # Cleanup temp file
             if os.path.exists(json_path):
                 os.unlink(json_path)
     
+    async def run_tests_async(self, test_file: TestFile) -> VerificationResult:
+        """
+        Execute tests without blocking the event loop.
+        
+        pytest runs as an asyncio subprocess through the pytest adapter, so
+        several test files can be verified side by side on one loop.
+        
+        Args:
+            test_file: TestFile to execute
+            
+        Returns:
+            VerificationResult with pass/fail status
+        """
+        from code2test.adapters.python.pytest_adapter import PytestAdapter
+        
+        if test_file.framework != TestFramework.PYTEST:
+            logger.warning(f"Framework {test_file.framework} not fully supported")
+        
+        try:
+            self._write_if_missing(test_file)
+            with PytestAdapter(str(self.repo_path)) as adapter:
+                results = await adapter.run_tests_async(test_file.path, self.timeout)
+        except Exception as e:
+            return self._error_result(test_file, e)
+        
+        # The adapter reports timeouts as an error result
+        if results.get("error"):
+            return self._timeout_result(test_file)
+        
+        stdout = results.get("stdout", "")
+        if results["tests"]:
+            passed, failed, skipped = [], [], []
+            by_outcome = {"passed": passed, "failed": failed, "skipped": skipped}
+            for test in results["tests"]:
+                names = by_outcome.get(test["outcome"])
+                if names is not None:
+                    names.append(test["nodeid"].split("::")[-1])
+        else:
+            # No JSON report: parse stdout for results
+            passed, failed, skipped = self._parse_pytest_output(stdout)
+        
+        return self._build_result(
+            test_file, passed, failed, skipped, stdout, results.get("stderr", "")
+        )
+    
+    def _write_if_missing(self, test_file: TestFile) -> Path:
+        """Write the test file unless it already exists, and return its path."""
+        test_path = self.repo_path / test_file.path
+        if not test_path.exists():
+            test_path.parent.mkdir(parents=True, exist_ok=True)
+            test_path.write_text(test_file.get_full_content())
+        return test_path
+    
+    def _build_result(
+        self,
+        test_file: TestFile,
+        passed: List[str],
+        failed: List[str],
+        skipped: List[str],
+        stdout: str,
+        stderr: str,
+    ) -> VerificationResult:
+        """Update the test case statuses and build the VerificationResult."""
+        for tc in test_file.test_cases:
+            if tc.name in passed:
+                tc.mark_passed()
+            elif tc.name in failed:
+                tc.mark_failed(self._extract_failure_message(stdout, tc.name))
+            elif tc.name in skipped:
+                tc.status = TestStatus.SKIPPED
+        
+        return VerificationResult(
+            test_file_path=test_file.path,
+            all_passed=len(failed) == 0,
+            passed=passed,
+            failed=failed,
+            skipped=skipped,
+            execution_time=0.0,  # Could parse from output
+            stdout=stdout,
+            stderr=stderr,
+        )
+    
+    def _timeout_result(self, test_file: TestFile) -> VerificationResult:
+        """VerificationResult for a run that exceeded the timeout."""
+        logger.error(f"Test execution timed out after {self.timeout}s")
+        return VerificationResult(
+            test_file_path=test_file.path,
+            all_passed=False,
+            failed=["TIMEOUT"],
+            stderr=f"Test execution timed out after {self.timeout} seconds",
+        )
+    
+    def _error_result(self, test_file: TestFile, error: Exception) -> VerificationResult:
+        """VerificationResult for a run that could not be executed."""
+        logger.error(f"Test execution failed: {error}")
+        return VerificationResult(
+            test_file_path=test_file.path,
+            all_passed=False,
+            failed=["ERROR"],
+            stderr=str(error),
+        )
+    
     def _parse_pytest_output(self, output: str) -> tuple[List[str], List[str], List[str]]:
         """
         Parse pytest output to extract test results.
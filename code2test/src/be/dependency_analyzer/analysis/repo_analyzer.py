@@ -6,6 +6,7 @@ detailed file tree representations with filtering capabilities.
 """
 
 import os
+import re
 import fnmatch
 import json
 from pathlib import Path
@@ -13,6 +14,31 @@ from typing import Dict, List, Optional, Union
 from code2test.src.be.dependency_analyzer.utils.patterns import DEFAULT_IGNORE_PATTERNS, DEFAULT_INCLUDE_PATTERNS
 
 
+def _compile_globs(patterns: List[str]) -> "re.Pattern[str]":
+    """Compile glob patterns into one regex matching any of them."""
+    if not patterns:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+
+def _compile_path_prefixes(patterns: List[str]) -> "re.Pattern[str]":
+    """
+    Compile the literal directory rules of exclude patterns into one regex.
+
+    A path matches when it starts with a pattern ending in "/", when it is
+    or lies under the pattern, or when one of its components equals it.
+    """
+    alternatives = []
+    for pattern in patterns:
+        if pattern.endswith("/"):
+            alternatives.append(re.escape(pattern.rstrip("/")))
+        alternatives.append(re.escape(pattern) + r"(?:/|\Z)")
+        alternatives.append(r"(?:.*/)?" + re.escape(pattern) + r"(?:/|\Z)")
+    if not alternatives:
+        return re.compile(r"(?!)")
+    return re.compile("(?s:" + "|".join(alternatives) + ")")
+
+
 class RepoAnalyzer:
     def __init__(
         self,
@@ -29,6 +55,10 @@ class RepoAnalyzer:
             if exclude_patterns is not None
             else list(DEFAULT_IGNORE_PATTERNS)
         )
+        # Every path is checked against every pattern, so match them all at once
+        self._include_re = _compile_globs(self.include_patterns)
+        self._exclude_glob_re = _compile_globs(self.exclude_patterns)
+        self._exclude_prefix_re = _compile_path_prefixes(self.exclude_patterns)
 
     def analyze_repository_structure(self, repo_dir: str) -> Dict:
         file_tree = self._build_file_tree(repo_dir)
@@ -98,24 +128,16 @@ class RepoAnalyzer:
         return build_tree(Path(repo_dir), Path(repo_dir))
 
     def _should_exclude_path(self, path: str, filename: str) -> bool:
-        for pattern in self.exclude_patterns:
-            if fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(filename, pattern):
-                return True
-            if pattern.endswith("/") and path.startswith(pattern.rstrip("/")):
-                return True
-            if path.startswith(pattern + "/") or path == pattern:
-                return True
-            if pattern in path.split("/"):
-                return True
-        return False
+        return bool(
+            self._exclude_glob_re.match(path)
+            or self._exclude_glob_re.match(filename)
+            or self._exclude_prefix_re.match(path)
+        )
 
     def _should_include_file(self, path: str, filename: str) -> bool:
         if not self.include_patterns:
             return True
-        for pattern in self.include_patterns:
-            if fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(filename, pattern):
-                return True
-        return False
+        return bool(self._include_re.match(path) or self._include_re.match(filename))
 
     def _count_files(self, tree: Dict) -> int:
         if tree["type"] == "file":
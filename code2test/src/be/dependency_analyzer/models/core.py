@@ -1,10 +1,19 @@
+from collections.abc import Mapping
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any, Set
+from typing import Iterator, List, Optional, Dict, Any, Set
 from datetime import datetime
 
 
 
-class Node(BaseModel):
+class Node(BaseModel, Mapping):
+    """
+    A code component in the dependency graph.
+
+    Nodes are also read-only mappings with the keys of model_dump() plus
+    'dependencies', so they can be handed to code that reads component
+    dicts without being dumped and copied first.
+    """
+
     id: str
 
     name: str
@@ -42,6 +51,26 @@ class Node(BaseModel):
     def get_display_name(self) -> str:
         return self.display_name or self.name
 
+    @property
+    def dependencies(self) -> List[str]:
+        """IDs of the components this node depends on."""
+        return list(self.depends_on)
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "dependencies":
+            return self.dependencies
+        if key in type(self).model_fields:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        # Mapping iteration yields keys, unlike BaseModel's (name, value) pairs
+        yield from type(self).model_fields
+        yield "dependencies"
+
+    def __len__(self) -> int:
+        return len(type(self).model_fields) + 1
+
 
 class CallRelationship(BaseModel):
     caller: str
@@ -84,7 +84,8 @@ class BackgroundWorker:
                         progress=job_data.get('progress', ''),
                         docs_path=job_data.get('docs_path')
                     )
-            print(f"Loaded {len([j for j in self.job_status.values() if j.status == 'completed'])} completed jobs from disk")
+            completed = sum(1 for j in self.job_status.values() if j.status == 'completed')
+            print(f"Loaded {completed} completed jobs from disk")
         except Exception as e:
             print(f"Error loading job statuses: {e}")
     
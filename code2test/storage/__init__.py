@@ -6,8 +6,15 @@ Persistence layer for intents and generated tests.
 
 from code2test.storage.intent_db import IntentDatabase
 from code2test.storage.test_registry import TestRegistry
+from code2test.storage.connection import close_all, open_shared_db
+from code2test.storage.llm_cache import LLMCache
+from code2test.storage.semantic_cache import SemanticCache
 
 __all__ = [
     "IntentDatabase",
     "TestRegistry",
+    "LLMCache",
+    "SemanticCache",
+    "open_shared_db",
+    "close_all",
 ]
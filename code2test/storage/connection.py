@@ -0,0 +1,95 @@
+"""
+Code2Test Storage Connections
+
+Shared SQLite connections for the intent database and test registry.
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    from code2test.storage.intent_db import IntentDatabase
+    from code2test.storage.test_registry import TestRegistry
+
+
+# Connections are bound to the thread that opened them
+_local = threading.local()
+
+# Bound parameters per statement, kept under SQLite's historic limit of 999
+MAX_SQL_VARIABLES = 900
+
+
+def connect(db_path: Union[str, Path]) -> sqlite3.Connection:
+    """
+    Get the shared connection to a database file for the current thread.
+    
+    The first call per file and thread opens the connection and switches
+    it to WAL journaling with NORMAL sync, so the intent database and test
+    registry share one open file instead of reopening it per query. Use it
+    as a context manager to commit on success, as with sqlite3.connect.
+    
+    Args:
+        db_path: Path to SQLite database file
+    
+    Returns:
+        Connection with sqlite3.Row as row factory
+    """
+    connections: Dict[str, sqlite3.Connection] = _local.__dict__.setdefault("connections", {})
+    key = str(db_path)
+    conn = connections.get(key)
+    if conn is None:
+        conn = sqlite3.connect(key)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        connections[key] = conn
+    return conn
+
+
+def close_all() -> None:
+    """
+    Close every connection connect() opened on the current thread.
+    
+    Connections are cached per thread and otherwise stay open until the
+    thread's locals are collected, so worker threads and command teardown
+    call this once they are done with the database. The next connect()
+    on the thread opens a fresh connection.
+    """
+    connections: Dict[str, sqlite3.Connection] = _local.__dict__.pop("connections", {})
+    for conn in connections.values():
+        conn.close()
+
+
+def chunked(values: Sequence[str], size: int = MAX_SQL_VARIABLES) -> Iterator[Tuple[List[str], str]]:
+    """
+    Split values for "IN (...)" queries that stay under the parameter limit.
+    
+    Args:
+        values: Values to bind; duplicates are dropped
+        size: Maximum values per chunk
+        
+    Yields:
+        (chunk, placeholders) where placeholders is "?, ?, ..." for the chunk
+    """
+    values = list(dict.fromkeys(values))
+    for start in range(0, len(values), size):
+        chunk = list(values[start:start + size])
+        yield chunk, ", ".join("?" * len(chunk))
+
+
+def open_shared_db(db_path: Union[str, Path]) -> Tuple["IntentDatabase", "TestRegistry"]:
+    """
+    Open the intent database and test registry stored in one file.
+    
+    Args:
+        db_path: Path to SQLite database file
+    
+    Returns:
+        (IntentDatabase, TestRegistry) sharing one connection
+    """
+    from code2test.storage.intent_db import IntentDatabase
+    from code2test.storage.test_registry import TestRegistry
+    
+    return IntentDatabase(str(db_path)), TestRegistry(str(db_path))
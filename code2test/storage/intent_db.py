@@ -7,10 +7,11 @@ SQLite-based persistence for inferred intents with JSON storage.
 import json
 import sqlite3
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Iterator, List, Optional, Dict, Tuple
 from datetime import datetime
 
 from code2test.core.models import Intent, IntentEvidence
+from code2test.storage.connection import chunked, connect
 
 
 class IntentDatabase:
@@ -29,7 +30,7 @@ class IntentDatabase:
     
     def _init_database(self) -> None:
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS intents (
                     component_id TEXT PRIMARY KEY,
@@ -59,7 +60,7 @@ class IntentDatabase:
         Args:
             intent: Intent to save
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             conn.execute("""
                 INSERT OR REPLACE INTO intents 
                 (component_id, component_path, intent_text, confidence, 
@@ -87,8 +88,7 @@ class IntentDatabase:
         Returns:
             Intent if found, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 "SELECT * FROM intents WHERE component_id = ?",
                 (component_id,)
@@ -100,6 +100,28 @@ class IntentDatabase:
             
             return self._row_to_intent(row)
     
+    def get_intents_bulk(self, component_ids: List[str]) -> Dict[str, Intent]:
+        """
+        Retrieve the intents of many components in a few queries.
+        
+        Args:
+            component_ids: Unique identifiers of the components
+            
+        Returns:
+            Dictionary of the stored intents keyed by component_id; missing
+            components are left out
+        """
+        intents: Dict[str, Intent] = {}
+        with connect(self.db_path) as conn:
+            for chunk, placeholders in chunked(component_ids):
+                cursor = conn.execute(
+                    f"SELECT * FROM intents WHERE component_id IN ({placeholders})",
+                    chunk
+                )
+                for row in cursor.fetchall():
+                    intents[row["component_id"]] = self._row_to_intent(row)
+        return intents
+    
     def get_intents_by_path(self, path_prefix: str) -> List[Intent]:
         """
         Get all intents for components under a path.
@@ -110,8 +132,7 @@ class IntentDatabase:
         Returns:
             List of matching intents
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 "SELECT * FROM intents WHERE component_path LIKE ?",
                 (f"{path_prefix}%",)
@@ -128,8 +149,7 @@ class IntentDatabase:
         Returns:
             List of low-confidence intents
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 "SELECT * FROM intents WHERE confidence < ? AND user_edited = 0",
                 (threshold,)
@@ -143,10 +163,26 @@ class IntentDatabase:
         Returns:
             List of all intents
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        return list(self.iter_intents())
+    
+    def iter_intents(self, batch_size: int = 500) -> Iterator[Intent]:
+        """
+        Iterate over all stored intents without loading them all at once.
+        
+        Args:
+            batch_size: Rows fetched from SQLite per round trip
+            
+        Yields:
+            Intents ordered by component path
+        """
+        with connect(self.db_path) as conn:
             cursor = conn.execute("SELECT * FROM intents ORDER BY component_path")
-            return [self._row_to_intent(row) for row in cursor.fetchall()]
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield self._row_to_intent(row)
 
     def get_all_intents_dict(self) -> Dict[str, Intent]:
         """
@@ -168,7 +204,7 @@ class IntentDatabase:
         Returns:
             True if deleted, False if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 "DELETE FROM intents WHERE component_id = ?",
                 (component_id,)
@@ -178,7 +214,7 @@ class IntentDatabase:
     
     def clear_all(self) -> None:
         """Delete all intents."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             conn.execute("DELETE FROM intents")
             conn.commit()
     
@@ -196,9 +232,37 @@ class IntentDatabase:
             updated_at=datetime.fromisoformat(row["updated_at"]),
         )
     
+    def get_confidence_histogram(
+        self,
+        high: float = 0.8,
+        medium: float = 0.5
+    ) -> Tuple[int, int, int, int]:
+        """
+        Count intents per confidence bucket in a single query.
+        
+        Args:
+            high: Lower bound of the high-confidence bucket
+            medium: Lower bound of the medium-confidence bucket
+            
+        Returns:
+            Tuple of (total, high, medium, low) counts
+        """
+        with connect(self.db_path) as conn:
+            row = conn.execute(
+                """
+                SELECT COUNT(*),
+                       COALESCE(SUM(confidence >= ?), 0),
+                       COALESCE(SUM(confidence >= ? AND confidence < ?), 0),
+                       COALESCE(SUM(confidence < ?), 0)
+                FROM intents
+                """,
+                (high, medium, high, medium)
+            ).fetchone()
+            return tuple(row)
+    
     def get_stats(self) -> dict:
         """Get database statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             total = conn.execute("SELECT COUNT(*) FROM intents").fetchone()[0]
             user_edited = conn.execute(
                 "SELECT COUNT(*) FROM intents WHERE user_edited = 1"
@@ -0,0 +1,128 @@
+"""
+Code2Test LLM Cache
+
+SQLite-based, content-addressed cache of LLM outputs.
+"""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from code2test import __version__
+
+
+# Cached outputs older than this are ignored and eventually overwritten
+DEFAULT_TTL_SECONDS = 14 * 24 * 60 * 60
+
+
+def llm_cache_key(
+    model: str,
+    system_prompt: str,
+    prompt: str,
+    output_type: Optional[type] = None,
+    source_code: str = "",
+) -> str:
+    """
+    Build the cache key for one LLM request.
+    
+    Args:
+        model: LLM model identifier
+        system_prompt: System prompt of the agent
+        prompt: User prompt sent to the model
+        output_type: Structured output model, or None for plain text
+        source_code: Full source of the component, so changes beyond the
+                     truncated prompt excerpt still invalidate the entry
+    
+    Returns:
+        Hex digest identifying the request; keys change with the package
+        version, so an upgrade never serves outputs cached by an older one
+    """
+    source_hash = hashlib.blake2b(source_code.encode(), digest_size=8).hexdigest()
+    type_name = output_type.__qualname__ if output_type is not None else ""
+    payload = "\x1f".join((__version__, model, system_prompt, prompt, type_name, source_hash))
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+
+class LLMCache:
+    """Persists LLM outputs keyed by a hash of everything that shaped them."""
+    
+    def __init__(self, db_path: str, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Initialize LLM cache.
+        
+        Args:
+            db_path: Path to SQLite database file
+            ttl_seconds: Age after which cached outputs are ignored
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._init_database()
+    
+    def _init_database(self) -> None:
+        """Initialize database schema."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    output TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+    
+    def get(self, key: str, output_type: Optional[type] = None) -> Optional[Any]:
+        """
+        Look up a cached output.
+        
+        Args:
+            key: Key from llm_cache_key
+            output_type: Pydantic model to parse the output into, or None
+                         for plain text
+        
+        Returns:
+            The cached output, or None on a miss or expired entry
+        """
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT output FROM llm_cache WHERE key = ? AND created_at >= ?",
+                (key, time.time() - self.ttl_seconds)
+            ).fetchone()
+        
+        if row is None:
+            return None
+        if output_type is None:
+            return row[0]
+        try:
+            return output_type.model_validate_json(row[0])
+        except ValueError:
+            # Schema changed since the entry was written
+            return None
+    
+    def set(self, key: str, output: Any) -> None:
+        """
+        Store an output.
+        
+        Args:
+            key: Key from llm_cache_key
+            output: Pydantic model or plain text returned by the agent
+        """
+        if isinstance(output, BaseModel):
+            output = output.model_dump_json()
+        
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, output, created_at) VALUES (?, ?, ?)",
+                (key, output, time.time())
+            )
+            conn.commit()
+    
+    def clear_all(self) -> None:
+        """Delete all cached outputs."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
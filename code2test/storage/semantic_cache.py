@@ -0,0 +1,153 @@
+"""
+Code2Test Semantic Cache
+
+SQLite-backed cache that serves LLM outputs for near-duplicate prompts.
+"""
+
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+# Minimum Jaccard similarity between prompt shingle sets to count as a hit
+DEFAULT_SIMILARITY_THRESHOLD = 0.90
+
+# Number of consecutive tokens per shingle
+SHINGLE_SIZE = 3
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def prompt_shingles(prompt: str) -> FrozenSet[Tuple[str, ...]]:
+    """
+    Split a prompt into overlapping token n-grams.
+    
+    Args:
+        prompt: Prompt text
+    
+    Returns:
+        Set of SHINGLE_SIZE-token tuples (a single tuple for short prompts)
+    """
+    tokens = _TOKEN_RE.findall(prompt.lower())
+    if len(tokens) <= SHINGLE_SIZE:
+        return frozenset([tuple(tokens)])
+    return frozenset(
+        tuple(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)
+    )
+
+
+class SemanticCache:
+    """
+    Returns cached outputs for prompts that are nearly identical.
+    
+    Getters, DTO builders and similar boilerplate produce prompts that
+    differ only in a few names, so exact-match caching misses them.
+    Similarity is the Jaccard index of token shingles, compared only
+    against entries with the same namespace (model, system prompt and
+    output type).
+    """
+    
+    def __init__(self, db_path: str, threshold: float = DEFAULT_SIMILARITY_THRESHOLD):
+        """
+        Initialize semantic cache.
+        
+        Args:
+            db_path: Path to SQLite database file
+            threshold: Minimum similarity (0.0-1.0) for a hit
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        # namespace -> [(shingles, output json)], loaded on first lookup
+        self._entries: Dict[str, List[Tuple[FrozenSet[Tuple[str, ...]], str]]] = {}
+        self._init_database()
+    
+    def _init_database(self) -> None:
+        """Initialize database schema."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS semantic_cache (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    namespace TEXT NOT NULL,
+                    prompt TEXT NOT NULL,
+                    output TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_semantic_cache_namespace
+                ON semantic_cache(namespace)
+            """)
+            conn.commit()
+    
+    def _load(self, namespace: str) -> List[Tuple[FrozenSet[Tuple[str, ...]], str]]:
+        """Load and shingle all entries of a namespace once."""
+        entries = self._entries.get(namespace)
+        if entries is None:
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(
+                    "SELECT prompt, output FROM semantic_cache WHERE namespace = ?",
+                    (namespace,)
+                ).fetchall()
+            entries = [(prompt_shingles(prompt), output) for prompt, output in rows]
+            self._entries[namespace] = entries
+        return entries
+    
+    def get(self, namespace: str, prompt: str, output_type: type) -> Optional[Any]:
+        """
+        Find the output of the most similar cached prompt.
+        
+        Args:
+            namespace: Key separating incompatible requests
+            prompt: User prompt about to be sent
+            output_type: Pydantic model to parse the output into
+        
+        Returns:
+            Parsed output, or None if nothing is similar enough
+        """
+        shingles = prompt_shingles(prompt)
+        best_score = 0.0
+        best_output = None
+        
+        for cached_shingles, output in self._load(namespace):
+            union = len(shingles | cached_shingles)
+            score = len(shingles & cached_shingles) / union if union else 0.0
+            if score > best_score:
+                best_score, best_output = score, output
+        
+        if best_output is None or best_score < self.threshold:
+            return None
+        try:
+            return output_type.model_validate_json(best_output)
+        except ValueError:
+            return None
+    
+    def set(self, namespace: str, prompt: str, output: BaseModel) -> None:
+        """
+        Store an output for later near-duplicate lookups.
+        
+        Args:
+            namespace: Key separating incompatible requests
+            prompt: User prompt that produced the output
+            output: Structured output returned by the agent
+        """
+        output_json = output.model_dump_json()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                "INSERT INTO semantic_cache (namespace, prompt, output, created_at) VALUES (?, ?, ?, ?)",
+                (namespace, prompt, output_json, time.time())
+            )
+            conn.commit()
+        
+        self._load(namespace).append((prompt_shingles(prompt), output_json))
+    
+    def clear_all(self) -> None:
+        """Delete all cached outputs."""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM semantic_cache")
+            conn.commit()
+        self._entries.clear()
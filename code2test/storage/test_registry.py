@@ -11,6 +11,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 from code2test.core.models import TestFile, TestCase, TestStatus, TestFramework
+from code2test.storage.connection import chunked, connect
 
 
 class TestRegistry:
@@ -29,7 +30,7 @@ class TestRegistry:
     
     def _init_database(self) -> None:
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS test_files (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -65,7 +66,7 @@ class TestRegistry:
         imports_json = json.dumps(test_file.imports)
         fixtures_json = json.dumps(test_file.fixtures)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute("""
                 INSERT OR REPLACE INTO test_files 
                 (path, component_id, component_path, framework, test_cases, 
@@ -95,8 +96,7 @@ class TestRegistry:
         Returns:
             TestFile if found, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 "SELECT * FROM test_files WHERE path = ?",
                 (path,)
@@ -118,14 +118,35 @@ class TestRegistry:
         Returns:
             List of TestFile objects
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 "SELECT * FROM test_files WHERE component_id = ?",
                 (component_id,)
             )
             return [self._row_to_test_file(row) for row in cursor.fetchall()]
     
+    def get_tests_for_components_bulk(self, component_ids: List[str]) -> Dict[str, List[TestFile]]:
+        """
+        Get the tests of many components in a few queries.
+        
+        Args:
+            component_ids: Component identifiers
+            
+        Returns:
+            Dictionary of TestFile lists keyed by component_id; components
+            without tests are left out
+        """
+        tests: Dict[str, List[TestFile]] = {}
+        with connect(self.db_path) as conn:
+            for chunk, placeholders in chunked(component_ids):
+                cursor = conn.execute(
+                    f"SELECT * FROM test_files WHERE component_id IN ({placeholders})",
+                    chunk
+                )
+                for row in cursor.fetchall():
+                    tests.setdefault(row["component_id"], []).append(self._row_to_test_file(row))
+        return tests
+    
     def mark_verified(self, test_file_path: str) -> bool:
         """
         Mark a test file as verified.
@@ -136,7 +157,7 @@ class TestRegistry:
         Returns:
             True if updated, False if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 "UPDATE test_files SET verified = 1 WHERE path = ?",
                 (test_file_path,)
@@ -151,8 +172,7 @@ class TestRegistry:
         Returns:
             List of unverified TestFile objects
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 "SELECT * FROM test_files WHERE verified = 0"
             )
@@ -165,8 +185,7 @@ class TestRegistry:
         Returns:
             List of all TestFile objects
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 "SELECT * FROM test_files ORDER BY component_path"
             )
@@ -182,7 +201,7 @@ class TestRegistry:
         Returns:
             True if deleted, False if not found
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.execute(
                 "DELETE FROM test_files WHERE path = ?",
                 (path,)
@@ -214,7 +233,7 @@ class TestRegistry:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get registry statistics."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             total_files = conn.execute(
                 "SELECT COUNT(*) FROM test_files"
             ).fetchone()[0]
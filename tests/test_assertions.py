@@ -0,0 +1,56 @@
+"""
+Tests for the assertion pattern library.
+"""
+
+import pytest
+
+from code2test.core.assertions import AssertionLibrary
+
+
+def test_get_assertion_fills_in_pattern():
+    assert AssertionLibrary.get_assertion("pytest", "equal", "add(1, 2)", "3") == "assert add(1, 2) == 3"
+
+
+def test_framework_is_case_insensitive():
+    assert AssertionLibrary.get_assertion("Jest", "equal", "a", "b") == (
+        AssertionLibrary.get_assertion("jest", "equal", "a", "b")
+    )
+
+
+def test_unknown_type_falls_back_to_equal():
+    assert AssertionLibrary.get_assertion("pytest", "no_such_type", "a", "b") == "assert a == b"
+
+
+def test_unknown_framework_raises():
+    with pytest.raises(ValueError, match="Unknown framework: mocha"):
+        AssertionLibrary.get_assertion("mocha", "equal", "a", "b")
+
+
+def test_values_are_substituted_not_evaluated():
+    # Braces and attribute access in values are inserted verbatim
+    code = AssertionLibrary.get_assertion("pytest", "equal", "x.__class__", "'{actual}'")
+
+    assert code == "assert x.__class__ == '{actual}'"
+
+
+def test_render_many_matches_get_assertion():
+    specs = [
+        ("equal", "add(1, 2)", "3"),
+        ("raises", "div(1, 0)", "ZeroDivisionError"),
+        ("no_such_type", "a", "b"),
+    ]
+
+    block = AssertionLibrary.render_many("pytest", specs)
+
+    assert block == "".join(
+        AssertionLibrary.get_assertion("pytest", *spec) + "\n" for spec in specs
+    )
+
+
+def test_render_many_without_specs():
+    assert AssertionLibrary.render_many("junit", []) == ""
+
+
+def test_render_many_unknown_framework_raises():
+    with pytest.raises(ValueError):
+        AssertionLibrary.render_many("mocha", [("equal", "a", "b")])
@@ -0,0 +1,114 @@
+"""
+Tests for the shared adapter helpers.
+"""
+
+import json
+import types
+
+import pytest
+
+from code2test.adapters import base_adapter
+from code2test.adapters.base_adapter import iter_json_report
+
+
+PYTEST_REPORT = {
+    "summary": {"passed": 1, "failed": 1},
+    "tests": [
+        {"nodeid": "tests/test_m.py::test_ok", "outcome": "passed"},
+        {"nodeid": "tests/test_m.py::test_bad", "outcome": "failed"},
+    ],
+}
+
+JEST_REPORT = {
+    "testResults": [
+        {"assertionResults": [{"title": "adds", "status": "passed"}]},
+        {"assertionResults": [
+            {"title": "subtracts", "status": "failed"},
+            {"title": "divides", "status": "pending"},
+        ]},
+    ],
+}
+
+
+@pytest.fixture
+def write_report(tmp_path):
+    def write(report):
+        path = tmp_path / "report.json"
+        path.write_text(json.dumps(report))
+        return str(path)
+    return write
+
+
+def test_iterates_top_level_items(write_report):
+    path = write_report(PYTEST_REPORT)
+
+    assert list(iter_json_report(path, "tests.item")) == PYTEST_REPORT["tests"]
+
+
+def test_flattens_nested_items(write_report):
+    path = write_report(JEST_REPORT)
+
+    titles = [a["title"] for a in iter_json_report(path, "testResults.item.assertionResults.item")]
+
+    assert titles == ["adds", "subtracts", "divides"]
+
+
+def test_missing_prefix_yields_nothing(write_report):
+    path = write_report({"summary": {}})
+
+    assert list(iter_json_report(path, "tests.item")) == []
+
+
+def test_small_reports_are_decoded_whole(write_report, monkeypatch):
+    decoded = []
+
+    def loads(data):
+        decoded.append(len(data))
+        return json.loads(data)
+
+    monkeypatch.setattr(base_adapter, "_json_loads", loads)
+    path = write_report(PYTEST_REPORT)
+
+    assert list(iter_json_report(path, "tests.item")) == PYTEST_REPORT["tests"]
+    assert len(decoded) == 1
+
+
+def test_large_reports_are_streamed(write_report, monkeypatch):
+    streamed = []
+
+    def items(source, prefix, use_float=False):
+        streamed.append((prefix, use_float))
+        yield from base_adapter._walk_prefix(json.load(source), prefix.split("."))
+
+    monkeypatch.setattr(base_adapter, "ijson", types.SimpleNamespace(items=items))
+    monkeypatch.setattr(base_adapter, "STREAM_REPORT_THRESHOLD", 0)
+    path = write_report(PYTEST_REPORT)
+
+    assert list(iter_json_report(path, "tests.item")) == PYTEST_REPORT["tests"]
+    assert streamed == [("tests.item", True)]
+
+
+def test_large_reports_are_decoded_whole_without_ijson(write_report, monkeypatch):
+    monkeypatch.setattr(base_adapter, "ijson", None)
+    monkeypatch.setattr(base_adapter, "STREAM_REPORT_THRESHOLD", 0)
+    path = write_report(PYTEST_REPORT)
+
+    assert list(iter_json_report(path, "tests.item")) == PYTEST_REPORT["tests"]
+
+
+def test_decodes_with_orjson(write_report):
+    orjson = pytest.importorskip("orjson")
+    path = write_report(JEST_REPORT)
+
+    assert base_adapter._json_loads is orjson.loads
+    assert len(list(iter_json_report(path, "testResults.item.assertionResults.item"))) == 3
+
+
+def test_streams_with_ijson(write_report, monkeypatch):
+    pytest.importorskip("ijson")
+    monkeypatch.setattr(base_adapter, "STREAM_REPORT_THRESHOLD", 0)
+    path = write_report(JEST_REPORT)
+
+    titles = [a["title"] for a in iter_json_report(path, "testResults.item.assertionResults.item")]
+
+    assert titles == ["adds", "subtracts", "divides"]
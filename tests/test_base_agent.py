@@ -0,0 +1,84 @@
+"""
+Tests for the bounded concurrency helpers shared by the agents.
+"""
+
+import asyncio
+
+import pytest
+
+from code2test.agents.base_agent import gather_bounded, stream_bounded
+
+
+class Tracker:
+    """Coroutine function that records how many calls are in flight."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    async def __call__(self, value: int, delay: float = 0.0) -> int:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(delay)
+            if value < 0:
+                raise ValueError(value)
+            return value * 2
+        finally:
+            self.in_flight -= 1
+
+
+async def collect(stream):
+    return [item async for item in stream]
+
+
+def test_gather_bounded_keeps_input_order():
+    tracker = Tracker()
+    # Later calls finish first
+    calls = [(i, 0.01 * (5 - i)) for i in range(5)]
+
+    results = asyncio.run(gather_bounded(tracker, calls, max_concurrency=5))
+
+    assert results == [0, 2, 4, 6, 8]
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+def test_gather_bounded_caps_concurrency(max_concurrency):
+    tracker = Tracker()
+
+    asyncio.run(gather_bounded(tracker, [(i, 0.001) for i in range(10)], max_concurrency))
+
+    assert tracker.peak == max_concurrency
+
+
+def test_gather_bounded_returns_exceptions_in_place():
+    results = asyncio.run(gather_bounded(Tracker(), [(1,), (-1,), (3,)], max_concurrency=2))
+
+    assert results[0] == 2
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 6
+
+
+def test_gather_bounded_without_calls():
+    assert asyncio.run(gather_bounded(Tracker(), [], max_concurrency=3)) == []
+
+
+def test_stream_bounded_yields_in_completion_order():
+    tracker = Tracker()
+    calls = [(1, 0.03), (2, 0.0), (3, 0.015)]
+
+    items = asyncio.run(collect(stream_bounded(tracker, calls, max_concurrency=3)))
+
+    assert items == [(1, 4), (2, 6), (0, 2)]
+
+
+def test_stream_bounded_caps_concurrency_and_yields_exceptions():
+    tracker = Tracker()
+    calls = [(i if i != 4 else -1, 0.001) for i in range(8)]
+
+    items = dict(asyncio.run(collect(stream_bounded(tracker, calls, max_concurrency=2))))
+
+    assert tracker.peak == 2
+    assert sorted(items) == list(range(8))
+    assert isinstance(items[4], ValueError)
+    assert items[7] == 14
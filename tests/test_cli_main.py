@@ -0,0 +1,60 @@
+"""
+Tests for the CLI entry point.
+"""
+
+import sys
+import types
+import asyncio
+import subprocess
+
+import click
+import pytest
+
+from code2test.cli.main import cli
+
+
+@pytest.fixture
+def fake_uvloop(monkeypatch):
+    """Stand-in uvloop module whose policy is recognisable by type."""
+    class EventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+        pass
+
+    module = types.ModuleType("uvloop")
+    module.EventLoopPolicy = EventLoopPolicy
+    monkeypatch.setitem(sys.modules, "uvloop", module)
+
+    yield module
+
+    asyncio.set_event_loop_policy(None)
+
+
+def test_subcommands_run_with_uvloop_policy(fake_uvloop):
+    seen = []
+
+    @click.command("probe-loop")
+    def probe():
+        async def policy_type():
+            return type(asyncio.get_event_loop_policy())
+        seen.append(asyncio.run(policy_type()))
+
+    cli.add_command(probe)
+    try:
+        cli.main(["probe-loop"], standalone_mode=False)
+    finally:
+        cli.commands.pop("probe-loop")
+
+    assert seen == [fake_uvloop.EventLoopPolicy]
+
+
+def test_version_does_not_import_asyncio():
+    code = (
+        "import sys\n"
+        "from code2test.cli.main import cli\n"
+        "cli.main(['--version'], standalone_mode=False)\n"
+        "print('asyncio' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.splitlines()[-1] == "False"
@@ -0,0 +1,55 @@
+"""
+Tests for the shared SQLite connections.
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from code2test.storage.connection import close_all, connect
+
+
+def test_connect_reuses_the_connection_per_thread(tmp_path):
+    db_path = tmp_path / "code2test.db"
+
+    assert connect(db_path) is connect(str(db_path))
+
+    close_all()
+
+
+def test_close_all_closes_and_reopens(tmp_path):
+    first = connect(tmp_path / "a.db")
+    second = connect(tmp_path / "b.db")
+
+    close_all()
+
+    for conn in (first, second):
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    reopened = connect(tmp_path / "a.db")
+    assert reopened is not first
+    assert reopened.execute("SELECT 1").fetchone()[0] == 1
+
+    close_all()
+
+
+def test_close_all_only_closes_the_current_thread(tmp_path):
+    db_path = tmp_path / "code2test.db"
+    main_conn = connect(db_path)
+    worker_conns = []
+
+    def worker():
+        worker_conns.append(connect(db_path))
+        close_all()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        worker_conns[0].execute("SELECT 1")
+    assert main_conn.execute("SELECT 1").fetchone()[0] == 1
+
+    close_all()
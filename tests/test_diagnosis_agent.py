@@ -0,0 +1,41 @@
+"""
+Tests for DiagnosisAgent's offline helpers.
+"""
+
+import pytest
+
+from code2test.agents.diagnosis_agent import DiagnosisAgent
+
+
+@pytest.fixture
+def agent():
+    return DiagnosisAgent()
+
+
+def test_parse_pytest_assertion(agent):
+    output = "E       assert add(1, 2) == 4\nE        +  where 3 = add(1, 2)"
+
+    assert agent._parse_assertion_error(output) == ("add(1, 2)", "4")
+
+
+def test_parse_expected_got(agent):
+    output = "Expected: 'admin'\nGot: 'guest'"
+
+    assert agent._parse_assertion_error(output) == ("'admin'", "'guest'")
+
+
+def test_parse_expected_actual(agent):
+    output = "expected: [1, 2]\nactual: [2, 1]"
+
+    assert agent._parse_assertion_error(output) == ("[1, 2]", "[2, 1]")
+
+
+def test_pytest_assertion_wins_over_earlier_expected_got(agent):
+    # Patterns are tried in order, not by position in the output
+    output = "Expected: 1\nGot: 2\n...\nE       assert total == 10"
+
+    assert agent._parse_assertion_error(output) == ("total", "10")
+
+
+def test_parse_without_assertion(agent):
+    assert agent._parse_assertion_error("ZeroDivisionError: division by zero") == (None, None)
@@ -0,0 +1,59 @@
+"""
+Tests for the display managers.
+"""
+
+import io
+
+import pytest
+from rich.console import Console
+
+from code2test.cli.display import BufferedDisplay, DisplayManager
+
+
+@pytest.fixture
+def display():
+    display = BufferedDisplay()
+    display.console = Console(file=io.StringIO(), width=80, color_system=None)
+    return display
+
+
+def output(display):
+    return display.console.file.getvalue()
+
+
+def test_status_messages_wait_for_flush(display):
+    display.info("first")
+    display.success("second")
+
+    assert output(display) == ""
+
+    display.flush()
+
+    assert output(display).splitlines() == ["ℹ first", "✓ second"]
+
+
+def test_buffered_messages_precede_other_output(display):
+    display.warning("careful")
+    display.show_prompt("", "Accept or skip")
+    display.error("broken")
+
+    lines = [line for line in output(display).splitlines() if line]
+    assert lines == ["⚠ careful", "Accept or skip", "✗ broken"]
+
+
+def test_new_display_methods_flush_without_registration(display, monkeypatch):
+    def show_banner(self):
+        self._print("banner")
+
+    monkeypatch.setattr(DisplayManager, "show_banner", show_banner, raising=False)
+    display.info("before")
+    display.show_banner()
+
+    assert output(display).splitlines() == ["ℹ before", "banner"]
+
+
+def test_progress_bars_flush_first(display):
+    display.info("before")
+    display.show_progress("working")
+
+    assert output(display).splitlines() == ["ℹ before"]
@@ -0,0 +1,54 @@
+"""
+Tests for naming-pattern analysis in the intent extractor.
+"""
+
+import re
+
+import pytest
+
+from code2test.core.intent import IntentExtractor, compile_naming_patterns
+from code2test.core.intent_analyzers import JavaAnalyzer, JavascriptAnalyzer, PythonAnalyzer
+
+
+NAMES = [
+    "get_user", "GET_USER", "getUser", "isValid", "is_valid_email", "validate_input",
+    "to_json", "toJSON", "main", "main_loop", "run", "runner", "handle_request",
+    "handleRequest", "test_add", "setup_db", "build", "_get_private", "fetch",
+]
+
+
+def reference_behaviors(patterns, name):
+    """What a plain re.search over every pattern reports, de-duplicated."""
+    matches = [b for p, b in patterns.items() if re.search(p, name, re.IGNORECASE)]
+    return list(dict.fromkeys(matches))
+
+
+def test_literal_branches_become_prefixes():
+    rules = compile_naming_patterns({r"^get_|^Fetch_": "data retrieval"})
+
+    assert rules == [("data retrieval", ("get_", "fetch_"), None)]
+
+
+def test_non_literal_branches_stay_regex():
+    behavior, prefixes, regex = compile_naming_patterns({r"^main$|^run_": "entry"})[0]
+
+    assert behavior == "entry"
+    assert prefixes == ("run_",)
+    assert regex.pattern == "^main$"
+    assert regex.flags & re.IGNORECASE
+
+
+def test_grouped_patterns_are_kept_whole():
+    behavior, prefixes, regex = compile_naming_patterns({r"^(get|set)[A-Z]": "accessor"})[0]
+
+    assert prefixes == ()
+    assert regex.pattern == "^(get|set)[A-Z]"
+
+
+@pytest.mark.parametrize("analyzer", [PythonAnalyzer(), JavascriptAnalyzer(), JavaAnalyzer()])
+def test_analyze_naming_matches_plain_regex_search(analyzer):
+    extractor = IntentExtractor()
+    patterns = analyzer.get_naming_patterns()
+
+    for name in NAMES:
+        assert extractor._analyze_naming(name, analyzer) == reference_behaviors(patterns, name), name
@@ -0,0 +1,81 @@
+"""
+Tests for the interactive session prompts.
+"""
+
+import io
+import asyncio
+import threading
+
+import click
+import pytest
+
+from code2test.cli.interactive import InteractiveSession, _prompt
+
+
+class TTYInput(io.StringIO):
+    """stdin stand-in that claims to be a terminal."""
+
+    def isatty(self):
+        return True
+
+
+@pytest.fixture
+def session():
+    return InteractiveSession()
+
+
+def test_choose_reads_lines_without_a_terminal(session, monkeypatch):
+    def no_tty():
+        raise OSError(6, "No such device or address: '/dev/tty'")
+
+    monkeypatch.setattr(click, "getchar", no_tty)
+    monkeypatch.setattr("sys.stdin", io.StringIO("x\nn\n"))
+
+    # An invalid line is re-prompted, the next valid one is taken
+    assert session._choose("yne", default="y") == "n"
+
+
+def test_choose_uses_default_on_empty_line(session, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n"))
+
+    assert session._choose("fks", default="s") == "s"
+
+
+def test_choose_reads_single_keys_on_a_terminal(session, monkeypatch):
+    keys = iter(["x", "E"])
+    monkeypatch.setattr(click, "getchar", lambda: next(keys))
+    monkeypatch.setattr("sys.stdin", TTYInput())
+
+    assert session._choose("yne", default="y") == "e"
+
+
+def test_prompt_leaves_the_event_loop_running():
+    answered = threading.Event()
+    ticks = []
+
+    def blocking_prompt(answer):
+        # Only returns once the loop has made progress without it
+        assert answered.wait(5)
+        return answer
+
+    async def ticker():
+        for _ in range(3):
+            ticks.append(1)
+            await asyncio.sleep(0)
+        answered.set()
+
+    async def main():
+        pending = asyncio.ensure_future(_prompt(blocking_prompt, "y"))
+        await ticker()
+        return await pending
+
+    assert asyncio.run(main()) == "y"
+    assert len(ticks) == 3
+
+
+def test_prompt_reraises_errors():
+    def failing_prompt():
+        raise EOFError
+
+    with pytest.raises(EOFError):
+        asyncio.run(_prompt(failing_prompt))
@@ -0,0 +1,87 @@
+"""
+Tests for the content-addressed LLM cache.
+"""
+
+import types
+
+import pytest
+from pydantic import BaseModel
+
+from code2test.storage import llm_cache
+from code2test.storage.llm_cache import LLMCache, llm_cache_key
+
+
+class Answer(BaseModel):
+    text: str
+
+
+class OtherAnswer(BaseModel):
+    count: int
+
+
+BASE = dict(
+    model="openai:gpt-4o-mini",
+    system_prompt="You write tests.",
+    prompt="Test add()",
+    output_type=Answer,
+    source_code="def add(a, b): return a + b",
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMCache(str(tmp_path / "cache.db"))
+
+
+def test_key_is_stable():
+    assert llm_cache_key(**BASE) == llm_cache_key(**BASE)
+
+
+@pytest.mark.parametrize("field, value", [
+    ("model", "openai:gpt-4o"),
+    ("system_prompt", "You review tests."),
+    ("prompt", "Test sub()"),
+    ("output_type", OtherAnswer),
+    ("output_type", None),
+    ("source_code", "def add(a, b): return b + a"),
+])
+def test_key_changes_with_every_input(field, value):
+    assert llm_cache_key(**{**BASE, field: value}) != llm_cache_key(**BASE)
+
+
+def test_key_changes_with_package_version(monkeypatch):
+    key = llm_cache_key(**BASE)
+    monkeypatch.setattr(llm_cache, "__version__", "999.0.0")
+
+    assert llm_cache_key(**BASE) != key
+
+
+def test_round_trips_models_and_text(cache):
+    cache.set("model-key", Answer(text="ok"))
+    cache.set("text-key", "plain")
+
+    assert cache.get("model-key", Answer) == Answer(text="ok")
+    assert cache.get("text-key") == "plain"
+    assert cache.get("missing", Answer) is None
+
+
+def test_schema_mismatch_is_a_miss(cache):
+    cache.set("key", Answer(text="ok"))
+
+    assert cache.get("key", OtherAnswer) is None
+
+
+def test_expired_entries_are_ignored(cache, monkeypatch):
+    cache.set("key", "plain")
+    now = llm_cache.time.time()
+    later = types.SimpleNamespace(time=lambda: now + cache.ttl_seconds + 1)
+    monkeypatch.setattr(llm_cache, "time", later)
+
+    assert cache.get("key") is None
+
+
+def test_clear_all(cache):
+    cache.set("key", "plain")
+    cache.clear_all()
+
+    assert cache.get("key") is None
@@ -0,0 +1,74 @@
+"""
+Tests for the near-duplicate prompt cache.
+"""
+
+import pytest
+from pydantic import BaseModel
+
+from code2test.storage.semantic_cache import SemanticCache, prompt_shingles
+
+
+class Answer(BaseModel):
+    text: str
+
+
+PROMPT = (
+    "Write pytest unit tests for the getter get_user_name of class UserProfile. "
+    "It returns the stored user name as a string and never raises. "
+    "Cover the default value, a custom value set in the constructor and "
+    "a value changed through the setter before the getter is called again. "
+    "Use plain assert statements, keep each test focused on one behaviour and "
+    "give every test a descriptive name that states the expected outcome."
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SemanticCache(str(tmp_path / "cache.db"))
+
+
+def test_short_prompts_have_one_shingle():
+    assert prompt_shingles("Test add") == frozenset([("test", "add")])
+
+
+def test_near_duplicate_prompt_hits(cache):
+    cache.set("ns", PROMPT, Answer(text="cached"))
+    # One renamed word in a long prompt keeps the similarity above 0.90 (~0.92)
+    near = PROMPT.replace("a custom value", "a custom string")
+
+    assert cache.get("ns", near, Answer) == Answer(text="cached")
+
+
+def test_dissimilar_prompt_misses(cache):
+    cache.set("ns", PROMPT, Answer(text="cached"))
+
+    assert cache.get("ns", "Write tests for parse_config in settings.py", Answer) is None
+
+
+def test_threshold_is_respected(tmp_path):
+    strict = SemanticCache(str(tmp_path / "cache.db"), threshold=1.0)
+    strict.set("ns", PROMPT, Answer(text="cached"))
+    near = PROMPT.replace("a custom value", "a custom string")
+
+    assert strict.get("ns", PROMPT, Answer) == Answer(text="cached")
+    assert strict.get("ns", near, Answer) is None
+
+
+def test_namespaces_are_isolated(cache):
+    cache.set("model-a", PROMPT, Answer(text="a"))
+
+    assert cache.get("model-b", PROMPT, Answer) is None
+    assert cache.get("model-a", PROMPT, Answer) == Answer(text="a")
+
+
+def test_entries_persist_across_instances(tmp_path):
+    SemanticCache(str(tmp_path / "cache.db")).set("ns", PROMPT, Answer(text="cached"))
+
+    assert SemanticCache(str(tmp_path / "cache.db")).get("ns", PROMPT, Answer) == Answer(text="cached")
+
+
+def test_clear_all(cache):
+    cache.set("ns", PROMPT, Answer(text="cached"))
+    cache.clear_all()
+
+    assert cache.get("ns", PROMPT, Answer) is None
@@ -0,0 +1,72 @@
+"""
+Tests for the verify command.
+"""
+
+import pytest
+from click.testing import CliRunner
+
+from code2test.adapters.python.pytest_adapter import PytestAdapter
+from code2test.cli.commands.verify import verify_command
+
+
+PASSED = {
+    "success": True,
+    "exit_code": 0,
+    "tests": [],
+    "summary": {"passed": 2, "failed": 0, "skipped": 0, "total": 2},
+    "stdout": "",
+    "stderr": "",
+}
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Record which runner verify used and with what arguments."""
+    seen = []
+
+    def run_tests(self, test_path, timeout=60, jobs=1):
+        seen.append(("subprocess", timeout, jobs))
+        return PASSED
+
+    def run_tests_in_process(self, test_path, output_tail=None, jobs=1):
+        seen.append(("in-process", None, jobs))
+        return PASSED
+
+    monkeypatch.setattr(PytestAdapter, "run_tests", run_tests)
+    monkeypatch.setattr(PytestAdapter, "run_tests_in_process", run_tests_in_process)
+    return seen
+
+
+def test_runs_pytest_in_a_subprocess_with_a_timeout(calls, tmp_path):
+    result = CliRunner().invoke(verify_command, [str(tmp_path), "--timeout", "5"])
+
+    assert result.exit_code == 0, result.output
+    assert calls == [("subprocess", 5, 1)]
+    assert "All 2 tests passed" in result.output
+
+
+def test_in_process_is_opt_in(calls, tmp_path):
+    result = CliRunner().invoke(verify_command, [str(tmp_path), "--in-process"])
+
+    assert result.exit_code == 0, result.output
+    assert calls == [("in-process", None, 1)]
+
+
+def test_reports_timeouts(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        PytestAdapter, "run_tests",
+        lambda self, test_path, timeout=60, jobs=1: self._error_result(f"Timeout after {timeout} seconds"),
+    )
+
+    result = CliRunner().invoke(verify_command, [str(tmp_path), "--timeout", "3"])
+
+    assert "Timeout after 3 seconds" in result.output
+
+
+def test_jobs_without_xdist_names_the_extra(calls, monkeypatch, tmp_path):
+    monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+
+    result = CliRunner().invoke(verify_command, [str(tmp_path), "-j", "4"])
+
+    assert "code2test[parallel]" in result.output
+    assert calls == [("subprocess", 60, 1)]